@@ -0,0 +1,258 @@
+import argparse
+import json
+import time
+from typing import Dict, List, Optional
+
+from espn_player_getter.diff import diff_players
+from espn_player_getter.models.player import Player
+from espn_player_getter.scraper.espn_scraper import ESPNScraper
+from espn_player_getter.scraper.settings import EXTRACTION_MODES, NAVIGATION_MODES
+
+# Slowdown over the baseline replay at which a replay fails
+DEFAULT_MAX_SLOWDOWN = 1.2
+
+
+def session_path(har_path: str) -> str:
+    """Path of the session file stored next to a recorded HAR file."""
+    return f"{har_path}.session.json"
+
+
+def timed_scrape(limit: int, **options) -> Dict[str, object]:
+    """Scrape once with ESPNScraper, timing the whole run.
+
+    Args:
+        limit: Player limit per category
+        **options: ESPNScraper keyword arguments
+
+    Returns:
+        Wall time in seconds and the scraped players
+    """
+    start = time.perf_counter()
+    with ESPNScraper(headless=True, **options) as scraper:
+        players = list(scraper.iter_players(player_limit=limit))
+    return {"seconds": time.perf_counter() - start, "players": players}
+
+
+def record(
+    har_path: str,
+    limit: int,
+    options: dict,
+    projections_url: Optional[str] = None,
+    player_url: Optional[str] = None,
+) -> dict:
+    """Scrape over the network, recording the traffic and the session.
+
+    Args:
+        har_path: HAR file to record into
+        limit: Player limit per category
+        options: Scraper options replayed later (navigation, extraction)
+        projections_url: Projections page, the real ESPN page by default
+        player_url: Player page prefix, the real ESPN prefix by default
+
+    Returns:
+        Session: the URLs, options and limit to replay with, plus the
+        recorded run's wall time and players
+    """
+    urls = {}
+    if projections_url:
+        urls["projections_url"] = projections_url
+    if player_url:
+        urls["player_url"] = player_url
+    run = timed_scrape(limit, record_har_path=har_path, **urls, **options)
+    session = {
+        "limit": limit,
+        "options": options,
+        "urls": urls,
+        "recorded_seconds": run["seconds"],
+        "players": [player.to_dict() for player in run["players"]],
+    }
+    with open(session_path(har_path), "w") as f:
+        json.dump(session, f, indent=2)
+    return session
+
+
+def load_session(har_path: str) -> dict:
+    """Read the session recorded next to a HAR file."""
+    with open(session_path(har_path)) as f:
+        return json.load(f)
+
+
+def replay(har_path: str, latency_ms: float = 0) -> dict:
+    """Scrape a recorded session again from its HAR file, without network access.
+
+    Args:
+        har_path: HAR file recorded with record()
+        latency_ms: Delay added to every replayed response
+
+    Returns:
+        Replay result: wall time, the recorded run's wall time, player
+        count and the differences from the recorded players
+    """
+    session = load_session(har_path)
+    run = timed_scrape(
+        session["limit"],
+        replay_har_path=har_path,
+        replay_latency_ms=latency_ms,
+        **session["urls"],
+        **session["options"],
+    )
+    return compare(session, run["players"], run["seconds"], latency_ms)
+
+
+def compare(session: dict, players: List[Player], seconds: float, latency_ms: float = 0) -> dict:
+    """Compare a replay with its recorded session.
+
+    Every field is compared, rank included: a replay sees exactly the
+    responses of the recording, so any difference comes from the scraper.
+
+    Args:
+        session: Session returned by record() or load_session()
+        players: Players scraped by the replay
+        seconds: Wall time of the replay
+        latency_ms: Latency the replay added to every response
+
+    Returns:
+        Replay result dict
+    """
+    recorded = [Player.from_dict(data) for data in session["players"]]
+    diff = diff_players(recorded, players, ignore=())
+    order_matches = [(p.id, p.player_type) for p in recorded] == [
+        (p.id, p.player_type) for p in players
+    ]
+    return {
+        "seconds": seconds,
+        "recorded_seconds": session["recorded_seconds"],
+        "latency_ms": latency_ms,
+        "players": len(players),
+        "identical": order_matches and not (diff.added or diff.removed or diff.changed),
+        "diff": diff.summary(),
+    }
+
+
+def check_baseline(result: dict, baseline: dict, max_slowdown: float) -> List[str]:
+    """List the ways a replay regressed from an earlier replay of the same session.
+
+    Args:
+        result: Replay result to check
+        baseline: Result of an earlier replay, e.g. by the previous scraper version
+        max_slowdown: Largest accepted ratio of replay time to baseline time
+
+    Returns:
+        Problems found, empty if the replay is as fast and as correct
+    """
+    problems = []
+    if baseline["latency_ms"] != result["latency_ms"]:
+        problems.append(
+            f"baseline replayed with {baseline['latency_ms']}ms latency, "
+            f"this run with {result['latency_ms']}ms"
+        )
+    slowdown = result["seconds"] / baseline["seconds"] if baseline["seconds"] else 0.0
+    if slowdown > max_slowdown:
+        problems.append(
+            f"replay took {result['seconds']:.2f}s, {slowdown:.2f}x the baseline "
+            f"{baseline['seconds']:.2f}s (limit {max_slowdown:.2f}x)"
+        )
+    if baseline["players"] != result["players"]:
+        problems.append(f"{result['players']} players, baseline had {baseline['players']}")
+    return problems
+
+
+def format_result(result: dict) -> str:
+    """Format a replay result as text."""
+    status = "identical" if result["identical"] else "DIFFERENT"
+    lines = [
+        f"Replayed {result['players']} players in {result['seconds']:.2f}s "
+        f"({result['latency_ms']:.0f}ms latency per response); recorded run took "
+        f"{result['recorded_seconds']:.2f}s; output {status}",
+    ]
+    if not result["identical"]:
+        lines.append(result["diff"])
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse benchmark command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Record a scrape's network traffic once, then replay it offline "
+        "to compare scraper versions on identical responses"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="Scrape over the network and record it")
+    record_parser.add_argument("har", help="HAR file to write (.har or .zip)")
+    record_parser.add_argument(
+        "--limit", type=int, default=50, help="Player limit per category (default: 50)"
+    )
+    record_parser.add_argument(
+        "--navigation", choices=NAVIGATION_MODES, default="modal", help="(default: modal)"
+    )
+    record_parser.add_argument(
+        "--extraction", choices=EXTRACTION_MODES, default="dom", help="(default: dom)"
+    )
+    record_parser.add_argument(
+        "--standin",
+        action="store_true",
+        help="Record the offline stand-in site instead of ESPN",
+    )
+
+    replay_parser = commands.add_parser("replay", help="Scrape a recording again without network")
+    replay_parser.add_argument("har", help="HAR file written by record")
+    replay_parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0,
+        help="Delay added to every replayed response (default: 0)",
+    )
+    replay_parser.add_argument(
+        "--baseline",
+        metavar="PATH",
+        help="Replay result JSON of an earlier scraper version to compare against",
+    )
+    replay_parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=DEFAULT_MAX_SLOWDOWN,
+        help="Fail if the replay is this many times slower than --baseline "
+        f"(default: {DEFAULT_MAX_SLOWDOWN})",
+    )
+    replay_parser.add_argument("--json", metavar="PATH", help="Also write the result as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Record or replay a session; a replay fails on different output or a slowdown."""
+    args = parse_args(argv)
+    if args.command == "record":
+        options = {"navigation": args.navigation, "extraction": args.extraction}
+        if args.standin:
+            from benchmarks.standin import StandInServer
+
+            with StandInServer() as server:
+                session = record(
+                    args.har, args.limit, options, server.projections_url, server.player_url
+                )
+        else:
+            session = record(args.har, args.limit, options)
+        print(
+            f"Recorded {len(session['players'])} players in "
+            f"{session['recorded_seconds']:.2f}s to {args.har}"
+        )
+        return 0
+
+    result = replay(args.har, args.latency_ms)
+    print(format_result(result))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+    ok = result["identical"]
+    if args.baseline:
+        with open(args.baseline) as f:
+            problems = check_baseline(result, json.load(f), args.max_slowdown)
+        for problem in problems:
+            print(problem)
+        ok = ok and not problems
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,272 @@
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.standin import StandInConfig, StandInServer
+from espn_player_getter.profiling import PhaseTimer, percentile
+from espn_player_getter.scraper.async_scraper import AsyncESPNScraper
+from espn_player_getter.scraper.espn_scraper import ESPNScraper
+from espn_player_getter.scraper.http_scraper import HTTPScraper
+from espn_player_getter.scraper.resource_policy import ResourcePolicy
+
+# Scraper setups compared by default; each maps to ESPNScraper,
+# AsyncESPNScraper or (with backend "http") HTTPScraper keyword arguments
+CONFIGURATIONS = {
+    "modal": {"navigation": "modal"},
+    "direct": {"navigation": "direct"},
+    "direct-blocked": {"navigation": "direct", "block_resources": True},
+    "network": {"extraction": "network"},
+    "table": {"extraction": "table"},
+    "async-direct": {"navigation": "direct", "concurrency": 4},
+    "http": {"backend": "http", "concurrency": 4},
+}
+
+
+def run_sync(server: StandInServer, options: dict, limit: int) -> Dict[str, object]:
+    """Time one ESPNScraper run against the stand-in.
+
+    Returns:
+        Phase timings in seconds, player arrival gaps, the scraper's own
+        phase stats and the scraped players
+    """
+    options = dict(options)
+    policy = ResourcePolicy() if options.pop("block_resources", False) else None
+    timer = PhaseTimer()
+    scraper = ESPNScraper(
+        profiler=timer,
+        headless=True,
+        resource_policy=policy,
+        projections_url=server.projections_url,
+        player_url=server.player_url,
+        **options,
+    )
+
+    start = time.perf_counter()
+    scraper.__enter__()
+    launched = time.perf_counter()
+    players, arrivals = [], []
+    try:
+        for player in scraper.iter_players(player_limit=limit):
+            players.append(player)
+            arrivals.append(time.perf_counter())
+    finally:
+        scraped = time.perf_counter()
+        scraper.__exit__(None, None, None)
+    closed = time.perf_counter()
+
+    return {
+        "players": players,
+        "phases": {
+            "launch": launched - start,
+            "first_player": (arrivals[0] if arrivals else scraped) - launched,
+            "scrape": scraped - launched,
+            "close": closed - scraped,
+        },
+        "gaps": [b - a for a, b in zip(arrivals, arrivals[1:])],
+        "scraper_phases": timer.stats(),
+        "total": closed - start,
+    }
+
+
+def run_http(server: StandInServer, options: dict, limit: int) -> Dict[str, object]:
+    """Time one HTTPScraper run against the stand-in's API."""
+    options = {key: value for key, value in options.items() if key != "backend"}
+    timer = PhaseTimer()
+    scraper = HTTPScraper(api_url=server.api_url, profiler=timer, **options)
+
+    start = time.perf_counter()
+    scraper.__enter__()
+    launched = time.perf_counter()
+    players, arrivals = [], []
+    try:
+        for player in scraper.iter_players(player_limit=limit):
+            players.append(player)
+            arrivals.append(time.perf_counter())
+    finally:
+        scraped = time.perf_counter()
+        scraper.__exit__(None, None, None)
+    closed = time.perf_counter()
+
+    return {
+        "players": players,
+        "phases": {
+            "launch": launched - start,
+            "first_player": (arrivals[0] if arrivals else scraped) - launched,
+            "scrape": scraped - launched,
+            "close": closed - scraped,
+        },
+        "gaps": [b - a for a, b in zip(arrivals, arrivals[1:])],
+        "scraper_phases": timer.stats(),
+        "total": closed - start,
+    }
+
+
+def run_async(server: StandInServer, options: dict, limit: int) -> Dict[str, object]:
+    """Time one AsyncESPNScraper run against the stand-in."""
+    options = dict(options)
+    policy = ResourcePolicy() if options.pop("block_resources", False) else None
+    timer = PhaseTimer()
+
+    async def scrape():
+        scraper = AsyncESPNScraper(
+            profiler=timer,
+            headless=True,
+            resource_policy=policy,
+            projections_url=server.projections_url,
+            player_url=server.player_url,
+            **options,
+        )
+        start = time.perf_counter()
+        await scraper.__aenter__()
+        launched = time.perf_counter()
+        try:
+            players = await scraper.scrape_players(player_limit=limit)
+        finally:
+            scraped = time.perf_counter()
+            await scraper.__aexit__(None, None, None)
+        closed = time.perf_counter()
+        return {
+            "players": players,
+            "phases": {
+                "launch": launched - start,
+                "scrape": scraped - launched,
+                "close": closed - scraped,
+            },
+            "gaps": [],
+            "scraper_phases": timer.stats(),
+            "total": closed - start,
+        }
+
+    return asyncio.run(scrape())
+
+
+def benchmark(
+    config: StandInConfig,
+    names: List[str],
+    limit: int,
+    repeat: int = 1,
+) -> List[dict]:
+    """Run each named configuration against a fresh stand-in server.
+
+    Args:
+        config: Shape and latency of the stand-in site
+        names: Keys of CONFIGURATIONS to run
+        limit: Player limit per category
+        repeat: Runs per configuration; the fastest run is reported
+
+    Returns:
+        One result dict per configuration
+    """
+    results = []
+    for name in names:
+        options = CONFIGURATIONS[name]
+        if options.get("backend") == "http":
+            runner = run_http
+        elif "concurrency" in options:
+            runner = run_async
+        else:
+            runner = run_sync
+        runs = []
+        for _ in range(repeat):
+            with StandInServer(config) as server:
+                run = runner(server, options, limit)
+                expected = [
+                    player.id
+                    for category in ("batter", "pitcher")
+                    for player in server.site.expected_players(category, limit)
+                ]
+            run["correct"] = [player.id for player in run.pop("players")] == expected
+            run["count"] = len(expected) if run["correct"] else None
+            runs.append(run)
+        best = min(runs, key=lambda run: run["total"])
+        scrape_seconds = best["phases"]["scrape"]
+        results.append({
+            "configuration": name,
+            "players": best["count"],
+            "correct": all(run["correct"] for run in runs),
+            "players_per_second": (best["count"] or 0) / scrape_seconds if scrape_seconds else 0.0,
+            "total_seconds": best["total"],
+            "phases": best["phases"],
+            "player_gap_p50": percentile(best["gaps"], 50),
+            "player_gap_p95": percentile(best["gaps"], 95),
+            "scraper_phases": best["scraper_phases"],
+        })
+    return results
+
+
+def format_results(results: List[dict]) -> str:
+    """Format benchmark results as a text table."""
+    lines = [
+        f"{'configuration':<16}{'players':>8}{'ok':>4}{'players/s':>11}{'total s':>9}"
+        f"{'launch s':>10}{'first s':>9}{'scrape s':>10}{'gap p50':>9}{'gap p95':>9}"
+    ]
+    for result in results:
+        phases = result["phases"]
+        lines.append(
+            f"{result['configuration']:<16}{result['players'] or 0:>8}"
+            f"{'yes' if result['correct'] else 'NO':>4}"
+            f"{result['players_per_second']:>11.2f}{result['total_seconds']:>9.2f}"
+            f"{phases['launch']:>10.2f}{phases.get('first_player', 0):>9.2f}"
+            f"{phases['scrape']:>10.2f}{result['player_gap_p50']:>9.3f}"
+            f"{result['player_gap_p95']:>9.3f}"
+        )
+    for result in results:
+        lines.append("")
+        lines.append(f"{result['configuration']} phases (p50 / p95 ms):")
+        for name, phase in result["scraper_phases"].items():
+            lines.append(
+                f"  {name:<20}{phase['count']:>6}x {phase['p50'] * 1000:>9.1f} {phase['p95'] * 1000:>9.1f}"
+            )
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse benchmark command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the scraper against the offline ESPN stand-in"
+    )
+    parser.add_argument(
+        "--config",
+        action="append",
+        choices=sorted(CONFIGURATIONS),
+        help="Configuration to run; may be repeated (default: all)",
+    )
+    parser.add_argument("--pages", type=int, default=2, help="Table pages per category (default: 2)")
+    parser.add_argument("--page-size", type=int, default=10, help="Players per page (default: 10)")
+    parser.add_argument("--limit", type=int, default=500, help="Player limit per category (default: 500)")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0, help="Delay added to every response (default: 0)"
+    )
+    parser.add_argument(
+        "--player-latency-ms",
+        type=float,
+        default=0,
+        help="Extra delay for player pages (default: 0)",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per configuration (default: 1)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite and print its results."""
+    args = parse_args(argv)
+    config = StandInConfig(
+        batter_pages=args.pages,
+        pitcher_pages=args.pages,
+        page_size=args.page_size,
+        latency_ms=args.latency_ms,
+        player_latency_ms=args.player_latency_ms,
+    )
+    results = benchmark(config, args.config or list(CONFIGURATIONS), args.limit, args.repeat)
+    print(format_results(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0 if all(result["correct"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
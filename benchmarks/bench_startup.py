@@ -0,0 +1,193 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from espn_player_getter.data_handler import save_players
+from espn_player_getter.models.player import Player
+
+# CLI invocations that never scrape, with {players} and {tmp} placeholders
+COMMANDS = {
+    "help": ["--help"],
+    "inspect": ["inspect", "{players}"],
+    "convert": ["convert", "{players}", "{tmp}/players.jsonl"],
+    "diff": ["diff", "{players}", "{players}"],
+}
+
+# Modules a non-scrape command must not import
+HEAVY_MODULES = ("playwright", "asyncio", "http.client", "pyarrow")
+
+# Import time budget for the CLI's own imports, in milliseconds
+DEFAULT_BUDGET_MS = 150.0
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Read the modules and cumulative import times from ``-X importtime`` output.
+
+    Args:
+        stderr: Standard error of a ``python -X importtime`` run
+
+    Returns:
+        Cumulative import time in microseconds per module, children
+        included. Names keep their indentation: modules imported by another
+        module start with spaces.
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            # Header line
+            continue
+        # One space separates the columns; further spaces show nesting
+        modules[name[1:].rstrip()] = int(cumulative)
+    return modules
+
+
+def top_level_time(modules: Dict[str, int]) -> int:
+    """Total import time of the modules imported at the top level, in microseconds."""
+    return sum(us for name, us in modules.items() if not name.startswith(" "))
+
+
+def heavy_imports(modules: Dict[str, int]) -> List[str]:
+    """Names of heavy modules (or their submodules) among the imported modules."""
+    names = {name.strip() for name in modules}
+    return sorted(
+        name for name in names
+        if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+    )
+
+
+def run_command(argv: List[str]) -> Dict[str, object]:
+    """Run the CLI once under ``-X importtime``.
+
+    Args:
+        argv: CLI arguments
+
+    Returns:
+        Wall time and top-level import time in milliseconds, the exit code
+        and the heavy modules the command imported
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "espn_player_getter", *argv],
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    modules = parse_importtime(completed.stderr)
+    return {
+        "exit_code": completed.returncode,
+        "wall_ms": wall * 1000,
+        "import_ms": top_level_time(modules) / 1000,
+        "cli_import_ms": modules.get("espn_player_getter.cli", 0) / 1000,
+        "heavy_imports": heavy_imports(modules),
+    }
+
+
+def sample_players(path: str, count: int = 50) -> None:
+    """Write a small player file for the commands to read."""
+    save_players(
+        (
+            Player(
+                id=str(i),
+                name=f"Player {i}",
+                team="NYY",
+                position="OF",
+                eligible_positions=["OF"],
+                player_type="batter",
+                stats={"HR": float(i)},
+                rank=i + 1,
+            )
+            for i in range(count)
+        ),
+        path,
+    )
+
+
+def benchmark(names: List[str], repeat: int = 3) -> List[dict]:
+    """Time each named command, keeping its fastest run.
+
+    Args:
+        names: Keys of COMMANDS to run
+        repeat: Runs per command
+
+    Returns:
+        One result dict per command
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        players = os.path.join(tmp, "players.json")
+        sample_players(players)
+        for name in names:
+            argv = [arg.format(players=players, tmp=tmp) for arg in COMMANDS[name]]
+            runs = [run_command(argv) for _ in range(repeat)]
+            best = min(runs, key=lambda run: run["wall_ms"])
+            results.append({"command": name, **best})
+    return results
+
+
+def format_results(results: List[dict]) -> str:
+    """Format startup results as a text table."""
+    lines = [f"{'command':<10}{'exit':>5}{'wall ms':>10}{'import ms':>11}{'cli ms':>9}  heavy imports"]
+    for result in results:
+        lines.append(
+            f"{result['command']:<10}{result['exit_code']:>5}{result['wall_ms']:>10.1f}"
+            f"{result['import_ms']:>11.1f}{result['cli_import_ms']:>9.1f}  "
+            f"{', '.join(result['heavy_imports']) or '-'}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse benchmark command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measure CLI startup for commands that do not scrape"
+    )
+    parser.add_argument(
+        "--command",
+        action="append",
+        choices=sorted(COMMANDS),
+        help="Command to run; may be repeated (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command (default: 3)")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Fail if importing espn_player_getter.cli takes longer than this "
+        f"(default: {DEFAULT_BUDGET_MS:.0f})",
+    )
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the startup benchmark; fail on heavy imports or an exceeded budget."""
+    args = parse_args(argv)
+    results = benchmark(args.command or list(COMMANDS), args.repeat)
+    print(format_results(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    ok = True
+    for result in results:
+        if result["exit_code"] != 0:
+            print(f"{result['command']} exited with {result['exit_code']}")
+            ok = False
+        if result["heavy_imports"]:
+            print(f"{result['command']} imported {', '.join(result['heavy_imports'])}")
+            ok = False
+        if result["cli_import_ms"] > args.budget_ms:
+            print(f"{result['command']} spent {result['cli_import_ms']:.1f}ms importing the CLI")
+            ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,406 @@
+import gzip
+import html
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from espn_player_getter.models.player import Player
+from espn_player_getter.scraper.espn_api import (
+    CATEGORY_SLOT_IDS,
+    FILTER_HEADER,
+    POSITIONS,
+    SLOT_POSITIONS,
+    STATS,
+    current_season,
+    parse_player_entry,
+    player_api_url,
+)
+
+PROJECTIONS_PATH = "/baseball/players/projections"
+PLAYER_PATH = "/mlb/player/_/id/{player_id}"
+# The current season's player list API, as the real projections page calls it
+API_PATH = urlparse(player_api_url()).path
+API_QUERY = urlparse(player_api_url()).query
+
+# Stat IDs projected for each category (see espn_api.STATS)
+BATTER_STAT_IDS = (0, 2, 5, 20, 21, 23)
+PITCHER_STAT_IDS = (34, 41, 47, 48, 53, 57)
+
+# Projections table columns per category: (label, stat ID)
+TABLE_COLUMNS = {
+    "batter": (("AB", 0), ("R", 20), ("HR", 5), ("RBI", 21), ("SB", 23), ("AVG", 2)),
+    "pitcher": (("IP", 34), ("K", 48), ("W", 53), ("SV", 57), ("ERA", 47), ("WHIP", 41)),
+}
+BATTER_POSITION_IDS = (2, 3, 4, 5, 6, 7, 8, 9, 10)
+SLOT_IDS = {position: slot for slot, position in SLOT_POSITIONS.items()}
+
+# The projections app: renders the table from the player list API, pages
+# with a next button, switches category tabs and opens a player card modal
+# with a "Complete Stats" link, like the real page does. Each row shows the
+# player's team, positions and a projections table; the stand-in API sends
+# those display cells alongside the players so the page needs no lookups
+PROJECTIONS_HTML = """<!DOCTYPE html>
+<html>
+<head><title>Fantasy Baseball Player Projections</title></head>
+<body>
+<div class="tabs"><label class="tab">Batters</label> <label class="tab">Pitchers</label></div>
+<div class="players-table Table"></div>
+<div class="Pagination">
+  <button class="Pagination__Button--prev">Previous</button>
+  <button class="Pagination__Button--next">Next</button>
+</div>
+<div role="dialog" class="player-card" style="display: none"></div>
+<script>
+const API = "__API__";
+const PAGES = __PAGES__;
+const table = document.querySelector(".players-table");
+const next = document.querySelector(".Pagination__Button--next");
+const prev = document.querySelector(".Pagination__Button--prev");
+const dialog = document.querySelector("div[role=dialog]");
+let category = "batter";
+let page = 1;
+
+async function load() {
+  const response = await fetch(`${API}&category=${category}&page=${page}`);
+  const payload = await response.json();
+  table.innerHTML = payload.players.map((entry, i) => {
+    const row = payload.rows[i];
+    return `
+    <div class="player-info-section">
+      <img src="/i/headshots/mlb/players/full/${entry.id}.png" width="1" height="1">
+      <div class="player-name"><a href="#">${entry.player.fullName}</a></div>
+      <span class="playerinfo__playerteam">${row.team}</span>
+      <span class="playerinfo__playerpos">${row.positions}</span>
+      <table>
+        <thead><tr><th></th>${row.columns.map(c => `<th>${c}</th>`).join("")}</tr></thead>
+        <tbody><tr><td>Projections</td>${row.values.map(v => `<td>${v}</td>`).join("")}</tr></tbody>
+      </table>
+    </div>`;
+  }).join("");
+  table.querySelectorAll(".player-name a").forEach((link, i) => {
+    const entry = payload.players[i];
+    link.addEventListener("click", event => {
+      event.preventDefault();
+      setTimeout(() => {
+        dialog.innerHTML = `<h2>${entry.player.fullName}</h2>
+          <a href="/mlb/player/_/id/${entry.id}" target="_blank">Complete Stats</a>`;
+        dialog.style.display = "block";
+      }, __MODAL_DELAY__);
+    });
+  });
+  next.disabled = page >= PAGES[category];
+  prev.disabled = page <= 1;
+}
+
+next.addEventListener("click", () => { page += 1; load(); });
+prev.addEventListener("click", () => { page -= 1; load(); });
+document.querySelectorAll("label.tab").forEach(label => {
+  label.addEventListener("click", () => {
+    category = label.innerText.trim() === "Pitchers" ? "pitcher" : "batter";
+    page = 1;
+    load();
+  });
+});
+document.addEventListener("keydown", event => {
+  if (event.key === "Escape") dialog.style.display = "none";
+});
+load();
+</script>
+</body>
+</html>
+"""
+
+PLAYER_HTML = """<!DOCTYPE html>
+<html>
+<head><title>{name} Stats</title></head>
+<body>
+<div class="PlayerHeader">
+  <h1>{name}</h1>
+  <ul>
+    <li><span>Team</span><span>{team}</span></li>
+    <li><span>Position</span><span>{positions}</span></li>
+  </ul>
+</div>
+</body>
+</html>
+"""
+
+
+@dataclass
+class StandInConfig:
+    """Shape and speed of the stand-in site.
+
+    Attributes:
+        batter_pages: Table pages in the batters category
+        pitcher_pages: Table pages in the pitchers category
+        page_size: Players per table page
+        latency_ms: Delay added to every response
+        player_latency_ms: Extra delay for player pages, the slowest pages
+            on the real site
+        modal_delay_ms: Delay before the player card modal opens
+    """
+    batter_pages: int = 2
+    pitcher_pages: int = 2
+    page_size: int = 10
+    latency_ms: float = 0
+    player_latency_ms: float = 0
+    modal_delay_ms: float = 0
+
+    def pages(self, category: str) -> int:
+        """Number of table pages in a category."""
+        return self.batter_pages if category == "batter" else self.pitcher_pages
+
+
+def make_entries(category: str, count: int) -> List[dict]:
+    """Generate deterministic player list entries in the API's format.
+
+    Args:
+        category: "batter" or "pitcher"
+        count: Number of players
+
+    Returns:
+        Player list entries like those of the kona_player_info view
+    """
+    entries = []
+    base_id = 1_000_000 if category == "batter" else 2_000_000
+    for n in range(1, count + 1):
+        player_id = base_id + n
+        if category == "batter":
+            position_id = BATTER_POSITION_IDS[n % len(BATTER_POSITION_IDS)]
+            positions = [POSITIONS[position_id], "OF" if n % 3 == 0 else "DH"]
+            stat_ids = BATTER_STAT_IDS
+        else:
+            position_id = 1 if n % 2 else 11
+            positions = [POSITIONS[position_id]]
+            stat_ids = PITCHER_STAT_IDS
+        stats = {str(stat_id): float((n * 7 + stat_id) % 50) for stat_id in stat_ids}
+        entries.append({
+            "id": player_id,
+            "onTeamId": 0,
+            "player": {
+                "id": player_id,
+                "fullName": f"{category.title()} {n}",
+                "proTeamId": 1 + n % 30,
+                "defaultPositionId": position_id,
+                "eligibleSlots": [SLOT_IDS[p] for p in positions if p in SLOT_IDS],
+                "stats": [{
+                    "statSourceId": 1,
+                    "statSplitTypeId": 0,
+                    "seasonId": current_season(),
+                    "stats": stats,
+                }],
+            },
+        })
+    return entries
+
+
+class StandInSite:
+    """Players served by the stand-in, in table order per category."""
+
+    def __init__(self, config: StandInConfig):
+        self.config = config
+        self.entries: Dict[str, List[dict]] = {
+            category: make_entries(category, config.pages(category) * config.page_size)
+            for category in ("batter", "pitcher")
+        }
+        self.players: Dict[str, Player] = {
+            str(entry["id"]): parse_player_entry(entry)
+            for entries in self.entries.values()
+            for entry in entries
+        }
+
+    def expected_players(self, category: str, limit: Optional[int] = None) -> List[Player]:
+        """Players a scrape of one category should return, in table order."""
+        entries = self.entries[category][:limit]
+        return [self.players[str(entry["id"])] for entry in entries]
+
+    def table_page(self, category: str, page: int) -> dict:
+        """API payload for one table page, with the display cells of each row."""
+        size = self.config.page_size
+        entries = self.entries[category][(page - 1) * size: page * size]
+        return {
+            "players": entries,
+            "rows": [self.table_row(category, entry) for entry in entries],
+        }
+
+    def table_row(self, category: str, entry: dict) -> dict:
+        """Team, positions and projected stat cells shown in a player's row."""
+        player = self.players[str(entry["id"])]
+        values = []
+        for label, stat_id in TABLE_COLUMNS[category]:
+            value = player.stats[STATS[stat_id]]
+            if label == "IP":
+                # Innings are shown as whole innings plus thirds, e.g. 180.1
+                values.append(f"{int(value) // 3}.{int(value) % 3}")
+            else:
+                values.append(f"{value:g}")
+        return {
+            "team": player.team,
+            "positions": ", ".join(player.eligible_positions),
+            "columns": [label for label, _ in TABLE_COLUMNS[category]],
+            "values": values,
+        }
+
+    def filtered_page(self, fantasy_filter: dict) -> dict:
+        """API payload for an X-Fantasy-Filter request, as sent by HTTPScraper.
+
+        The category is picked from the filtered roster slots, and the page
+        from the filter's offset and limit.
+        """
+        players = fantasy_filter.get("players", {})
+        slots = set(players.get("filterSlotIds", {}).get("value", []))
+        category = "pitcher" if slots & set(CATEGORY_SLOT_IDS["pitcher"]) else "batter"
+        offset = players.get("offset", 0)
+        limit = players.get("limit", 50)
+        return {"players": self.entries[category][offset:offset + limit]}
+
+    def projections_html(self) -> str:
+        """The projections page, wired to this site's API and page counts."""
+        pages = {category: self.config.pages(category) for category in self.entries}
+        return (
+            PROJECTIONS_HTML
+            .replace("__API__", f"{API_PATH}?{API_QUERY}")
+            .replace("__PAGES__", json.dumps(pages))
+            .replace("__MODAL_DELAY__", str(self.config.modal_delay_ms))
+        )
+
+    def player_html(self, player_id: str) -> Optional[str]:
+        """A player's page with its PlayerHeader, or None for unknown IDs."""
+        player = self.players.get(player_id)
+        if player is None:
+            return None
+        return PLAYER_HTML.format(
+            name=html.escape(player.name),
+            team=html.escape(player.team),
+            positions=html.escape(", ".join(player.eligible_positions)),
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves the stand-in site; ``server.site`` holds its players."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        site: StandInSite = self.server.site
+        config = site.config
+        url = urlparse(self.path)
+        delay = config.latency_ms
+
+        if url.path == PROJECTIONS_PATH:
+            self._send(200, "text/html", site.projections_html(), delay)
+        elif url.path == API_PATH and self.headers.get(FILTER_HEADER):
+            fantasy_filter = json.loads(self.headers[FILTER_HEADER])
+            self._send(200, "application/json", json.dumps(site.filtered_page(fantasy_filter)), delay)
+        elif url.path == API_PATH:
+            query = parse_qs(url.query)
+            category = query.get("category", ["batter"])[0]
+            page = int(query.get("page", ["1"])[0])
+            if category not in site.entries:
+                self._send(404, "text/plain", "Unknown category", delay)
+            else:
+                self._send(200, "application/json", json.dumps(site.table_page(category, page)), delay)
+        elif url.path.startswith("/mlb/player/_/id/"):
+            body = site.player_html(url.path.rstrip("/").split("/")[-1])
+            delay += config.player_latency_ms
+            if body is None:
+                self._send(404, "text/plain", "Unknown player", delay)
+            else:
+                self._send(200, "text/html", body, delay)
+        elif url.path.startswith("/i/headshots/"):
+            self._send(200, "image/png", "", delay)
+        else:
+            self._send(404, "text/plain", "Not found", delay)
+
+    def _send(self, status: int, content_type: str, body: str, delay_ms: float) -> None:
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+        data = body.encode()
+        self.server.requests += 1
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        if data and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StandInServer:
+    """Local HTTP server imitating the ESPN pages the scraper uses.
+
+    Runs in a background thread; use it as a context manager:
+
+        with StandInServer(StandInConfig(batter_pages=3)) as server:
+            ESPNScraper(projections_url=server.projections_url,
+                        player_url=server.player_url)
+    """
+
+    def __init__(self, config: Optional[StandInConfig] = None, port: int = 0):
+        """Create the server.
+
+        Args:
+            config: Site shape and latency, defaults to StandInConfig()
+            port: Port to listen on; 0 picks a free one
+        """
+        self.site = StandInSite(config or StandInConfig())
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._server.daemon_threads = True
+        self._server.site = self.site
+        # Connections accepted and responses sent, to check keep-alive reuse
+        self._server.connections = 0
+        self._server.requests = 0
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def projections_url(self) -> str:
+        return self.base_url + PROJECTIONS_PATH
+
+    @property
+    def player_url(self) -> str:
+        return self.base_url + PLAYER_PATH
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}{API_PATH}?{API_QUERY}"
+
+    @property
+    def connections(self) -> int:
+        """Number of TCP connections accepted so far."""
+        return self._server.connections
+
+    @property
+    def requests(self) -> int:
+        """Number of responses sent so far."""
+        return self._server.requests
+
+    def start(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
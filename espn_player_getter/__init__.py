@@ -1 +1,5 @@
 # espn_player_getter package
+from espn_player_getter.models.player import Player
+from espn_player_getter.stream import PlayerStream, scrape_players, stream_players
+
+__all__ = ["Player", "PlayerStream", "scrape_players", "stream_players"]
@@ -0,0 +1,108 @@
+import json
+import os
+import time
+from typing import Callable, Dict, Optional
+
+from espn_player_getter.models.player import Player
+
+
+class PlayerCache:
+    """On-disk cache of player page data, keyed by player ID.
+
+    Entries hold the fields extracted from a player's page together with the
+    time they were fetched. Entries older than the TTL are treated as misses
+    so the page is scraped again, and once the cache holds more than
+    ``max_entries`` the oldest entries are evicted on save.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 24 * 60 * 60,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open the cache, loading any existing cache file.
+
+        Args:
+            path: Path of the JSON cache file
+            ttl_seconds: How long an entry stays fresh
+            max_entries: Maximum number of entries kept on disk
+            clock: Function returning the current time in seconds
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._entries: Dict[str, dict] = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self._entries = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"Ignoring unreadable player cache {path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, player_id: str) -> Optional[Player]:
+        """Look up a fresh cached player.
+
+        Args:
+            player_id: ESPN player ID
+
+        Returns:
+            A new Player built from the cache entry, or None if the player is
+            missing or the entry has expired
+        """
+        entry = self._entries.get(player_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        if self.clock() - entry["fetched_at"] > self.ttl_seconds:
+            self.misses += 1
+            self.stale += 1
+            return None
+        self.hits += 1
+        return Player.from_dict(entry["player"])
+
+    def put(self, player: Player) -> None:
+        """Store freshly scraped player data.
+
+        Args:
+            player: Player scraped from its page
+        """
+        data = player.to_dict()
+        # The player type and rank depend on where the player was found
+        data["player_type"] = ""
+        data["rank"] = None
+        self._entries[player.id] = {"fetched_at": self.clock(), "player": data}
+
+    def save(self) -> None:
+        """Evict the oldest entries beyond ``max_entries`` and write the cache."""
+        if len(self._entries) > self.max_entries:
+            newest = sorted(
+                self._entries.items(), key=lambda item: item[1]["fetched_at"], reverse=True
+            )
+            self._entries = dict(newest[: self.max_entries])
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self.path)
+
+    def summary(self) -> str:
+        """Describe cache hits and misses for the run so far."""
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0.0
+        return (
+            f"Player cache: {self.hits} hits, {self.misses} misses "
+            f"({self.stale} stale), {rate:.0f}% hit rate"
+        )
@@ -0,0 +1,135 @@
+import json
+import os
+from typing import Dict, List, Set
+
+from espn_player_getter.models.player import Player
+
+
+class CheckpointJournal:
+    """Append-only JSONL journal of scrape progress.
+
+    Every scraped player is written (and flushed) as soon as it is extracted,
+    together with its category and table page. Finished pages and categories
+    are recorded too, so a resumed run knows which tab and page to jump to
+    and which player IDs it can skip.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        """Open the journal.
+
+        Args:
+            path: Path of the journal file
+            resume: Load an existing journal and append to it; otherwise any
+                existing journal is discarded
+        """
+        self.path = path
+        self._players: Dict[str, List[Player]] = {}
+        self._ids: Dict[str, Set[str]] = {}
+        self._pages_done: Dict[str, int] = {}
+        self._player_pages: Dict[str, int] = {}
+        self._categories_done: Set[str] = set()
+
+        if resume and os.path.exists(path):
+            self._load()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a" if resume else "w")
+
+    def _load(self) -> None:
+        """Replay the journal file into memory."""
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the last line half written
+                    continue
+                self._apply(entry)
+        print(
+            f"Resuming from {self.path}: {sum(map(len, self._ids.values()))} players, "
+            f"finished categories: {', '.join(sorted(self._categories_done)) or 'none'}"
+        )
+
+    def _apply(self, entry: dict) -> None:
+        """Apply one journal entry to the in-memory state."""
+        category = entry.get("category", "")
+        event = entry.get("event")
+        if event == "player":
+            player = Player.from_dict(entry["player"])
+            player.player_type = player.player_type or category
+            ids = self._ids.setdefault(category, set())
+            if player.id not in ids:
+                ids.add(player.id)
+                self._players.setdefault(category, []).append(player)
+            self._player_pages[category] = max(
+                self._player_pages.get(category, 1), entry.get("page", 1)
+            )
+        elif event == "page":
+            self._pages_done[category] = max(
+                self._pages_done.get(category, 0), entry.get("page", 0)
+            )
+        elif event == "category":
+            self._categories_done.add(category)
+
+    def _append(self, entry: dict) -> None:
+        """Write one entry and flush it to disk."""
+        self._apply(entry)
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def record_player(self, category: str, page: int, player: Player) -> None:
+        """Record a scraped player.
+
+        Args:
+            category: Category tab the player was scraped from
+            page: Table page number the player appeared on
+            player: The scraped player
+        """
+        self._append(
+            {"event": "player", "category": category, "page": page, "player": player.to_dict()}
+        )
+
+    def record_page(self, category: str, page: int) -> None:
+        """Record that every row of a table page has been handled."""
+        self._append({"event": "page", "category": category, "page": page})
+
+    def record_category(self, category: str) -> None:
+        """Record that a category tab has been scraped completely."""
+        self._append({"event": "category", "category": category})
+
+    def has_player(self, category: str, player_id: str) -> bool:
+        """Check whether a player ID is already journaled for a category.
+
+        Two-way players appear under both categories, so IDs are per category.
+        """
+        return player_id in self._ids.get(category, set())
+
+    def players(self, category: str) -> List[Player]:
+        """Players journaled for a category, in the order they were scraped."""
+        return list(self._players.get(category, []))
+
+    def is_category_done(self, category: str) -> bool:
+        """Check whether a category was finished before."""
+        return category in self._categories_done
+
+    def resume_page(self, category: str) -> int:
+        """Table page a resumed run should continue from.
+
+        Returns:
+            The page after the last finished one, or the page of the last
+            journaled player if that page was interrupted part way through
+        """
+        return max(
+            self._pages_done.get(category, 0) + 1, self._player_pages.get(category, 1)
+        )
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
+
+    def remove(self) -> None:
+        """Close and delete the journal once its run has been saved."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
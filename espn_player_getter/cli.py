@@ -1,35 +1,736 @@
 import argparse
+import json
+import os
 import sys
+from collections import Counter
+from functools import partial
 
-from espn_player_getter.data_handler import save_players
-from espn_player_getter.scraper.espn_scraper import ESPNScraper
+from espn_player_getter.cache import PlayerCache
+from espn_player_getter.checkpoint import CheckpointJournal
+from espn_player_getter.data_handler import (
+    iter_players,
+    load_players,
+    merge_players,
+    save_players,
+)
+from espn_player_getter.diff import DEFAULT_IGNORED_FIELDS, diff_players
+from espn_player_getter.profiling import PhaseTimer
+from espn_player_getter.scraper.resource_policy import ResourcePolicy
+from espn_player_getter.scraper.settings import (
+    CATEGORIES,
+    DEFAULT_MAX_PAGE_USES,
+    EXTRACTION_MODES,
+    NAVIGATION_MODES,
+)
+from espn_player_getter.scraper.waits import WAIT_STEPS, WAIT_STRATEGIES, parse_wait_option
 
+# The scrapers (Playwright, asyncio, http.client) and the daemon client are
+# imported by the functions that use them, so that --help, convert, inspect,
+# merge and diff start without loading any of them. See
+# benchmarks/bench_startup.py.
 
-def parse_args():
+
+# Scraper backends selectable with --backend
+BACKENDS = ("browser", "http")
+
+# Options only the sequential browser scraper supports, rejected by the others
+# instead of being ignored
+SEQUENTIAL_ONLY_OPTIONS = (
+    "shard",
+    "resume",
+    "checkpoint",
+    "cache",
+    "recycle_after",
+    "max_browser_mb",
+    "record_har",
+    "replay_har",
+)
+ASYNC_UNSUPPORTED_OPTIONS = ("category",) + SEQUENTIAL_ONLY_OPTIONS
+# The HTTP backend starts no browser and visits no player pages
+HTTP_UNSUPPORTED_OPTIONS = SEQUENTIAL_ONLY_OPTIONS + (
+    "no_headless",
+    "navigation",
+    "extraction",
+    "parallel_categories",
+    "page_uses",
+    "block_resources",
+    "block_types",
+    "block_host",
+    "allow_host",
+    "wait",
+    "retries",
+    "min_delay",
+    "max_delay",
+    "breaker_cooldown",
+)
+
+
+def parse_args(argv=None):
     """Parse command line arguments.
 
+    Scrape options are accepted before any command, so ``run.py --limit 10``
+    keeps working, and after ``scrape`` or ``daemon``.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+
     Returns:
         Parsed command line arguments
     """
     parser = argparse.ArgumentParser(
         description="Scrape ESPN Fantasy Baseball Player data"
     )
-    parser.add_argument(
+    _add_scrape_arguments(parser)
+
+    subparsers = parser.add_subparsers(dest="command")
+    scrape_parser = subparsers.add_parser(
+        "scrape", help="Scrape players (the default when no command is given)"
+    )
+    _add_scrape_arguments(scrape_parser, defaults=False)
+    convert_parser = subparsers.add_parser(
+        "convert",
+        help="Convert a player file to another format (JSON, JSONL, Parquet, Arrow, SQLite)",
+    )
+    convert_parser.add_argument("input", help="Player file to read")
+    convert_parser.add_argument("output", help="File to write; its extension picks the format")
+    inspect_parser = subparsers.add_parser(
+        "inspect", help="Summarize a player file: counts per type and team, missing stats"
+    )
+    inspect_parser.add_argument("input", help="Player file to read")
+    inspect_parser.add_argument(
+        "--show",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Number of players to list (default: 5)",
+    )
+    daemon_parser = subparsers.add_parser(
+        "daemon",
+        help="Keep a warm browser running and scrape jobs sent by later runs",
+    )
+    _add_scrape_arguments(daemon_parser, defaults=False)
+    daemon_parser.add_argument(
+        "--stop", action="store_true", help="Stop the running daemon"
+    )
+    merge_parser = subparsers.add_parser(
+        "merge", help="Merge player files, such as shard outputs, into one file"
+    )
+    merge_parser.add_argument("inputs", nargs="+", help="Player files to merge")
+    merge_parser.add_argument(
+        "-o", "--output", required=True, help="Output file path for the merged data"
+    )
+    diff_parser = subparsers.add_parser(
+        "diff", help="Show players added, removed and changed between two player files"
+    )
+    diff_parser.add_argument("old", help="Earlier player file")
+    diff_parser.add_argument("new", help="Later player file")
+    diff_parser.add_argument(
+        "-o", "--output", help="Also write the diff as JSON to this file"
+    )
+    diff_parser.add_argument(
+        "--ignore",
+        action="append",
+        metavar="FIELD",
+        help=f"Player field to leave out of the comparison; may be repeated "
+        f"(default: {', '.join(DEFAULT_IGNORED_FIELDS)})",
+    )
+    return parser.parse_args(argv)
+
+
+def _add_scrape_arguments(parser, defaults=True):
+    """Add the options controlling a scrape to a parser.
+
+    Args:
+        parser: Parser or subcommand parser to add the options to
+        defaults: Whether the options set their defaults. A subcommand's
+            copies must not, or they would overwrite options given before
+            the command name.
+    """
+    def add_argument(*names, **kwargs):
+        action = parser.add_argument(*names, **kwargs)
+        if not defaults:
+            action.default = argparse.SUPPRESS
+
+    add_argument(
         "-o",
         "--output",
         default="data/espn_players.json",
-        help="Output file path for the scraped data (default: data/espn_players.json)",
+        help="Output file path for the scraped data; a .jsonl file is written "
+        "one player per line while scraping (default: data/espn_players.json)",
     )
-    parser.add_argument(
+    add_argument(
         "--no-headless", action="store_true", help="Run browser in visible mode"
     )
-    parser.add_argument(
+    add_argument(
         "--limit",
         type=int,
         default=500,
         help="Limit the number of players to scrape per category (default: 500)",
     )
-    return parser.parse_args()
+    add_argument(
+        "--category",
+        action="append",
+        choices=[category for category, _ in CATEGORIES],
+        help="Player type to scrape; may be repeated (default: all)",
+    )
+    add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="browser",
+        help="Scrape with a headless browser, or fetch the player list JSON API "
+        "directly over HTTP without starting a browser (default: browser)",
+    )
+    add_argument(
+        "--season",
+        type=int,
+        metavar="YEAR",
+        help="Season whose player list --backend http fetches (default: the season "
+        "the projections page currently shows, which switches in February)",
+    )
+    add_argument(
+        "--api-url",
+        metavar="URL",
+        help="Player list API URL for --backend http, e.g. of a local stand-in "
+        "(default: ESPN's API for --season)",
+    )
+    add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of player pages to scrape concurrently, or of API pages "
+        "requested at once with --backend http (default: 1)",
+    )
+    add_argument(
+        "--page-uses",
+        type=int,
+        default=DEFAULT_MAX_PAGE_USES,
+        metavar="N",
+        help="Player visits after which a pooled player page is closed and "
+        f"replaced (default: {DEFAULT_MAX_PAGE_USES})",
+    )
+    add_argument(
+        "--recycle-after",
+        type=int,
+        metavar="N",
+        help="Replace the browser context after every N players, continuing at "
+        "the next table page, to keep browser memory bounded",
+    )
+    add_argument(
+        "--max-browser-mb",
+        type=float,
+        metavar="MB",
+        help="Replace the browser context when browser memory (RSS) reaches MB, "
+        "and relaunch the browser if that is not enough (Linux only)",
+    )
+    add_argument(
+        "--record-har",
+        metavar="PATH",
+        help="Record every network exchange of the run into a HAR file "
+        "(.zip keeps response bodies as separate files)",
+    )
+    add_argument(
+        "--replay-har",
+        metavar="PATH",
+        help="Answer every request from a recorded HAR file instead of the "
+        "network; requests it does not hold are aborted",
+    )
+    add_argument(
+        "--replay-latency-ms",
+        type=float,
+        default=0.0,
+        metavar="MS",
+        help="Delay every response replayed with --replay-har by MS milliseconds "
+        "(default: 0)",
+    )
+    add_argument(
+        "--parallel-categories",
+        action="store_true",
+        help="Scrape batters and pitchers at the same time in separate browser "
+        "contexts (each with --concurrency workers)",
+    )
+    add_argument(
+        "--navigation",
+        choices=NAVIGATION_MODES,
+        default="modal",
+        help="How to reach player pages: through the player card modal or by "
+        "visiting URLs built from the table rows (default: modal)",
+    )
+    add_argument(
+        "--extraction",
+        choices=EXTRACTION_MODES,
+        default="dom",
+        help="Where player data comes from: each player's page (dom), the JSON "
+        "player list the projections page loads (network), or the projections "
+        "table rows themselves, without opening player pages (table) (default: dom)",
+    )
+    add_argument(
+        "--block-resources",
+        action="store_true",
+        help="Abort images, media, fonts and known ad/analytics hosts",
+    )
+    add_argument(
+        "--block-types",
+        help="Comma-separated resource types to abort with --block-resources "
+        "(default: image,media,font)",
+    )
+    add_argument(
+        "--block-host",
+        action="append",
+        default=[],
+        metavar="HOST",
+        help="Additional host (and its subdomains) to abort; may be repeated",
+    )
+    add_argument(
+        "--allow-host",
+        action="append",
+        default=[],
+        metavar="HOST",
+        help="Host (and its subdomains) that is never aborted; may be repeated",
+    )
+    add_argument(
+        "--wait",
+        action="append",
+        default=[],
+        type=_wait_option,
+        metavar="STEP=STRATEGY",
+        help=f"Readiness condition for a step ({', '.join(WAIT_STEPS)}); strategies: "
+        f"{', '.join(WAIT_STRATEGIES)} (pagination: rows or networkidle only). Targeted "
+        "waits fall back to networkidle on timeout; may be repeated",
+    )
+    add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="Extra attempts for a failing player page, with exponential backoff "
+        "and jitter; players that still fail are listed at the end (default: 2)",
+    )
+    add_argument(
+        "--min-delay",
+        type=float,
+        default=0.0,
+        help="Smallest delay in seconds between player page requests; the delay "
+        "grows on errors and shrinks back on success (default: 0)",
+    )
+    add_argument(
+        "--max-delay",
+        type=float,
+        default=30.0,
+        help="Largest delay in seconds between player page requests (default: 30)",
+    )
+    add_argument(
+        "--breaker-cooldown",
+        type=float,
+        default=60.0,
+        help="Seconds to pause all player requests after repeated failures in a "
+        "row (default: 60)",
+    )
+    add_argument(
+        "--checkpoint",
+        help="Checkpoint journal recording progress as players are scraped "
+        "(default: <output>.journal, removed after a successful save)",
+    )
+    add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted run from its checkpoint journal, skipping "
+        "players it already holds",
+    )
+    add_argument(
+        "--cache",
+        metavar="PATH",
+        help="Player cache file; players with a fresh entry skip their player page",
+    )
+    add_argument(
+        "--cache-ttl",
+        type=float,
+        default=24,
+        help="Hours a cached player stays fresh (default: 24)",
+    )
+    add_argument(
+        "--cache-size",
+        type=int,
+        default=10_000,
+        help="Maximum number of players kept in the cache (default: 10000)",
+    )
+    add_argument(
+        "--shard",
+        type=_shard_option,
+        metavar="K/N",
+        help="Scrape only shard K of N: every Nth table page starting at page K. "
+        "Output goes to <output>.shard-K-of-N; combine the shards with 'merge'",
+    )
+    add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each scraper phase (page loads, clicks, waits, extraction) and "
+        "print p50/p95/max per phase at the end of the run",
+    )
+    add_argument(
+        "--profile-output",
+        metavar="PATH",
+        help="With --profile, also write the phase metrics to PATH: a Prometheus "
+        "textfile if it ends in .prom, JSON otherwise",
+    )
+
+    add_argument(
+        "--socket",
+        help="Unix socket of the scraper daemon (default: a per-user socket in "
+        "the temporary directory)",
+    )
+    add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Scrape in this process even if a scraper daemon is running",
+    )
+
+
+def _shard_option(value):
+    """Argparse type for ``--shard K/N`` values."""
+    index, _, total = value.partition("/")
+    try:
+        shard = int(index), int(total)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Shard must look like K/N, got '{value}'")
+    if not 1 <= shard[0] <= shard[1]:
+        raise argparse.ArgumentTypeError(f"Shard index must be between 1 and N, got '{value}'")
+    return shard
+
+
+def shard_output_path(output, shard):
+    """Insert the shard into an output path, e.g. players.shard-2-of-4.json."""
+    if not shard:
+        return output
+    root, ext = os.path.splitext(output)
+    return f"{root}.shard-{shard[0]}-of-{shard[1]}{ext}"
+
+
+def merge_files(inputs, output):
+    """Merge player files into one, deduplicating players.
+
+    Args:
+        inputs: Paths of the player files to merge
+        output: Path of the merged file
+    """
+    players = merge_players(load_players(path) for path in inputs)
+    save_players(players, output)
+
+
+def diff_files(old, new, output=None, ignore=None):
+    """Print the differences between two player files.
+
+    Args:
+        old: Path of the earlier player file
+        new: Path of the later player file
+        output: Optional path to write the diff to as JSON
+        ignore: Player fields to leave out of the comparison
+    """
+    diff = diff_players(
+        load_players(old),
+        load_players(new),
+        ignore=DEFAULT_IGNORED_FIELDS if ignore is None else ignore,
+    )
+    print(diff.summary())
+    if output:
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output, "w") as f:
+            json.dump(diff.to_dict(), f, indent=2)
+        print(f"Saved diff to {output}")
+
+
+def convert_file(input_file, output):
+    """Copy the players of a file into a file of another format.
+
+    Players are streamed, so converting to JSONL, Parquet or SQLite does not
+    hold the whole file in memory.
+
+    Args:
+        input_file: Player file to read
+        output: File to write; its extension picks the format
+    """
+    save_players(iter_players(input_file), output)
+
+
+def inspect_file(input_file, show=5):
+    """Print a summary of a player file.
+
+    Args:
+        input_file: Player file to read
+        show: Number of players to list
+    """
+    count = 0
+    types = Counter()
+    teams = set()
+    without_stats = 0
+    listed = []
+    for player in iter_players(input_file):
+        count += 1
+        types[player.player_type or "unknown"] += 1
+        teams.add(player.team)
+        if not player.stats:
+            without_stats += 1
+        if len(listed) < show:
+            listed.append(player)
+
+    print(f"{input_file}: {count} players")
+    if count:
+        print("  " + ", ".join(f"{name}: {total}" for name, total in types.items()))
+        print(f"  {len(teams)} teams, {without_stats} players without stats")
+    for player in listed:
+        rank = f"{player.rank}. " if player.rank is not None else ""
+        print(f"  {rank}{player.name} ({player.team}, {player.position}) {player.player_type}")
+
+
+def build_cache(args):
+    """Open the player cache selected on the command line.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        PlayerCache, or None if no cache file was given
+    """
+    if not args.cache:
+        return None
+    return PlayerCache(
+        args.cache, ttl_seconds=args.cache_ttl * 60 * 60, max_entries=args.cache_size
+    )
+
+
+def build_throttle(args):
+    """Build the player request throttle from command line arguments.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Throttle allowing up to ``--concurrency`` requests at once, per
+        category with ``--parallel-categories``
+    """
+    from espn_player_getter.scraper.throttle import Throttle
+
+    categories = len(CATEGORIES) if args.parallel_categories else 1
+    return Throttle(
+        retries=args.retries,
+        min_delay=args.min_delay,
+        max_delay=args.max_delay,
+        max_concurrency=args.concurrency * categories,
+        breaker_cooldown=args.breaker_cooldown,
+    )
+
+
+def build_memory(args):
+    """Build the memory monitor from command line arguments.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        MemoryMonitor recycling the browser at the ``--recycle-after`` and
+        ``--max-browser-mb`` limits, or only sampling without them
+    """
+    from espn_player_getter.scraper.memory import MemoryMonitor
+
+    return MemoryMonitor(max_players=args.recycle_after, max_rss_mb=args.max_browser_mb)
+
+
+def _wait_option(value):
+    """Argparse type for ``--wait STEP=STRATEGY`` values."""
+    try:
+        return parse_wait_option(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def build_resource_policy(args):
+    """Build the request blocking policy selected on the command line.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        ResourcePolicy, or None if no blocking was requested
+    """
+    if not (args.block_resources or args.block_host):
+        return None
+    policy = ResourcePolicy(allowed_hosts=set(args.allow_host))
+    if args.block_types is not None:
+        policy.blocked_resource_types = {
+            resource_type.strip()
+            for resource_type in args.block_types.split(",")
+            if resource_type.strip()
+        }
+    policy.blocked_hosts.update(args.block_host)
+    return policy
+
+
+def build_scraper(args, resource_policy=None, journal=None, profiler=None):
+    """Build the browser scraper selected on the command line.
+
+    Args:
+        args: Parsed command line arguments
+        resource_policy: Optional request blocking policy
+        journal: Optional checkpoint journal
+        profiler: Optional PhaseTimer for the run
+
+    Returns:
+        Unopened ESPNScraper
+    """
+    from espn_player_getter.scraper.espn_scraper import ESPNScraper
+
+    return ESPNScraper(
+        headless=not args.no_headless,
+        navigation=args.navigation,
+        extraction=args.extraction,
+        resource_policy=resource_policy,
+        wait_strategies=dict(args.wait),
+        journal=journal,
+        cache=build_cache(args),
+        shard=args.shard,
+        profiler=profiler,
+        max_page_uses=args.page_uses,
+        throttle=build_throttle(args),
+        memory=build_memory(args),
+        record_har_path=args.record_har,
+        replay_har_path=args.replay_har,
+        replay_latency_ms=args.replay_latency_ms,
+    )
+
+
+def uses_async_scraper(args):
+    """Check whether the run needs the concurrent worker pool."""
+    return (args.concurrency > 1 or args.parallel_categories) and args.extraction == "dom"
+
+
+def can_use_daemon(args):
+    """Check whether a scrape may be handed to a running daemon.
+
+    Runs that need per-run state the daemon does not keep (a shard, a
+    checkpoint journal to write or resume, a cache, a profile, a HAR
+    recording or replay) or a different backend are scraped in process.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        True if the run can be sent as a daemon job
+    """
+    from espn_player_getter.daemon import is_running
+
+    return not (
+        args.no_daemon
+        or args.backend != "browser"
+        or uses_async_scraper(args)
+        or args.shard
+        or args.resume
+        or args.checkpoint
+        or args.cache
+        or args.profile
+        or args.record_har
+        or args.replay_har
+    ) and is_running(socket_path(args))
+
+
+def scraper_options(args):
+    """Collect the options that change how a browser scrape is done.
+
+    A daemon compares the options sent with each job against its own and
+    rejects jobs asking for different ones.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        JSON-compatible dict of option name to value
+    """
+    return {
+        "headless": not args.no_headless,
+        "navigation": args.navigation,
+        "extraction": args.extraction,
+        "page_uses": args.page_uses,
+        "recycle_after": args.recycle_after,
+        "max_browser_mb": args.max_browser_mb,
+        "block_resources": args.block_resources,
+        "block_types": args.block_types,
+        "block_host": sorted(args.block_host),
+        "allow_host": sorted(args.allow_host),
+        "wait": dict(args.wait),
+        "retries": args.retries,
+        "min_delay": args.min_delay,
+        "max_delay": args.max_delay,
+        "breaker_cooldown": args.breaker_cooldown,
+    }
+
+
+def socket_path(args):
+    """Return the daemon socket selected on the command line."""
+    from espn_player_getter.daemon import DEFAULT_SOCKET_PATH
+
+    return args.socket or DEFAULT_SOCKET_PATH
+
+
+def run_daemon(args):
+    """Serve scrape jobs, or stop the running daemon with ``--stop``.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    from espn_player_getter.daemon import CONTROL_TIMEOUT, ScraperDaemon, request
+
+    if args.stop:
+        request({"command": "shutdown"}, socket_path(args), timeout=CONTROL_TIMEOUT)
+        print(f"Stopped the daemon at {socket_path(args)}")
+        return
+    resource_policy = build_resource_policy(args)
+    ScraperDaemon(
+        partial(build_scraper, args, resource_policy), socket_path(args), scraper_options(args)
+    ).serve_forever()
+
+
+def send_job(args, output):
+    """Have the running daemon scrape into an output file.
+
+    Args:
+        args: Parsed command line arguments
+        output: Output file path
+    """
+    from espn_player_getter.daemon import request
+
+    output = os.path.abspath(output)
+    print(f"Sending the scrape to the daemon at {socket_path(args)}")
+    response = request(
+        {
+            "command": "scrape",
+            "limit": args.limit,
+            "categories": args.category,
+            "output": output,
+            "options": scraper_options(args),
+        },
+        socket_path(args),
+    )
+    print(f"Daemon saved {response['players']} players to {output}")
+
+
+def reject_options(args, names, mode):
+    """Fail if the run sets options the selected scraper would ignore.
+
+    Args:
+        args: Parsed command line arguments
+        names: Argument names (``args`` attributes) the scraper does not support
+        mode: Options selecting the scraper, for the error message
+
+    Raises:
+        ValueError: If any of the options differs from its default
+    """
+    defaults = parse_args([])
+    used = [
+        f"--{name.replace('_', '-')}"
+        for name in names
+        if getattr(args, name) != getattr(defaults, name)
+    ]
+    if used:
+        raise ValueError(f"{', '.join(used)} not supported with {mode}")
 
 
 def run_scraper():
@@ -41,16 +742,125 @@ def run_scraper():
     try:
         # Parse command line arguments
         args = parse_args()
+        if args.command == "merge":
+            merge_files(args.inputs, args.output)
+            return 0
+        if args.command == "diff":
+            diff_files(args.old, args.new, args.output, args.ignore)
+            return 0
+        if args.command == "convert":
+            convert_file(args.input, args.output)
+            return 0
+        if args.command == "inspect":
+            inspect_file(args.input, args.show)
+            return 0
+        if args.command == "daemon":
+            run_daemon(args)
+            return 0
+
+        output = shard_output_path(args.output, args.shard)
+        resource_policy = build_resource_policy(args)
+        profiler = PhaseTimer() if args.profile else None
+
+        if args.backend != "http":
+            reject_options(args, ("season", "api_url"), f"--backend {args.backend}")
+            if args.extraction != "dom":
+                # Table and network extraction open no player pages to share
+                # between workers, and only the worker pool runs categories at once
+                mode = f"--extraction {args.extraction}"
+                reject_options(args, ("parallel_categories",), mode)
+                if args.concurrency > 1:
+                    raise ValueError(f"--concurrency not supported with {mode}")
+        elif args.api_url:
+            reject_options(args, ("season",), "--api-url")
 
         # Scrape player data
-        with ESPNScraper(headless=not args.no_headless) as scraper:
-            # Scrape players with specified limit
-            players = scraper.scrape_players(player_limit=args.limit)
+        if can_use_daemon(args):
+            journal = None
+            send_job(args, output)
+        elif args.backend == "http":
+            reject_options(args, HTTP_UNSUPPORTED_OPTIONS, "--backend http")
+            from espn_player_getter.scraper.espn_api import player_api_url
+            from espn_player_getter.scraper.http_scraper import HTTPScraper
+
+            journal = None
+            api_url = args.api_url or player_api_url(args.season)
+            with HTTPScraper(
+                api_url=api_url, concurrency=args.concurrency, profiler=profiler
+            ) as scraper:
+                save_players(
+                    scraper.iter_players(player_limit=args.limit, categories=args.category),
+                    output,
+                )
+        elif uses_async_scraper(args):
+            reject_options(
+                args, ASYNC_UNSUPPORTED_OPTIONS, "--concurrency or --parallel-categories"
+            )
+            import asyncio
+
+            players = asyncio.run(_scrape_async(args, resource_policy, profiler))
+            journal = None
+            save_players(players, output)
+        else:
+            journal = CheckpointJournal(
+                args.checkpoint or f"{output}.journal", resume=args.resume
+            )
+            with build_scraper(args, resource_policy, journal, profiler) as scraper:
+                # Scrape players with specified limit, saving them as they
+                # arrive when the output is JSONL
+                save_players(
+                    scraper.iter_players(player_limit=args.limit, categories=args.category),
+                    output,
+                )
 
-            # Save players to file
-            save_players(players, args.output)
+        if journal:
+            journal.remove()
+        if profiler:
+            report_profile(profiler, args.profile_output)
 
         return 0
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+
+
+def report_profile(profiler, output=None):
+    """Print the phase timings of a run and optionally write them to a file.
+
+    Args:
+        profiler: PhaseTimer used for the run
+        output: Optional metrics path; .prom files are Prometheus textfiles,
+            anything else JSON
+    """
+    print("Phase timings:")
+    print(profiler.report())
+    if output:
+        profiler.write(output)
+        print(f"Saved phase metrics to {output}")
+
+
+async def _scrape_async(args, resource_policy=None, profiler=None):
+    """Scrape players with the concurrent worker pool.
+
+    Args:
+        args: Parsed command line arguments
+        resource_policy: Optional request blocking policy
+        profiler: Optional PhaseTimer for the run
+
+    Returns:
+        List of Player objects
+    """
+    from espn_player_getter.scraper.async_scraper import AsyncESPNScraper
+
+    async with AsyncESPNScraper(
+        headless=not args.no_headless,
+        concurrency=args.concurrency,
+        navigation=args.navigation,
+        resource_policy=resource_policy,
+        wait_strategies=dict(args.wait),
+        parallel_categories=args.parallel_categories,
+        profiler=profiler,
+        max_page_uses=args.page_uses,
+        throttle=build_throttle(args),
+    ) as scraper:
+        return await scraper.scrape_players(player_limit=args.limit)
@@ -0,0 +1,180 @@
+import os
+from typing import Iterable, Iterator, List, Optional
+
+from espn_player_getter.models.player import Player
+
+# Players are stored one row each with typed columns; the stats dict is
+# flattened into one float column per stat, named stat_<name>. Needs the
+# optional pyarrow dependency.
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+ARROW_EXTENSIONS = (".arrow", ".feather")
+STAT_COLUMN_PREFIX = "stat_"
+COMPRESSION = "zstd"
+
+
+def is_columnar(path: str) -> bool:
+    """Check whether a path is a Parquet or Arrow player file."""
+    return os.path.splitext(path)[1].lower() in PARQUET_EXTENSIONS + ARROW_EXTENSIONS
+
+
+def _is_parquet(path: str) -> bool:
+    """Check whether a columnar path is Parquet rather than Arrow IPC."""
+    return os.path.splitext(path)[1].lower() in PARQUET_EXTENSIONS
+
+
+def _import_pyarrow():
+    """Import pyarrow, explaining how to install it if it is missing."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Parquet and Arrow files need the optional pyarrow dependency: pip install pyarrow"
+        )
+    return pyarrow
+
+
+def player_schema(stat_names: Iterable[str]):
+    """Build the Arrow schema for a set of stat names.
+
+    Args:
+        stat_names: Stat keys to flatten into columns, in column order
+
+    Returns:
+        pyarrow.Schema
+    """
+    pa = _import_pyarrow()
+    fields = [
+        pa.field("id", pa.string(), nullable=False),
+        pa.field("name", pa.string()),
+        pa.field("team", pa.string()),
+        pa.field("position", pa.string()),
+        pa.field("eligible_positions", pa.list_(pa.string())),
+        pa.field("is_starter", pa.bool_()),
+        pa.field("player_type", pa.string()),
+        pa.field("rank", pa.int32()),
+    ]
+    fields += [pa.field(STAT_COLUMN_PREFIX + name, pa.float64()) for name in stat_names]
+    return pa.schema(fields)
+
+
+def players_to_table(players: List[Player]):
+    """Convert players to an Arrow table with flattened stat columns.
+
+    Stat columns are the union of every player's stat keys, in the order
+    they are first seen; players without a stat get a null.
+
+    Args:
+        players: Player objects to convert
+
+    Returns:
+        pyarrow.Table
+    """
+    pa = _import_pyarrow()
+    stat_names = list(dict.fromkeys(name for p in players for name in (p.stats or {})))
+    columns = {
+        "id": [p.id for p in players],
+        "name": [p.name for p in players],
+        "team": [p.team for p in players],
+        "position": [p.position for p in players],
+        "eligible_positions": [p.eligible_positions for p in players],
+        "is_starter": [p.is_starter for p in players],
+        "player_type": [p.player_type for p in players],
+        "rank": [p.rank for p in players],
+    }
+    for name in stat_names:
+        columns[STAT_COLUMN_PREFIX + name] = [
+            None if (p.stats or {}).get(name) is None else float(p.stats[name])
+            for p in players
+        ]
+    return pa.Table.from_pydict(columns, schema=player_schema(stat_names))
+
+
+def _batch_to_players(batch) -> Iterator[Player]:
+    """Rebuild players from an Arrow record batch.
+
+    A player whose stat columns are all null gets ``stats=None``.
+    """
+    columns = batch.to_pydict()
+    stat_columns = [name for name in columns if name.startswith(STAT_COLUMN_PREFIX)]
+    for i in range(batch.num_rows):
+        stats = {
+            name[len(STAT_COLUMN_PREFIX):]: columns[name][i]
+            for name in stat_columns
+            if columns[name][i] is not None
+        }
+        yield Player(
+            id=columns["id"][i],
+            name=columns["name"][i],
+            team=columns["team"][i],
+            position=columns["position"][i],
+            eligible_positions=columns["eligible_positions"][i] or [],
+            is_starter=bool(columns["is_starter"][i]),
+            player_type=columns["player_type"][i] or "",
+            stats=stats or None,
+            rank=columns["rank"][i],
+        )
+
+
+def save_columnar(players: Iterable[Player], output_file: str) -> int:
+    """Write players to a compressed Parquet or Arrow IPC file.
+
+    Args:
+        players: Player objects to save
+        output_file: Path ending in .parquet/.pq or .arrow/.feather
+
+    Returns:
+        Number of players written
+    """
+    table = players_to_table(list(players))
+    if _is_parquet(output_file):
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, output_file, compression=COMPRESSION)
+    else:
+        import pyarrow.feather as feather
+
+        feather.write_feather(table, output_file, compression=COMPRESSION)
+    return table.num_rows
+
+
+def load_columns(input_file: str, columns: Optional[List[str]] = None):
+    """Read selected columns of a Parquet or Arrow player file.
+
+    Only the requested columns are read and decompressed, so analytics that
+    need a few fields skip the rest of the file.
+
+    Args:
+        input_file: Path to the input file
+        columns: Column names to read, e.g. ["id", "stat_HR"]; all if None
+
+    Returns:
+        pyarrow.Table
+    """
+    _import_pyarrow()
+    if _is_parquet(input_file):
+        import pyarrow.parquet as pq
+
+        return pq.read_table(input_file, columns=columns)
+    import pyarrow.feather as feather
+
+    return feather.read_table(input_file, columns=columns, memory_map=True)
+
+
+def iter_columnar_players(input_file: str) -> Iterator[Player]:
+    """Read players from a Parquet or Arrow file one record batch at a time.
+
+    Args:
+        input_file: Path to the input file
+
+    Yields:
+        Player objects in file order
+    """
+    _import_pyarrow()
+    if _is_parquet(input_file):
+        import pyarrow.parquet as pq
+
+        batches = pq.ParquetFile(input_file).iter_batches()
+    else:
+        batches = load_columns(input_file).to_batches()
+    for batch in batches:
+        yield from _batch_to_players(batch)
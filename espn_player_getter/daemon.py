@@ -0,0 +1,290 @@
+import getpass
+import json
+import os
+import socket
+import tempfile
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from espn_player_getter.data_handler import save_players
+from espn_player_getter.models.player import Player
+
+# Socket the daemon listens on and the CLI looks for, one per user
+DEFAULT_SOCKET_PATH = os.path.join(
+    tempfile.gettempdir(), f"espn_player_getter-{getpass.getuser()}.sock"
+)
+
+# Seconds a client waits for an answer to a ping or shutdown
+CONTROL_TIMEOUT = 5.0
+
+
+class DaemonError(RuntimeError):
+    """The daemon could not be reached or could not run a job."""
+
+
+class ScraperDaemon:
+    """Long-lived process keeping a warm scraper, running jobs sent over a Unix socket.
+
+    The browser is started by the first job and kept open for the next ones,
+    so only that job pays the cold start. Each connection carries one
+    newline-terminated JSON request and gets one JSON answer back:
+
+    - ``{"command": "ping"}`` answers with the daemon's job and launch counts
+    - ``{"command": "scrape", "limit": 500, "categories": ["batter"],
+      "output": "/abs/players.json", "options": {...}}`` scrapes and saves
+      the players, answering with how many were saved. Jobs whose scraper
+      options differ from the daemon's are rejected
+    - ``{"command": "shutdown"}`` closes the browser and stops the daemon
+
+    Jobs run one at a time in the thread calling serve_forever(), since the
+    sync Playwright API must stay on the thread that started it. A job that
+    fails closes the scraper; the next job starts a fresh browser.
+    """
+
+    def __init__(
+        self,
+        scraper_factory: Callable[[], Any],
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        options: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            scraper_factory: Callable returning an unopened scraper (e.g. an
+                ESPNScraper) whose iter_players() accepts ``categories``
+            socket_path: Path of the Unix socket to listen on
+            options: JSON-compatible scraper options the factory's scrapers
+                use, compared against the options sent with each job
+        """
+        self.scraper_factory = scraper_factory
+        self.socket_path = socket_path
+        # Compared in their JSON form, as jobs send them
+        self.options = json.loads(json.dumps(options)) if options is not None else None
+        self.scraper = None
+        self.jobs = 0
+        self.launches = 0
+        self._server: Optional[socket.socket] = None
+        self._running = False
+
+    def bind(self) -> None:
+        """Start listening on the socket, replacing a stale socket file.
+
+        Raises:
+            DaemonError: If another daemon is already listening on the socket
+        """
+        if os.path.exists(self.socket_path):
+            if is_running(self.socket_path):
+                raise DaemonError(f"A daemon is already listening on {self.socket_path}")
+            os.remove(self.socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        # Only the owner may send jobs that write files as this user
+        os.chmod(self.socket_path, 0o600)
+        server.listen()
+        self._server = server
+
+    def serve_forever(self) -> None:
+        """Answer requests until a shutdown request arrives."""
+        if not self._server:
+            self.bind()
+        print(f"Scraper daemon listening on {self.socket_path}")
+        self._running = True
+        try:
+            while self._running:
+                connection, _ = self._server.accept()
+                with connection:
+                    self._serve(connection)
+        finally:
+            self._server.close()
+            self._server = None
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            self._close_scraper()
+            print(f"Scraper daemon stopped after {self.jobs} jobs")
+
+    def _serve(self, connection: socket.socket) -> None:
+        """Read one request from a connection and write its answer."""
+        try:
+            message = json.loads(_read_line(connection))
+            response = self.handle(message)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        try:
+            connection.sendall(json.dumps(response).encode() + b"\n")
+        except OSError:
+            # The client gave up waiting; the job's output is saved regardless
+            pass
+
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one request.
+
+        Args:
+            message: Decoded request
+
+        Returns:
+            Answer for the client; ``ok`` is False with an ``error`` on failure
+        """
+        command = message.get("command")
+        if command == "ping":
+            return {"ok": True, "jobs": self.jobs, "launches": self.launches}
+        if command == "shutdown":
+            self._running = False
+            return {"ok": True}
+        if command == "scrape":
+            mismatch = self.option_mismatch(message.get("options"))
+            if mismatch:
+                return {
+                    "ok": False,
+                    "error": f"The daemon scrapes with different options ({mismatch}); "
+                    "scrape with --no-daemon or restart the daemon with these options",
+                }
+            try:
+                saved = self.run_job(message)
+            except Exception as e:
+                print(f"Job failed, closing the browser: {e}")
+                self._close_scraper()
+                return {"ok": False, "error": str(e)}
+            return {"ok": True, "players": saved}
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+    def option_mismatch(self, options: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Describe how a job's scraper options differ from the daemon's.
+
+        Args:
+            options: Options sent with the job; None accepts the daemon's
+
+        Returns:
+            Description of the differing options, or None if they match
+        """
+        if options is None or self.options is None:
+            return None
+        differences = [
+            f"{name}: {options.get(name)!r} instead of {self.options.get(name)!r}"
+            for name in sorted(set(options) | set(self.options))
+            if options.get(name) != self.options.get(name)
+        ]
+        return "; ".join(differences) or None
+
+    def run_job(self, job: Dict[str, Any]) -> int:
+        """Scrape players on the warm scraper and save them.
+
+        Args:
+            job: Scrape request with ``output`` and optional ``limit`` and ``categories``
+
+        Returns:
+            Number of players saved
+        """
+        output = job.get("output")
+        if not output or not os.path.isabs(output):
+            raise ValueError("Jobs need an absolute output path")
+        scraper = self._open_scraper()
+        self.jobs += 1
+        print(f"Job {self.jobs}: scraping into {output}")
+        players = scraper.iter_players(
+            player_limit=job.get("limit", 500), categories=job.get("categories")
+        )
+        counter = _Counter(players)
+        save_players(counter, output)
+        return counter.count
+
+    def _open_scraper(self):
+        """Return the warm scraper, starting it if no job has yet (or the last failed)."""
+        if self.scraper is None:
+            scraper = self.scraper_factory()
+            self.scraper = scraper.__enter__()
+            self.launches += 1
+        return self.scraper
+
+    def _close_scraper(self) -> None:
+        """Close the scraper and its browser, if open."""
+        if self.scraper is not None:
+            scraper, self.scraper = self.scraper, None
+            try:
+                scraper.__exit__(None, None, None)
+            except Exception as e:
+                print(f"Error closing the scraper: {e}")
+
+
+class _Counter:
+    """Iterable passing players through while counting them."""
+
+    def __init__(self, players):
+        self.players = players
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Player]:
+        for player in self.players:
+            self.count += 1
+            yield player
+
+
+def _read_line(connection: socket.socket) -> bytes:
+    """Read from a connection up to the first newline or the end of the stream."""
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def request(
+    message: Dict[str, Any],
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Send one request to the daemon and wait for its answer.
+
+    Args:
+        message: Request, e.g. ``{"command": "ping"}``
+        socket_path: Path of the daemon's socket
+        timeout: Seconds to wait for the answer; None waits for as long as
+            the job takes
+
+    Returns:
+        The daemon's answer
+
+    Raises:
+        DaemonError: If the daemon is unreachable or reports an error
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        client.connect(socket_path)
+        client.sendall(json.dumps(message).encode() + b"\n")
+        data = _read_line(client)
+    except OSError as e:
+        raise DaemonError(f"Daemon at {socket_path} is unreachable: {e}")
+    finally:
+        client.close()
+    if not data:
+        raise DaemonError(f"Daemon at {socket_path} closed the connection")
+    response = json.loads(data)
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "Unknown daemon error"))
+    return response
+
+
+def is_running(socket_path: str = DEFAULT_SOCKET_PATH) -> bool:
+    """Check whether a daemon is listening on a socket.
+
+    Only the connection is tried: a daemon busy with a job accepts it into
+    its backlog but would not answer a ping until the job is done.
+
+    Args:
+        socket_path: Path of the daemon's socket
+
+    Returns:
+        True if the socket accepts connections
+    """
+    if not os.path.exists(socket_path):
+        return False
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(CONTROL_TIMEOUT)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        return False
+    finally:
+        client.close()
+    return True
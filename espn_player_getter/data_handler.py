@@ -1,20 +1,105 @@
 import json
 import os
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
+from espn_player_getter.columnar import is_columnar, iter_columnar_players, save_columnar
 from espn_player_getter.models.player import Player
+from espn_player_getter.store import PlayerStore, is_sqlite
 
 
-def save_players(players: List[Player], output_file: str) -> None:
-    """Save player data to a JSON file.
-    
+# Extensions written as newline-delimited JSON, one player per line
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+
+
+def is_jsonl(path: str) -> bool:
+    """Check whether a path is a newline-delimited JSON player file."""
+    return os.path.splitext(path)[1].lower() in JSONL_EXTENSIONS
+
+
+def _make_parent_dir(path: str) -> None:
+    """Create the directory a file is written to, if it has one."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+class JsonlWriter:
+    """Streams players to a newline-delimited JSON file as they arrive.
+
+    Each player is one compact JSON line. Lines are flushed to disk every
+    ``flush_every`` players and on close, so readers following the file see
+    players shortly after they are scraped.
+    """
+
+    def __init__(self, output_file: str, flush_every: int = 25):
+        """Open the output file, replacing any existing file.
+
+        Args:
+            output_file: Path to the output file
+            flush_every: Number of players written between flushes
+        """
+        _make_parent_dir(output_file)
+        self.output_file = output_file
+        self.flush_every = max(1, flush_every)
+        self.count = 0
+        self._file = open(output_file, "w")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, player: Player) -> None:
+        """Append one player."""
+        self._file.write(json.dumps(player.to_dict()) + "\n")
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        self._file.close()
+
+
+def save_players(players: Iterable[Player], output_file: str, flush_every: int = 25) -> None:
+    """Save player data to a JSON, JSONL, Parquet, Arrow or SQLite file.
+
+    The format follows the file extension. ``.jsonl`` and ``.ndjson`` files
+    are written one player per line while ``players`` is consumed, so a
+    generator can stream straight to disk. ``.parquet`` and ``.arrow`` files
+    are columnar (see ``columnar``). ``.db`` and ``.sqlite`` files are a
+    ``PlayerStore`` the players are upserted into, keeping players already
+    stored. Other files get a single JSON array written once all players
+    are in.
+
     Args:
-        players: List of Player objects to save
+        players: Player objects to save
         output_file: Path to the output file
+        flush_every: Players written between flushes of a JSONL file
     """
+    if is_sqlite(output_file):
+        with PlayerStore(output_file) as store:
+            count = store.upsert(players)
+        print(f"Saved {count} players to {output_file}")
+        return
+
+    if is_columnar(output_file):
+        _make_parent_dir(output_file)
+        count = save_columnar(players, output_file)
+        print(f"Saved {count} players to {output_file}")
+        return
+
+    if is_jsonl(output_file):
+        with JsonlWriter(output_file, flush_every) as writer:
+            for player in players:
+                writer.write(player)
+        print(f"Saved {writer.count} players to {output_file}")
+        return
+
     # Create output directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    _make_parent_dir(output_file)
     
     # Convert players to dictionaries
     players_data = [player.to_dict() for player in players]
@@ -23,11 +108,54 @@ def save_players(players: List[Player], output_file: str) -> None:
     with open(output_file, "w") as f:
         json.dump(players_data, f, indent=2)
     
-    print(f"Saved {len(players)} players to {output_file}")
+    print(f"Saved {len(players_data)} players to {output_file}")
+
+
+def iter_players(input_file: str) -> Iterator[Player]:
+    """Read players one at a time from a JSON, JSONL, Parquet, Arrow or SQLite file.
+
+    JSONL files are read line by line, so a file that is still being
+    written can be consumed up to its last complete line. A trailing line
+    without a newline is a write in progress and is skipped. JSON files hold
+    a single array and are parsed in full before the first player is yielded.
+    Parquet files are read one record batch at a time and SQLite stores one
+    row at a time.
+
+    Args:
+        input_file: Path to the input file
+
+    Yields:
+        Player objects in file order
+
+    Raises:
+        FileNotFoundError: If the input file doesn't exist
+        json.JSONDecodeError: If the input file contains invalid JSON
+    """
+    if is_columnar(input_file):
+        yield from iter_columnar_players(input_file)
+        return
+
+    if is_sqlite(input_file):
+        with PlayerStore(input_file) as store:
+            yield from store.iter_all()
+        return
+
+    if not is_jsonl(input_file):
+        with open(input_file, "r") as f:
+            players_data = json.load(f)
+        for player_data in players_data:
+            yield Player.from_dict(player_data)
+        return
+
+    with open(input_file, "r") as f:
+        for line in f:
+            if not line.endswith("\n") or not line.strip():
+                continue
+            yield Player.from_dict(json.loads(line))
 
 
 def load_players(input_file: str) -> List[Player]:
-    """Load player data from a JSON file.
+    """Load player data from a JSON, JSONL, Parquet, Arrow or SQLite file.
     
     Args:
         input_file: Path to the input file
@@ -39,11 +167,42 @@ def load_players(input_file: str) -> List[Player]:
         FileNotFoundError: If the input file doesn't exist
         json.JSONDecodeError: If the input file contains invalid JSON
     """
-    with open(input_file, "r") as f:
-        players_data = json.load(f)
-    
-    # Convert dictionaries to Player objects
-    players = [Player.from_dict(player_data) for player_data in players_data]
+    players = list(iter_players(input_file))
     
     print(f"Loaded {len(players)} players from {input_file}")
     return players
+
+
+# Category order used when merging shard outputs
+CATEGORY_ORDER = ("batter", "pitcher")
+
+
+def merge_players(player_lists: Iterable[List[Player]]) -> List[Player]:
+    """Merge player lists, such as the outputs of sharded runs, into one.
+
+    Players are deduplicated by category and ID, so two-way players keep one
+    entry per category, with the first occurrence winning. The result is
+    ordered by category and then by table rank, so merging the shards of a
+    run gives the same order whichever order the shards are given in.
+
+    Args:
+        player_lists: Player lists to merge
+
+    Returns:
+        Merged list of Player objects
+    """
+    merged = {}
+    for players in player_lists:
+        for player in players:
+            merged.setdefault((player.player_type, player.id), player)
+
+    def sort_key(player: Player):
+        category = (
+            CATEGORY_ORDER.index(player.player_type)
+            if player.player_type in CATEGORY_ORDER
+            else len(CATEGORY_ORDER)
+        )
+        # Players without a rank keep their input order after the ranked ones
+        return (category, player.rank is None, player.rank or 0)
+
+    return sorted(merged.values(), key=sort_key)
@@ -0,0 +1,180 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+from espn_player_getter.models.player import Player
+
+# Rank moves with every projection update, so it is not a change by default
+DEFAULT_IGNORED_FIELDS = ("rank",)
+
+
+@dataclass
+class FieldChange:
+    """One field that differs between two snapshots of a player.
+
+    Stats are compared one by one and reported as ``stats.<name>``.
+    """
+    field: str
+    old: Any
+    new: Any
+
+
+@dataclass
+class PlayerChange:
+    """A player present in both snapshots whose content differs."""
+    player: Player
+    changes: List[FieldChange]
+    positions_added: List[str] = field(default_factory=list)
+    positions_removed: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert the change to a dictionary representation."""
+        return {
+            "id": self.player.id,
+            "name": self.player.name,
+            "player_type": self.player.player_type,
+            "changes": [
+                {"field": change.field, "old": change.old, "new": change.new}
+                for change in self.changes
+            ],
+            "positions_added": self.positions_added,
+            "positions_removed": self.positions_removed,
+        }
+
+
+@dataclass
+class SnapshotDiff:
+    """Players added, removed and changed between two snapshots."""
+    added: List[Player] = field(default_factory=list)
+    removed: List[Player] = field(default_factory=list)
+    changed: List[PlayerChange] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert the diff to a dictionary representation."""
+        return {
+            "added": [player.to_dict() for player in self.added],
+            "removed": [player.to_dict() for player in self.removed],
+            "changed": [change.to_dict() for change in self.changed],
+        }
+
+    def summary(self) -> str:
+        """Describe the diff, one line per added, removed or changed player."""
+        lines = [
+            f"{len(self.added)} added, {len(self.removed)} removed, "
+            f"{len(self.changed)} changed"
+        ]
+        for player in self.added:
+            lines.append(f"+ {player.name} ({player.id}, {player.player_type})")
+        for player in self.removed:
+            lines.append(f"- {player.name} ({player.id}, {player.player_type})")
+        for change in self.changed:
+            player = change.player
+            details = [
+                f"{c.field}: {c.old!r} -> {c.new!r}"
+                for c in change.changes
+                if c.field != "eligible_positions"
+            ]
+            if change.positions_added:
+                details.append(f"gained {', '.join(change.positions_added)}")
+            if change.positions_removed:
+                details.append(f"lost {', '.join(change.positions_removed)}")
+            lines.append(f"~ {player.name} ({player.id}, {player.player_type}): {'; '.join(details)}")
+        return "\n".join(lines)
+
+
+def _comparable(player: Player, ignore: Iterable[str]) -> dict:
+    """The player's fields that take part in the comparison."""
+    data = player.to_dict()
+    for name in ignore:
+        data.pop(name, None)
+    return data
+
+
+def content_hash(player: Player, ignore: Iterable[str] = DEFAULT_IGNORED_FIELDS) -> str:
+    """Hash a player's compared fields.
+
+    Args:
+        player: Player to hash
+        ignore: Fields left out of the hash
+
+    Returns:
+        Hex digest that is equal for players with equal compared fields
+    """
+    encoded = json.dumps(_comparable(player, ignore), sort_keys=True, default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def _index(players: Iterable[Player]) -> Dict[Tuple[str, str], Player]:
+    """Index a snapshot by player ID and category.
+
+    Two-way players appear once per category, so the category is part of
+    the key; the last occurrence wins.
+    """
+    return {(player.id, player.player_type): player for player in players}
+
+
+def _field_changes(old: dict, new: dict) -> List[FieldChange]:
+    """List the fields that differ between two comparable player dicts."""
+    changes = []
+    for name in old.keys() | new.keys():
+        if name == "stats":
+            continue
+        if name == "eligible_positions":
+            if set(old.get(name) or []) != set(new.get(name) or []):
+                changes.append(FieldChange(name, old.get(name), new.get(name)))
+        elif old.get(name) != new.get(name):
+            changes.append(FieldChange(name, old.get(name), new.get(name)))
+
+    old_stats, new_stats = old.get("stats") or {}, new.get("stats") or {}
+    for stat in old_stats.keys() | new_stats.keys():
+        if old_stats.get(stat) != new_stats.get(stat):
+            changes.append(FieldChange(f"stats.{stat}", old_stats.get(stat), new_stats.get(stat)))
+    return sorted(changes, key=lambda change: change.field)
+
+
+def diff_players(
+    old_players: Iterable[Player],
+    new_players: Iterable[Player],
+    ignore: Iterable[str] = DEFAULT_IGNORED_FIELDS,
+) -> SnapshotDiff:
+    """Compare two player snapshots.
+
+    Both snapshots are indexed by ID and category, and only players whose
+    content hashes differ are compared field by field, so the diff takes
+    linear time in the snapshot sizes.
+
+    Args:
+        old_players: Earlier snapshot
+        new_players: Later snapshot
+        ignore: Fields that are not compared (rank by default)
+
+    Returns:
+        SnapshotDiff, each list in the order of its snapshot
+    """
+    ignore = tuple(ignore)
+    old_index = _index(old_players)
+    new_index = _index(new_players)
+    diff = SnapshotDiff()
+
+    for key, new in new_index.items():
+        old = old_index.get(key)
+        if old is None:
+            diff.added.append(new)
+            continue
+        if content_hash(old, ignore) == content_hash(new, ignore):
+            continue
+        changes = _field_changes(_comparable(old, ignore), _comparable(new, ignore))
+        if not changes:
+            # Only the order of eligible positions differs
+            continue
+        change = PlayerChange(player=new, changes=changes)
+        if "eligible_positions" not in ignore:
+            old_positions = set(old.eligible_positions)
+            new_positions = set(new.eligible_positions)
+            change.positions_added = sorted(new_positions - old_positions)
+            change.positions_removed = sorted(old_positions - new_positions)
+        diff.changed.append(change)
+
+    diff.removed = [player for key, player in old_index.items() if key not in new_index]
+    return diff
@@ -13,6 +13,7 @@ class Player:
     is_starter: bool = False
     player_type: str = ""  # 'batter' or 'pitcher'
     stats: Optional[dict] = None
+    rank: Optional[int] = None  # row position in the category's projections table
     
     def to_dict(self) -> dict:
         """Convert player to dictionary representation."""
@@ -24,7 +25,8 @@ class Player:
             "eligible_positions": self.eligible_positions,
             "is_starter": self.is_starter,
             "player_type": self.player_type,
-            "stats": self.stats
+            "stats": self.stats,
+            "rank": self.rank
         }
     
     @classmethod
@@ -38,5 +40,6 @@ class Player:
             eligible_positions=data["eligible_positions"],
             is_starter=data.get("is_starter", False),
             player_type=data.get("player_type", ""),
-            stats=data.get("stats")
+            stats=data.get("stats"),
+            rank=data.get("rank")
         )
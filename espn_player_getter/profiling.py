@@ -0,0 +1,137 @@
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterable, List
+
+# Prometheus metric names for the phase summary written by write_prometheus
+PROMETHEUS_METRIC = "espn_scraper_phase_seconds"
+PROMETHEUS_MAX_METRIC = "espn_scraper_phase_max_seconds"
+QUANTILES = (50, 95)
+
+
+def percentile(values: Iterable[float], percent: float) -> float:
+    """Nearest-rank percentile of some values.
+
+    Args:
+        values: Sample values
+        percent: Percentile between 0 and 100
+
+    Returns:
+        The percentile, or 0.0 if there are no values
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class PhaseTimer:
+    """Records how long each named phase of a run takes.
+
+    Wrap a phase in ``with timer.phase("goto"):``; every pass adds one
+    duration sample, so per-player and per-page phases build up one sample
+    per player or page.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as one sample of a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one duration sample to a phase."""
+        self.samples.setdefault(name, []).append(seconds)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Summarize every phase.
+
+        Returns:
+            Mapping of phase name to count, total, p50, p95 and max seconds,
+            in the order the phases were first seen
+        """
+        return {
+            name: {
+                "count": len(samples),
+                "total": sum(samples),
+                **{f"p{q}": percentile(samples, q) for q in QUANTILES},
+                "max": max(samples),
+            }
+            for name, samples in self.samples.items()
+        }
+
+    def report(self) -> str:
+        """Format the phase summary as a table, slowest total first."""
+        lines = [f"{'phase':<28}{'count':>7}{'total s':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        stats = sorted(self.stats().items(), key=lambda item: item[1]["total"], reverse=True)
+        for name, phase in stats:
+            lines.append(
+                f"{name:<28}{phase['count']:>7}{phase['total']:>10.2f}"
+                f"{phase['p50'] * 1000:>10.1f}{phase['p95'] * 1000:>10.1f}"
+                f"{phase['max'] * 1000:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def write(self, path: str) -> None:
+        """Write the phase summary as a Prometheus textfile (.prom) or JSON."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if path.endswith(".prom"):
+            content = self.prometheus()
+        else:
+            content = json.dumps({"phases": self.stats()}, indent=2)
+        # Write then rename, so a textfile collector never reads half a file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def prometheus(self) -> str:
+        """Format the phase summary in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {PROMETHEUS_METRIC} Duration of scraper phases.",
+            f"# TYPE {PROMETHEUS_METRIC} summary",
+        ]
+        stats = self.stats()
+        for name, phase in stats.items():
+            for q in QUANTILES:
+                lines.append(
+                    f'{PROMETHEUS_METRIC}{{phase="{name}",quantile="{q / 100}"}} {phase[f"p{q}"]:.6f}'
+                )
+            lines.append(f'{PROMETHEUS_METRIC}_sum{{phase="{name}"}} {phase["total"]:.6f}')
+            lines.append(f'{PROMETHEUS_METRIC}_count{{phase="{name}"}} {phase["count"]}')
+        lines += [
+            f"# HELP {PROMETHEUS_MAX_METRIC} Slowest sample of each scraper phase.",
+            f"# TYPE {PROMETHEUS_MAX_METRIC} gauge",
+        ]
+        for name, phase in stats.items():
+            lines.append(f'{PROMETHEUS_MAX_METRIC}{{phase="{name}"}} {phase["max"]:.6f}')
+        return "\n".join(lines) + "\n"
+
+
+class NullTimer:
+    """Stand-in for PhaseTimer when profiling is off; records nothing."""
+
+    enabled = False
+    _context = nullcontext()
+
+    def phase(self, name: str):
+        """Return a shared no-op context manager."""
+        return self._context
+
+    def record(self, name: str, seconds: float) -> None:
+        """Ignore the sample."""
+
+
+NULL_TIMER = NullTimer()
@@ -0,0 +1,430 @@
+import asyncio
+import copy
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from playwright.async_api import Page, async_playwright
+
+from espn_player_getter.models.player import Player
+from espn_player_getter.profiling import NULL_TIMER, PhaseTimer
+from espn_player_getter.scraper.espn_scraper import (
+    ESPN_URL,
+    PLAYER_HEADER_SCRIPT,
+    PLAYER_URL,
+    ROWS_SCRIPT,
+    parse_player_header,
+    parse_row_link,
+)
+from espn_player_getter.scraper.page_pool import AsyncPagePool
+from espn_player_getter.scraper.resource_policy import ResourcePolicy
+from espn_player_getter.scraper.settings import CATEGORIES, DEFAULT_MAX_PAGE_USES, NAVIGATION_MODES
+from espn_player_getter.scraper.throttle import Throttle
+from espn_player_getter.scraper.waits import WaitPlan
+
+
+class AsyncESPNScraper:
+    """Asynchronous scraper that visits player pages with a pool of workers.
+
+    The projections table is walked on a single page, exactly like
+    ``ESPNScraper``. Each row's "Complete Stats" link is pushed onto a queue
+    and a fixed number of workers pull links off it and scrape them
+    concurrently on pooled pages, which are reused across players.
+
+    With ``parallel_categories`` the batters and pitchers tabs are scraped at
+    the same time, each in its own browser context (with its own worker pool)
+    inside the one Chromium process.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        concurrency: int = 4,
+        navigation: str = "modal",
+        resource_policy: Optional[ResourcePolicy] = None,
+        wait_strategies: Optional[Dict[str, str]] = None,
+        parallel_categories: bool = False,
+        projections_url: str = ESPN_URL,
+        player_url: str = PLAYER_URL,
+        profiler: Optional[PhaseTimer] = None,
+        max_page_uses: int = DEFAULT_MAX_PAGE_USES,
+        throttle: Optional[Throttle] = None,
+    ):
+        """Initialize the scraper.
+
+        Args:
+            headless: Whether to run browser in headless mode
+            concurrency: Number of player pages scraped at the same time
+            navigation: How player links are collected, either "modal" (open
+                each row's player card) or "direct" (read IDs from the row markup)
+            resource_policy: Optional policy for aborting unneeded requests
+                (images, fonts, ads, analytics) on the browser context
+            wait_strategies: Readiness strategy per step ("navigation",
+                "pagination", "player"), overriding the WaitPlan defaults
+            parallel_categories: Scrape each category tab in its own browser
+                context at the same time instead of one after the other
+            projections_url: Projections page to scrape, e.g. a local stand-in
+            player_url: Player page URL template used by direct navigation
+            profiler: Optional timer recording how long each phase takes;
+                concurrent workers add overlapping samples
+            max_page_uses: Player visits after which a pooled player page is
+                closed and replaced by a fresh one
+            throttle: Pacing, retry and circuit breaker settings for player
+                pages, shared by all workers; defaults to a Throttle allowing
+                up to ``concurrency`` requests at once per category scraped
+                at the same time
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if max_page_uses < 1:
+            raise ValueError("max_page_uses must be at least 1")
+        if navigation not in NAVIGATION_MODES:
+            raise ValueError(f"Unknown navigation mode: {navigation}")
+        self.headless = headless
+        self.concurrency = concurrency
+        self.max_page_uses = max_page_uses
+        # With parallel categories every category context runs its own
+        # ``concurrency`` workers, so the shared throttle allows them all
+        slots = concurrency * (len(CATEGORIES) if parallel_categories else 1)
+        self.throttle = throttle or Throttle(max_concurrency=slots)
+        self.navigation = navigation
+        self.resource_policy = resource_policy
+        self.timer = profiler or NULL_TIMER
+        self.waits = WaitPlan(wait_strategies, timer=self.timer)
+        self.parallel_categories = parallel_categories
+        self.projections_url = projections_url
+        self.player_url = player_url
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self._page_rows = 0
+
+    async def __aenter__(self):
+        """Start Playwright session when entering context."""
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        self.context = await self._new_context()
+        self.page = await self.context.new_page()
+        return self
+
+    async def _new_context(self):
+        """Open a browser context with the resource policy installed."""
+        assert self.browser, "Browser is not initialized"
+        context = await self.browser.new_context()
+        if self.resource_policy:
+            await context.route("**/*", self.resource_policy.handle_route_async)
+            context.on("response", self.resource_policy.record_response)
+        return context
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close browser and stop Playwright when exiting context."""
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+
+    async def scrape_players(self, player_limit: int = 500) -> List[Player]:
+        """Scrape player data from ESPN Fantasy Baseball.
+
+        Args:
+            player_limit: Maximum number of players to scrape per category (batters/pitchers)
+
+        Returns:
+            List of Player objects, in the same order as ``ESPNScraper``
+        """
+        if self.parallel_categories:
+            all_players = await self._scrape_categories_in_parallel(player_limit)
+        else:
+            print("Navigating to ESPN Fantasy Baseball players page...")
+            assert self.page, "Page object is not initialized"
+            await self.page.goto(self.projections_url)
+            await self.waits.wait_async(self.page, "navigation")
+
+            print(f"Scraping player data with {self.concurrency} workers...")
+            all_players = []
+            for index in range(len(CATEGORIES)):
+                all_players.extend(await self._scrape_category_tab(index, player_limit))
+
+        print(f"Total players scraped: {len(all_players)}")
+        if self.resource_policy:
+            print(self.resource_policy.summary())
+        if self.throttle.requests:
+            print(self.throttle.summary())
+        return all_players
+
+    async def _scrape_category_tab(self, index: int, player_limit: int) -> List[Player]:
+        """Switch to a category tab if needed and scrape it.
+
+        Args:
+            index: Position of the category in CATEGORIES
+            player_limit: Maximum number of players to scrape
+
+        Returns:
+            List of Player objects with their player_type set
+        """
+        assert self.page, "Page object is None"
+        category, label = CATEGORIES[index]
+        if index > 0:
+            print(f"Switching to {label.upper()} tab...")
+            before = await self.waits.snapshot_async(self.page, "pagination")
+            await self.page.click(f'label:has-text("{label}")')
+            await self.waits.wait_async(self.page, "pagination", before)
+
+        print(f"Scraping {label.upper()}...")
+        players = await self._scrape_player_category(player_limit, category)
+        print(f"Scraped {len(players)} {label.lower()}")
+        for player in players:
+            player.player_type = category
+        return players
+
+    async def _scrape_categories_in_parallel(self, player_limit: int) -> List[Player]:
+        """Scrape every category at once, each in an isolated browser context.
+
+        A failing category is reported and left out; the others still finish.
+
+        Args:
+            player_limit: Maximum number of players to scrape per category
+
+        Returns:
+            List of Player objects, in category order
+        """
+        print(
+            f"Scraping {len(CATEGORIES)} categories in parallel with "
+            f"{self.concurrency} workers each..."
+        )
+        results = await asyncio.gather(
+            *(
+                self._scrape_category_in_context(index, player_limit)
+                for index in range(len(CATEGORIES))
+            ),
+            return_exceptions=True,
+        )
+
+        all_players = []
+        for (category, label), result in zip(CATEGORIES, results):
+            if isinstance(result, BaseException):
+                print(f"Error scraping {label.lower()}: {result}")
+                continue
+            all_players.extend(result)
+        return all_players
+
+    async def _scrape_category_in_context(self, index: int, player_limit: int) -> List[Player]:
+        """Scrape one category on a fresh context and projections page.
+
+        Args:
+            index: Position of the category in CATEGORIES
+            player_limit: Maximum number of players to scrape
+
+        Returns:
+            List of Player objects with their player_type set
+        """
+        context = await self._new_context()
+        try:
+            # A shallow copy shares the browser and settings but gets its own
+            # context and table page
+            scraper = copy.copy(self)
+            scraper.context = context
+            scraper.page = await context.new_page()
+            await scraper.page.goto(scraper.projections_url)
+            await scraper.waits.wait_async(scraper.page, "navigation")
+            return await scraper._scrape_category_tab(index, player_limit)
+        finally:
+            await context.close()
+
+    async def _scrape_player_category(
+        self, player_limit: int = 500, category: str = "batter"
+    ) -> List[Player]:
+        """Scrape players from the current category tab using the worker pool.
+
+        Args:
+            player_limit: Maximum number of players to scrape
+            category: Player type of the current tab, used to report failures
+
+        Returns:
+            List of Player objects
+        """
+        assert self.context, "Browser context is None"
+        queue: asyncio.Queue = asyncio.Queue()
+        results: Dict[int, Player] = {}
+        pool = AsyncPagePool(self.context.new_page, self.concurrency, self.max_page_uses)
+        workers = [
+            asyncio.create_task(self._worker(queue, results, pool, category))
+            for _ in range(self.concurrency)
+        ]
+
+        players: List[Player] = []
+        page_num = 1
+        row_offset = 0
+        try:
+            while len(players) < player_limit:
+                print(f"Processing page {page_num}...")
+                results.clear()
+                link_count = await self._enqueue_current_page(queue, row_offset)
+                await queue.join()
+                row_offset += self._page_rows
+                players.extend(results[i] for i in sorted(results))
+                print(f"Scraped {len(results)} of {link_count} players on page {page_num}")
+
+                if len(players) >= player_limit:
+                    print(f"Reached player limit ({player_limit}). Stopping.")
+                    players = players[:player_limit]
+                    break
+
+                if not await self._go_to_next_page():
+                    print("No more pages to process")
+                    break
+                page_num += 1
+        finally:
+            for _ in workers:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+            await pool.close_async()
+            if pool.recycled:
+                print(pool.summary())
+
+        return players
+
+    async def _go_to_next_page(self) -> bool:
+        """Advance the projections table to the next page.
+
+        Returns:
+            True if a next page was loaded, False if this was the last page
+        """
+        assert self.page, "Page object is None"
+        next_button = self.page.locator('button[class*="next"]')
+        if await next_button.count() > 0 and await next_button.is_enabled():
+            before = await self.waits.snapshot_async(self.page, "pagination")
+            await next_button.click()
+            await self.waits.wait_async(self.page, "pagination", before)
+            return True
+        return False
+
+    async def _enqueue_current_page(self, queue: asyncio.Queue, row_offset: int = 0) -> int:
+        """Collect player links from the current table page onto the queue.
+
+        Each link is queued with its player's rank, the row position in the
+        category table.
+
+        Args:
+            queue: Work queue shared with the player page workers
+            row_offset: Rows on the category's earlier table pages
+
+        Returns:
+            Number of links that were queued
+        """
+        assert self.page, "Page object is None"
+        records = await self.page.evaluate(ROWS_SCRIPT)
+        player_rows = self.page.locator('div[class*="players-table"]').locator(
+            'div[class*="player-info-section"]'
+        )
+
+        print(f"Found {len(records)} players on current page")
+        self._page_rows = len(records)
+
+        queued = 0
+        for i, record in enumerate(records):
+            try:
+                if self.navigation == "direct":
+                    link = parse_row_link(record, self.player_url)
+                    if link is None:
+                        raise ValueError(f"no player ID in row for {record.get('name')}")
+                    item = (link.name, link.url)
+                else:
+                    name = (record.get("name") or "").strip()
+                    item = await self._collect_player_link(player_rows.nth(i), name)
+            except Exception as e:
+                print(f"Error collecting player link: {e}")
+                continue
+            await queue.put((row_offset + i + 1, item))
+            queued += 1
+        return queued
+
+    async def _collect_player_link(self, player_row, player_name: str) -> Tuple[str, str]:
+        """Read the "Complete Stats" link for a table row from its player modal.
+
+        Args:
+            player_row: Locator for the row's player info section
+            player_name: Player name read from the row
+
+        Returns:
+            Tuple of (player name, Complete Stats URL)
+        """
+        assert self.page, "Page object is None"
+        player_name_element = player_row.locator('div[class*="player-name"] a')
+
+        await player_name_element.click()
+        complete_stats = self.page.locator('a:has-text("Complete Stats")').first
+        await complete_stats.wait_for()
+        url = await complete_stats.get_attribute("href")
+
+        if await self.page.is_visible('div[role="dialog"]'):
+            await self.page.keyboard.press("Escape")
+
+        if not url:
+            raise ValueError(f"No Complete Stats link for {player_name}")
+        return player_name, urljoin(self.page.url, url)
+
+    async def _worker(
+        self,
+        queue: asyncio.Queue,
+        results: Dict[int, Player],
+        pool: AsyncPagePool,
+        category: str = "batter",
+    ) -> None:
+        """Scrape queued player links on pooled pages until told to stop.
+
+        Args:
+            queue: Work queue of ``(rank, (name, url))`` items; ``None`` stops the worker
+            results: Mapping of rank to scraped player, filled in by workers
+            pool: Player pages shared by the workers
+            category: Player type of the queued links, used to report failures
+        """
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                rank, (player_name, url) = item
+                with self.timer.phase("player"):
+                    player = await self.throttle.call_async(
+                        partial(self._scrape_player_page, pool, url),
+                        player_name,
+                        url,
+                        category,
+                    )
+                player.rank = rank
+                results[rank] = player
+                print(f"Scraped player: {player_name}")
+            except Exception as e:
+                print(f"Error scraping player: {e}")
+            finally:
+                queue.task_done()
+
+    async def _scrape_player_page(self, pool: AsyncPagePool, url: str) -> Player:
+        """Scrape one player page on a pooled page.
+
+        Args:
+            pool: Player pages shared by the workers
+            url: Player page URL
+
+        Returns:
+            The scraped player
+        """
+        async with pool.page_async() as page:
+            with self.timer.phase("player_goto"):
+                await page.goto(url)
+            await self.waits.wait_async(page, "player")
+            return await self._scrape_player_data(page)
+
+    async def _scrape_player_data(self, page: Page) -> Player:
+        """Scrape player data from the player page.
+
+        Args:
+            page: The Playwright page object for the player page
+
+        Returns:
+            Player object with scraped data
+        """
+        with self.timer.phase("extract"):
+            return parse_player_header(await page.evaluate(PLAYER_HEADER_SCRIPT), page.url)
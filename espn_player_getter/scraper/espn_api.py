@@ -0,0 +1,255 @@
+import datetime
+from typing import Iterable, List, Optional
+
+from espn_player_getter.models.player import Player
+
+# Background requests made by the projections page for its player list
+PLAYER_API_PATH = "/apis/v3/games/flb/"
+PLAYER_API_VIEW = "kona_player_info"
+
+# The player list API itself, as called by the projections page
+API_URL_TEMPLATE = (
+    "https://lm-api-reads.fantasy.espn.com/apis/v3/games/flb/seasons/{season}"
+    "/segments/0/leaguedefaults/3?view=kona_player_info"
+)
+
+# Month in which ESPN opens the new fantasy baseball season and its projections
+SEASON_START_MONTH = 2
+FILTER_HEADER = "X-Fantasy-Filter"
+
+# Roster slots the projections page filters on for each category tab
+# (batters: C through UTIL, pitchers: P, SP and RP)
+CATEGORY_SLOT_IDS = {
+    "batter": list(range(0, 13)),
+    "pitcher": [13, 14, 15],
+}
+
+PRO_TEAMS = {
+    0: "FA", 1: "BAL", 2: "BOS", 3: "LAA", 4: "CHW", 5: "CLE", 6: "DET",
+    7: "KC", 8: "MIL", 9: "MIN", 10: "NYY", 11: "OAK", 12: "SEA", 13: "TEX",
+    14: "TOR", 15: "ATL", 16: "CHC", 17: "CIN", 18: "HOU", 19: "LAD",
+    20: "WSH", 21: "NYM", 22: "PHI", 23: "PIT", 24: "STL", 25: "SD",
+    26: "SF", 27: "COL", 28: "MIA", 29: "ARI", 30: "TB",
+}
+
+# defaultPositionId -> primary position
+POSITIONS = {
+    1: "SP", 2: "C", 3: "1B", 4: "2B", 5: "3B", 6: "SS",
+    7: "LF", 8: "CF", 9: "RF", 10: "DH", 11: "RP",
+}
+
+# eligibleSlots -> position, limited to real fielding positions
+# (roster slots like UTIL, P, bench and IL are left out)
+SLOT_POSITIONS = {
+    0: "C", 1: "1B", 2: "2B", 3: "3B", 4: "SS", 5: "OF",
+    8: "LF", 9: "CF", 10: "RF", 11: "DH", 14: "SP", 15: "RP",
+}
+
+PITCHER_POSITION_IDS = {1, 11}
+
+STATS = {
+    0: "AB", 1: "H", 2: "AVG", 3: "2B", 4: "3B", 5: "HR", 6: "XBH", 7: "1B",
+    8: "TB", 9: "SLG", 10: "BB", 11: "IBB", 12: "HBP", 13: "SF", 14: "SH",
+    16: "PA", 17: "OBP", 18: "OPS", 20: "R", 21: "RBI", 23: "SB", 24: "CS",
+    26: "GDP", 27: "SO", 32: "GP", 33: "GS", 34: "OUTS", 35: "TBF",
+    36: "P", 37: "P_H", 38: "OBA", 39: "P_BB", 41: "WHIP", 44: "P_R",
+    45: "ER", 46: "P_HR", 47: "ERA", 48: "K", 49: "K/9", 53: "W", 54: "L",
+    56: "SVO", 57: "SV", 60: "HLD", 62: "CG", 63: "QS", 81: "G",
+    82: "K/BB", 83: "SVHD",
+}
+
+# Stat entries with this source are projections, 0 would be actuals
+PROJECTED_STAT_SOURCE = 1
+SEASON_SPLIT = 0
+
+
+def current_season(today: Optional[datetime.date] = None) -> int:
+    """Fantasy season the projections page shows on a given day.
+
+    The new season opens in February; before that the page still shows
+    the previous one.
+
+    Args:
+        today: Day to check, today by default
+
+    Returns:
+        Season year
+    """
+    today = today or datetime.date.today()
+    return today.year if today.month >= SEASON_START_MONTH else today.year - 1
+
+
+def player_api_url(season: Optional[int] = None) -> str:
+    """Player list API URL of a season.
+
+    Args:
+        season: Season year, current_season() by default
+
+    Returns:
+        API URL including the kona_player_info view
+    """
+    return API_URL_TEMPLATE.format(season=season or current_season())
+
+
+def is_player_payload_url(url: str) -> bool:
+    """Check whether a response URL is one of the player list API calls.
+
+    Args:
+        url: URL of a response seen by the page
+
+    Returns:
+        True if the response should carry a player list payload
+    """
+    return PLAYER_API_PATH in url and PLAYER_API_VIEW in url
+
+
+def player_filter(category: str, offset: int, limit: int) -> dict:
+    """Build the X-Fantasy-Filter value for one page of a category.
+
+    Args:
+        category: "batter" or "pitcher"
+        offset: Index of the first player of the page
+        limit: Players per page
+
+    Returns:
+        Filter object to send as JSON in the FILTER_HEADER request header
+    """
+    return {
+        "players": {
+            "filterSlotIds": {"value": CATEGORY_SLOT_IDS[category]},
+            "filterStatsForSourceIds": {"value": [PROJECTED_STAT_SOURCE]},
+            "filterStatsForSplitTypeIds": {"value": [SEASON_SPLIT]},
+            "sortDraftRanks": {"sortPriority": 1, "sortAsc": True, "value": "STANDARD"},
+            "offset": offset,
+            "limit": limit,
+        }
+    }
+
+
+def parse_players_payload(payload: dict) -> List[Player]:
+    """Build Player objects from a player list API payload.
+
+    Args:
+        payload: Decoded JSON body with a top-level "players" list
+
+    Returns:
+        List of Player objects in payload order
+    """
+    players = []
+    for entry in payload.get("players", []):
+        player = parse_player_entry(entry)
+        if player is not None:
+            players.append(player)
+    return players
+
+
+def parse_player_entry(entry: dict) -> Optional[Player]:
+    """Build a Player from one entry of the "players" list.
+
+    Args:
+        entry: Player list entry, with the player fields under "player"
+
+    Returns:
+        Player object, or None if the entry has no player ID
+    """
+    info = entry.get("player", entry)
+    player_id = info.get("id", entry.get("id"))
+    if player_id is None:
+        return None
+
+    position_id = info.get("defaultPositionId")
+    position = POSITIONS.get(position_id, "")
+    eligible_positions = [position] if position else []
+    for slot in info.get("eligibleSlots", []):
+        slot_position = SLOT_POSITIONS.get(slot)
+        if slot_position and slot_position not in eligible_positions:
+            eligible_positions.append(slot_position)
+
+    return Player(
+        id=str(player_id),
+        name=info.get("fullName", ""),
+        team=PRO_TEAMS.get(info.get("proTeamId"), ""),
+        position=position,
+        eligible_positions=eligible_positions,
+        player_type="pitcher" if position_id in PITCHER_POSITION_IDS else "batter",
+        stats=parse_stats(info.get("stats", [])),
+    )
+
+
+def parse_stats(stat_entries: Iterable[dict]) -> Optional[dict]:
+    """Pick the season projection out of a player's stat entries.
+
+    Args:
+        stat_entries: The player's "stats" list from the API payload
+
+    Returns:
+        Dictionary of stat name to value, or None if there is no projection
+    """
+    for entry in stat_entries:
+        if (
+            entry.get("statSourceId") == PROJECTED_STAT_SOURCE
+            and entry.get("statSplitTypeId") == SEASON_SPLIT
+        ):
+            return {
+                STATS.get(int(stat_id), str(stat_id)): value
+                for stat_id, value in entry.get("stats", {}).items()
+            }
+    return None
+
+
+# Projections table column labels whose stat is named differently in STATS;
+# pitchers' hitting-against columns reuse the batter labels
+TABLE_COLUMN_STATS = {
+    "batter": {"K": "SO"},
+    "pitcher": {"H": "P_H", "BB": "P_BB", "HR": "P_HR", "R": "P_R", "SO": "K", "IP": "OUTS"},
+}
+
+
+def parse_stat_value(text: str) -> Optional[float]:
+    """Parse a projections table cell such as "42", ".285" or "1,204".
+
+    Returns:
+        The value, or None for blank and "--" cells
+    """
+    text = (text or "").replace(",", "").strip()
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def innings_to_outs(text: str) -> Optional[float]:
+    """Convert an innings pitched cell ("180.1" is 180 1/3 innings) to outs."""
+    whole, _, thirds = (text or "").strip().partition(".")
+    if not whole.isdigit() or (thirds and not thirds.isdigit()):
+        return None
+    return float(int(whole) * 3 + int(thirds or 0))
+
+
+def parse_projection_columns(
+    columns: List[str], values: List[str], category: str
+) -> Optional[dict]:
+    """Build a stats dictionary from a row of the projections table.
+
+    Stat names match the ones ``parse_stats`` reads from the API, so table
+    and network extraction produce the same keys.
+
+    Args:
+        columns: Column labels, e.g. ["", "AB", "R", "HR"]
+        values: Cells of the projection row, aligned with the columns
+        category: "batter" or "pitcher", which decides ambiguous labels
+
+    Returns:
+        Dictionary of stat name to value, or None if no cell had a value
+    """
+    renames = TABLE_COLUMN_STATS.get(category, {})
+    stats = {}
+    for label, text in zip(columns, values):
+        label = label.strip()
+        if not label:
+            continue
+        name = renames.get(label, label)
+        value = innings_to_outs(text) if name == "OUTS" else parse_stat_value(text)
+        if value is not None:
+            stats[name] = value
+    return stats or None
@@ -1,35 +1,367 @@
-from typing import List
+import re
+from functools import partial
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlparse
 
 from playwright.sync_api import Page, sync_playwright
 
+from espn_player_getter.cache import PlayerCache
+from espn_player_getter.checkpoint import CheckpointJournal
 from espn_player_getter.models.player import Player
+from espn_player_getter.profiling import NULL_TIMER, PhaseTimer
+from espn_player_getter.scraper.espn_api import (
+    is_player_payload_url,
+    parse_players_payload,
+    parse_projection_columns,
+)
+from espn_player_getter.scraper.memory import MemoryMonitor
+from espn_player_getter.scraper.page_pool import PagePool
+from espn_player_getter.scraper.resource_policy import ResourcePolicy
+from espn_player_getter.scraper.settings import (
+    CATEGORIES,
+    DEFAULT_MAX_PAGE_USES,
+    EXTRACTION_MODES,
+    NAVIGATION_MODES,
+)
+from espn_player_getter.scraper.throttle import Throttle
+from espn_player_getter.scraper.waits import ROWS_SELECTOR, WaitPlan
 
 ESPN_URL = "https://fantasy.espn.com/baseball/players/projections"
+PLAYER_URL = "https://www.espn.com/mlb/player/_/id/{player_id}"
+# Reads every table row on the page in one call: the name plus any
+# ID-bearing attributes
+ROWS_SCRIPT = f"""
+() => Array.from(document.querySelectorAll('{ROWS_SELECTOR}'), row => {{
+    const name = row.querySelector('div[class*="player-name"] a');
+    const tagged = row.closest("[data-player-id]") || row.querySelector("[data-player-id]");
+    return {{
+        name: name ? name.innerText : "",
+        player_id: tagged ? tagged.getAttribute("data-player-id") : null,
+        hrefs: Array.from(row.querySelectorAll("a[href]"), a => a.getAttribute("href")),
+        srcs: Array.from(row.querySelectorAll("img[src]"), img => img.getAttribute("src")),
+    }};
+}})
+"""
+
+# Reads every table row with its team, positions and projected stat columns
+# in one call; the projection is the row of the player's stats table
+# labelled "Projections", or its last row
+TABLE_SCRIPT = f"""
+() => Array.from(document.querySelectorAll('{ROWS_SELECTOR}'), row => {{
+    const name = row.querySelector('div[class*="player-name"] a');
+    const tagged = row.closest("[data-player-id]") || row.querySelector("[data-player-id]");
+    const text = selector => {{
+        const element = row.querySelector(selector);
+        return element ? element.innerText : "";
+    }};
+    const table = row.querySelector("table");
+    const rows = table ? Array.from(table.querySelectorAll("tbody tr")) : [];
+    const projection = rows.find(tr => /projection/i.test(tr.innerText)) || rows[rows.length - 1];
+    return {{
+        name: name ? name.innerText : "",
+        player_id: tagged ? tagged.getAttribute("data-player-id") : null,
+        hrefs: Array.from(row.querySelectorAll("a[href]"), a => a.getAttribute("href")),
+        srcs: Array.from(row.querySelectorAll("img[src]"), img => img.getAttribute("src")),
+        team: text('[class*="playerteam"]'),
+        positions: text('[class*="playerpos"]'),
+        columns: table ? Array.from(table.querySelectorAll("thead th"), th => th.innerText) : [],
+        values: projection ? Array.from(projection.querySelectorAll("td, th"), td => td.innerText) : [],
+    }};
+}})
+"""
+
+# Reads the player page header in one call; list items are matched the same
+# way as the li:has-text() selectors (case-insensitive substring)
+PLAYER_HEADER_SCRIPT = """
+() => {
+    const header = document.querySelector("div.PlayerHeader");
+    if (!header) return null;
+    const title = header.querySelector("h1");
+    const items = Array.from(header.querySelectorAll("li"));
+    const item = label => {
+        const li = items.find(li => li.innerText.toLowerCase().includes(label.toLowerCase()));
+        return li ? li.innerText : null;
+    };
+    return {
+        name: title ? title.innerText : null,
+        team: item("Team"),
+        position: item("Position"),
+    };
+}
+"""
+
+_ID_PATTERNS = (
+    re.compile(r"/id/(\d+)"),
+    re.compile(r"/players/full/(\d+)\."),
+)
+
+
+def parse_player_id(value: str) -> Optional[str]:
+    """Extract an ESPN player ID from a player page link or headshot URL.
+
+    Args:
+        value: URL or path, e.g. ``/mlb/player/_/id/33192/aaron-judge``
+
+    Returns:
+        Player ID, or None if the value carries none
+    """
+    for pattern in _ID_PATTERNS:
+        match = pattern.search(value or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+class PlayerLink(NamedTuple):
+    """A player's Complete Stats page, as read from a projections table row."""
+    name: str
+    player_id: str
+    url: str
+
+
+def parse_row_link(record: dict, player_url: str = PLAYER_URL) -> Optional[PlayerLink]:
+    """Build a PlayerLink from a row record returned by ``ROWS_SCRIPT``.
+
+    Args:
+        record: Row record with name, player_id, hrefs and srcs keys
+        player_url: Player page URL template with a ``{player_id}`` field
+
+    Returns:
+        PlayerLink, or None if the row markup carries no player ID
+    """
+    player_id = record.get("player_id")
+    candidates = (record.get("hrefs") or []) + (record.get("srcs") or [])
+    for value in candidates:
+        if player_id:
+            break
+        player_id = parse_player_id(value)
+    if not player_id:
+        return None
+    return PlayerLink(
+        name=(record.get("name") or "").strip(),
+        player_id=str(player_id),
+        url=player_url.format(player_id=player_id),
+    )
+
+
+def parse_table_row(
+    record: dict, category: str, player_url: str = PLAYER_URL
+) -> Optional[Player]:
+    """Build a Player from a row record returned by ``TABLE_SCRIPT``.
+
+    Args:
+        record: Row record with the ``ROWS_SCRIPT`` keys plus team, positions,
+            columns and values
+        category: Player type of the table, "batter" or "pitcher"
+        player_url: Player page URL template with a ``{player_id}`` field
+
+    Returns:
+        Player with projected stats, or None if the row carries no player ID
+    """
+    link = parse_row_link(record, player_url)
+    if link is None:
+        return None
+    positions = [pos.strip() for pos in (record.get("positions") or "").split(",") if pos.strip()]
+    return Player(
+        id=link.player_id,
+        name=link.name,
+        team=(record.get("team") or "").strip(),
+        position=positions[0] if positions else "",
+        eligible_positions=positions,
+        player_type=category,
+        stats=parse_projection_columns(
+            record.get("columns") or [], record.get("values") or [], category
+        ),
+    )
+
+
+def parse_player_header(record: Optional[dict], url: str) -> Player:
+    """Build a Player from the header record returned by ``PLAYER_HEADER_SCRIPT``.
+
+    Args:
+        record: Header record with name, team and position keys
+        url: URL of the player page, holding the player ID as in row links
+
+    Returns:
+        Player object with header data
+
+    Raises:
+        ValueError: If the page has no player header
+    """
+    if not record or record.get("name") is None:
+        raise ValueError(f"No player header found on {url}")
+
+    # Read the ID as row links are read, so cache and journal lookups match;
+    # fall back to the last path segment for URLs without an /id/ part
+    player_id = parse_player_id(url) or urlparse(url).path.rstrip("/").split("/")[-1]
+
+    team = (record.get("team") or "").replace("Team", "").strip()
+    position = (record.get("position") or "").replace("Position", "").strip()
+
+    # Parse eligible positions from the position string
+    eligible_positions = [pos.strip() for pos in position.split(",")]
+    primary_position = eligible_positions[0] if eligible_positions else ""
+
+    return Player(
+        id=player_id,
+        name=record["name"],
+        team=team,
+        position=primary_position,
+        eligible_positions=eligible_positions,
+    )
 
 
 class ESPNScraper:
     """Scraper for ESPN Fantasy Baseball player data."""
 
-    def __init__(self, headless: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        navigation: str = "modal",
+        extraction: str = "dom",
+        resource_policy: Optional[ResourcePolicy] = None,
+        wait_strategies: Optional[Dict[str, str]] = None,
+        journal: Optional[CheckpointJournal] = None,
+        cache: Optional[PlayerCache] = None,
+        shard: Optional[Tuple[int, int]] = None,
+        projections_url: str = ESPN_URL,
+        player_url: str = PLAYER_URL,
+        profiler: Optional[PhaseTimer] = None,
+        max_page_uses: int = DEFAULT_MAX_PAGE_USES,
+        throttle: Optional[Throttle] = None,
+        memory: Optional[MemoryMonitor] = None,
+        record_har_path: Optional[str] = None,
+        replay_har_path: Optional[str] = None,
+        replay_latency_ms: float = 0,
+    ):
         """Initialize the scraper.
 
         Args:
             headless: Whether to run browser in headless mode
+            navigation: How player pages are reached, either "modal" (click the
+                row, then "Complete Stats") or "direct" (visit the player URL
+                built from the row markup)
+            extraction: Where player data comes from: "dom" (scrape each
+                player page), "network" (capture the JSON player list the
+                projections page loads in the background) or "table" (read
+                team, positions and projected stats from the table rows,
+                without opening any player page)
+            resource_policy: Optional policy for aborting unneeded requests
+                (images, fonts, ads, analytics) on the browser context
+            wait_strategies: Readiness strategy per step ("navigation",
+                "pagination", "player"), overriding the WaitPlan defaults
+            journal: Optional checkpoint journal; players it already holds
+                are skipped and scraping resumes at its category and page
+            cache: Optional player cache; players with a fresh entry are taken
+                from it instead of opening their player page
+            shard: Optional (K, N) to scrape only shard K of N (1-based) of
+                each category's table pages
+            projections_url: Projections page to scrape, e.g. a local stand-in
+            player_url: Player page URL template used by direct navigation
+            profiler: Optional timer recording how long each phase takes,
+                per player and per page
+            max_page_uses: Player visits after which the pooled player page
+                is closed and replaced by a fresh one
+            throttle: Pacing, retry and circuit breaker settings for player
+                pages, defaults to Throttle()
+            memory: Memory sampling and browser recycling limits, defaults to
+                MemoryMonitor(), which samples without recycling
+            record_har_path: Record every network exchange of the run into
+                this HAR file (.har, or .zip to store bodies as separate files)
+            replay_har_path: Answer every request from this recorded HAR file
+                instead of the network; requests missing from it are aborted
+            replay_latency_ms: Delay added to every replayed response
         """
+        if navigation not in NAVIGATION_MODES:
+            raise ValueError(f"Unknown navigation mode: {navigation}")
+        if extraction not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction}")
+        if shard and not 1 <= shard[0] <= shard[1]:
+            raise ValueError(f"Invalid shard {shard[0]}/{shard[1]}")
+        if record_har_path and replay_har_path:
+            raise ValueError("Cannot record and replay a HAR file in the same run")
+        if replay_latency_ms < 0:
+            raise ValueError("replay_latency_ms must not be negative")
+        memory = memory or MemoryMonitor()
+        if record_har_path and (memory.max_players or memory.max_rss_mb):
+            # Every recycled context would overwrite the recording
+            raise ValueError("Browser recycling is not supported while recording a HAR file")
         self.headless = headless
+        self.navigation = navigation
+        self.extraction = extraction
+        self.resource_policy = resource_policy
+        self.timer = profiler or NULL_TIMER
+        self.waits = WaitPlan(wait_strategies, timer=self.timer)
+        self.throttle = throttle or Throttle()
+        self.memory = memory
+        self.journal = journal
+        self.cache = cache
+        self.shard = shard
+        self.projections_url = projections_url
+        self.player_url = player_url
+        self.record_har_path = record_har_path
+        self.replay_har_path = replay_har_path
+        self.replay_latency_ms = replay_latency_ms
         self.playwright = None
         self.browser = None
+        self.context = None
         self.page = None
+        # Player pages are reused across players instead of opening a tab each
+        self.page_pool = PagePool(self._open_player_page, size=1, max_uses=max_page_uses)
+        self._captured_responses = []
+        self._captured_ids = set()
+        self._category = CATEGORIES[0][0]
+        self._page_num = 1
+        self._row_offset = 0
+        self._page_rows = 0
 
     def __enter__(self):
         """Start Playwright session when entering context."""
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=self.headless)
-        self.page = self.browser.new_page()
+        with self.timer.phase("launch"):
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.launch(headless=self.headless)
+            self._open_context()
         return self
 
+    def _open_context(self) -> None:
+        """Open a browser context and its projections page."""
+        assert self.browser, "Browser is not initialized"
+        if self.record_har_path:
+            self.context = self.browser.new_context(record_har_path=self.record_har_path)
+        else:
+            self.context = self.browser.new_context()
+        # Route handlers run newest first: the resource policy, then the
+        # replay latency, then the HAR file
+        if self.replay_har_path:
+            self.context.route_from_har(self.replay_har_path, not_found="abort")
+            if self.replay_latency_ms:
+                self.context.route("**/*", self._delay_replayed_route)
+        if self.resource_policy:
+            self.context.route("**/*", self.resource_policy.handle_route)
+            self.context.on("response", self.resource_policy.record_response)
+        self.page = self.context.new_page()
+        if self.extraction == "network":
+            self.page.on("response", self._capture_response)
+
+    def _delay_replayed_route(self, route) -> None:
+        """Hold a replayed request for the replay latency, then let the HAR file answer it.
+
+        Playwright runs each route handler in its own greenlet, so waiting
+        here delays this response only, not the others.
+        """
+        assert self.page, "Page object is None"
+        self.page.wait_for_timeout(self.replay_latency_ms)
+        route.fallback()
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Close browser and stop Playwright when exiting context."""
+        if self.cache:
+            self.cache.save()
+        self.page_pool.close()
+        if self.record_har_path and self.context:
+            # The HAR file is written when its context closes
+            self.context.close()
+            print(f"Recorded network traffic to {self.record_har_path}")
         if self.browser:
             self.browser.close()
         if self.playwright:
@@ -44,181 +376,626 @@ class ESPNScraper:
         Returns:
             List of Player objects
         """
-        print("Navigating to ESPN Fantasy Baseball players page...")
-        assert self.page, "Page object is not initialized"
-        self.page.goto(ESPN_URL)
-        self.page.wait_for_load_state("networkidle")
+        return list(self.iter_players(player_limit))
 
-        print("Scraping player data...")
-        all_players = []
+    def iter_players(
+        self, player_limit: int = 500, categories: Optional[Sequence[str]] = None
+    ) -> Iterator[Player]:
+        """Scrape player data, yielding each player as soon as it is extracted.
 
-        # First scrape batters (default tab)
-        print("Scraping BATTERS...")
-        batters = self._scrape_player_category(player_limit)
-        print(f"Scraped {len(batters)} batters")
+        Consumers can write or process players while the scrape is still
+        running; stopping the iteration early stops the scrape. The scraper
+        may be iterated again for another run on the same browser.
 
-        # Add player_type field to batters
-        for player in batters:
-            player.player_type = "batter"
-        all_players.extend(batters)
+        Args:
+            player_limit: Maximum number of players to scrape per category (batters/pitchers)
+            categories: Player types to scrape ("batter", "pitcher"), all by default
 
-        # Switch to pitchers tab
-        print("Switching to PITCHERS tab...")
-        self.page.click('label:has-text("Pitchers")')
-        self.page.wait_for_load_state("networkidle")
+        Yields:
+            Player objects, batters first
+        """
+        print("Navigating to ESPN Fantasy Baseball players page...")
+        assert self.page, "Page object is not initialized"
+        self._captured_responses = []
+        with self.timer.phase("goto"):
+            self.page.goto(self.projections_url)
+        self.waits.wait(self.page, "navigation")
 
-        # Then scrape pitchers
-        print("Scraping PITCHERS...")
-        pitchers = self._scrape_player_category(player_limit)
-        print(f"Scraped {len(pitchers)} pitchers")
+        print("Scraping player data...")
+        total = 0
 
-        # Add player_type field to pitchers
-        for player in pitchers:
-            player.player_type = "pitcher"
-        all_players.extend(pitchers)
+        for index, (category, label) in enumerate(CATEGORIES):
+            if categories is not None and category not in categories:
+                continue
+            if index > 0:
+                self._switch_tab(label)
+
+            print(f"Scraping {label.upper()}...")
+            count = 0
+            for player in self._iter_player_category(player_limit, category):
+                # Add player_type field to the category's players
+                player.player_type = category
+                count += 1
+                yield player
+            print(f"Scraped {count} {label.lower()}")
+            total += count
+
+        print(f"Total players scraped: {total}")
+        if self.resource_policy:
+            print(self.resource_policy.summary())
+        if self.cache:
+            print(self.cache.summary())
+        if self.page_pool.created:
+            print(self.page_pool.summary())
+        if self.throttle.requests:
+            print(self.throttle.summary())
+        if self.memory.samples:
+            print(self.memory.summary())
+
+    def _switch_tab(self, label: str) -> None:
+        """Switch the projections table to a category's tab."""
+        assert self.page, "Page object is None"
+        print(f"Switching to {label.upper()} tab...")
+        before = self.waits.snapshot(self.page, "pagination")
+        # Drop responses of the previous tab that were never read, e.g. the
+        # batters list loaded with the page when batters are skipped or
+        # already journaled, so they are not taken for this tab's players
+        self._captured_responses = []
+        with self.timer.phase("tab_click"):
+            self.page.click(f'label:has-text("{label}")')
+        self.waits.wait(self.page, "pagination", before)
+
+    def _recycle(self, category: str, target_page: int, reason: str) -> int:
+        """Replace the browser context, then reopen the table at a category's page.
+
+        Closing the context frees the memory its pages built up. If the
+        browser is still over the memory limit afterwards, it is relaunched
+        too.
 
-        print(f"Total players scraped: {len(all_players)}")
-        return all_players
+        Args:
+            category: Player type whose tab to reopen
+            target_page: Table page to continue from
+            reason: Why the recycle is due, for the log
 
-    def _scrape_player_category(self, player_limit: int = 500) -> List[Player]:
+        Returns:
+            Page reached, lower than the target if the table ran out
+        """
+        assert self.browser and self.context and self.playwright, "Browser is not initialized"
+        print(f"Recycling the browser context ({reason})...")
+        with self.timer.phase("recycle"):
+            self.page_pool.close()
+            self.context.close()
+            self.memory.sample()
+            relaunched = self.memory.over_memory_limit()
+            if relaunched:
+                print("Browser memory is still over the limit, relaunching the browser...")
+                self.browser.close()
+                self.browser = self.playwright.chromium.launch(headless=self.headless)
+            self._open_context()
+            self.memory.recycled(relaunched)
+
+            self._captured_responses = []
+            with self.timer.phase("goto"):
+                self.page.goto(self.projections_url)
+            self.waits.wait(self.page, "navigation")
+            index = [name for name, _ in CATEGORIES].index(category)
+            if index > 0:
+                self._switch_tab(CATEGORIES[index][1])
+            page_num, _ = self._skip_to_page(target_page)
+        return page_num
+
+    def _open_player_page(self) -> Page:
+        """Open a page for the player page pool."""
+        assert self.context, "Browser context is None"
+        return self.context.new_page()
+
+    def _scrape_player_category(
+        self, player_limit: int = 500, category: str = "batter"
+    ) -> List[Player]:
         """Scrape players from the current category tab (batters or pitchers).
 
         Args:
             player_limit: Maximum number of players to scrape
+            category: Player type of the current tab, used for checkpointing
 
         Returns:
             List of Player objects
         """
-        players = []
-        page_num = 1
-        has_next_page = True
+        return list(self._iter_player_category(player_limit, category))
+
+    def _iter_player_category(
+        self, player_limit: int = 500, category: str = "batter"
+    ) -> Iterator[Player]:
+        """Yield players from the current category tab as they are extracted.
 
-        while has_next_page and len(players) < player_limit:
-            print(f"Processing page {page_num}...")
-            # Process current page players
-            current_page_players = self._process_current_page()
-            players.extend(current_page_players)
+        When sharded, only the table pages owned by this shard are scraped and
+        the limit counts table rows rather than scraped players, so that the
+        shards together cover exactly the rows an unsharded run would.
+
+        Args:
+            player_limit: Maximum number of players to scrape
+            category: Player type of the current tab, used for checkpointing
+
+        Yields:
+            Player objects, journaled players first
+        """
+        self._category = category
+        self._captured_ids.clear()
+
+        if self.journal and self.journal.is_category_done(category):
+            players = self.journal.players(category)[:player_limit]
+            print(f"Using {len(players)} journaled players from the finished {category} category")
+            yield from players
+            return
+
+        count = 0
+        for player in self.journal.players(category)[:player_limit] if self.journal else []:
+            count += 1
+            yield player
+        page_num, row_offset = 1, 0
+        if self.journal and count < player_limit:
+            page_num, row_offset = self._skip_to_page(self.journal.resume_page(category))
+
+        while self._below_limit(count, row_offset, player_limit):
+            self._page_num = page_num
+            self._row_offset = row_offset
+            if self._owns_page(page_num):
+                print(f"Processing page {page_num}...")
+                # Process current page players
+                max_rows = player_limit - row_offset if self.shard else None
+                with self.timer.phase("page"):
+                    for player in self._iter_current_page(max_rows):
+                        count += 1
+                        self.memory.record_player()
+                        yield player
+                        if not self._below_limit(count, row_offset, player_limit):
+                            # Stop before scraping rows past the limit
+                            break
+            else:
+                print(f"Skipping page {page_num} (owned by another shard)")
+                self._page_rows = self._count_current_page()
+            row_offset += self._page_rows
+            if self.journal:
+                self.journal.record_page(category, page_num)
 
             # Check if we've reached the player limit
-            if len(players) >= player_limit:
+            if not self._below_limit(count, row_offset, player_limit):
                 print(f"Reached player limit ({player_limit}). Stopping.")
-                # Trim to exact limit
-                if len(players) > player_limit:
-                    players = players[:player_limit]
                 break
 
-            # Check if there's a next page and navigate to it
-            assert self.page, "Page object is None"
-            next_button = self.page.locator('button[class*="next"]')
-            if next_button.count() > 0 and next_button.is_enabled():
-                next_button.click()
-                self.page.wait_for_load_state("networkidle")
-                page_num += 1
+            # Go to the next page, on a fresh browser context if one is due
+            reason = self.memory.recycle_reason()
+            if reason:
+                next_page = self._recycle(category, page_num + 1, reason)
+            elif self._go_to_next_page():
+                next_page = page_num + 1
             else:
-                has_next_page = False
+                next_page = page_num
+            if next_page <= page_num:
                 print("No more pages to process")
+                break
+            page_num = next_page
 
-        return players
+        if self.journal:
+            self.journal.record_category(category)
 
-    def _process_current_page(self) -> List[Player]:
+    def _owns_page(self, page_num: int) -> bool:
+        """Check whether a table page belongs to this scraper's shard.
+
+        Pages are dealt out round-robin: shard K of N owns pages K, K+N, K+2N...
+        """
+        if not self.shard:
+            return True
+        index, total = self.shard
+        return (page_num - 1) % total == index - 1
+
+    def _below_limit(self, count: int, row_offset: int, player_limit: int) -> bool:
+        """Check whether the category still needs more players."""
+        if self.shard:
+            return row_offset < player_limit
+        return count < player_limit
+
+    def _go_to_next_page(self) -> bool:
+        """Advance the projections table to the next page.
+
+        Returns:
+            True if a next page was loaded, False if this was the last page
+        """
+        assert self.page, "Page object is None"
+        next_button = self.page.locator('button[class*="next"]')
+        if next_button.count() > 0 and next_button.is_enabled():
+            before = self.waits.snapshot(self.page, "pagination")
+            with self.timer.phase("pagination_click"):
+                next_button.click()
+            self.waits.wait(self.page, "pagination", before)
+            return True
+        return False
+
+    def _skip_to_page(self, target_page: int) -> Tuple[int, int]:
+        """Page forward through the table without scraping, to resume a run.
+
+        Args:
+            target_page: Table page to stop on
+
+        Returns:
+            Tuple of (page reached, rows on the pages skipped); the page is
+            lower than the target if the table ran out
+        """
+        page_num, row_offset = 1, 0
+        if target_page > 1:
+            print(f"Skipping ahead to page {target_page}...")
+        while page_num < target_page:
+            row_offset += self._count_current_page()
+            if not self._go_to_next_page():
+                break
+            page_num += 1
+        return page_num, row_offset
+
+    def _count_current_page(self) -> int:
+        """Count the player rows on the current table page without scraping them."""
+        if self.extraction == "network":
+            return len(self._drain_captured_players())
+        assert self.page, "Page object is None"
+        return len(self.page.evaluate(ROWS_SCRIPT))
+
+    def _is_journaled(self, player_id: Optional[str]) -> bool:
+        """Check whether a player was already scraped by an earlier run."""
+        return bool(
+            self.journal
+            and player_id
+            and self.journal.has_player(self._category, player_id)
+        )
+
+    def _cached_player(self, link: Optional[PlayerLink], rank: int) -> Optional[Player]:
+        """Take a player from the cache instead of opening its page.
+
+        Args:
+            link: Row link carrying the player ID, if the row markup had one
+            rank: The player's row position in the category table
+
+        Returns:
+            The cached player (already journaled), or None if it must be scraped
+        """
+        if not (self.cache and link):
+            return None
+        player = self.cache.get(link.player_id)
+        if player is not None:
+            player.rank = rank
+            self._record_player(player)
+            print(f"Using cached player: {link.name}")
+        return player
+
+    def _scraped_player(self, player: Player, rank: int) -> None:
+        """Journal and cache a player that was just scraped from its page."""
+        player.rank = rank
+        self._record_player(player)
+        if self.cache:
+            self.cache.put(player)
+
+    def _record_player(self, player: Player) -> None:
+        """Write a freshly scraped player to the checkpoint journal."""
+        if self.journal:
+            self.journal.record_player(self._category, self._page_num, player)
+
+    def _process_current_page(self, max_rows: Optional[int] = None) -> List[Player]:
         """Process the current page of players.
 
+        Args:
+            max_rows: Only process this many rows from the top of the page
+
         Returns:
             List of Player objects from the current page
         """
-        current_page_players = []
+        return list(self._iter_current_page(max_rows))
 
-        # Get the player table
+    def _iter_current_page(self, max_rows: Optional[int] = None) -> Iterator[Player]:
+        """Yield the players of the current page as they are extracted.
+
+        Args:
+            max_rows: Only process this many rows from the top of the page
+
+        Yields:
+            Player objects in table order
+        """
+        if self.extraction == "network":
+            yield from self._iter_captured_players(max_rows)
+            return
+        if self.extraction == "table":
+            yield from self._iter_table_rows(max_rows)
+            return
+
+        # Read all rows in one round trip; locators are only used for clicks
         assert self.page, "Page object is None"
-        players_table = self.page.locator('div[class*="players-table"]')
+        with self.timer.phase("rows"):
+            rows = self.page.evaluate(ROWS_SCRIPT)
+        self._page_rows = len(rows)
+        print(f"Found {len(rows)} players on current page")
+        if max_rows is not None:
+            rows = rows[:max_rows]
+
+        if self.navigation == "direct":
+            yield from self._iter_rows_direct(rows)
+        else:
+            yield from self._iter_rows_modal(rows)
 
-        # Get all player rows
-        player_rows = players_table.locator('div[class*="player-info-section"]')
-        player_count = player_rows.count()
+    def _iter_rows_modal(self, rows: List[dict]) -> Iterator[Player]:
+        """Scrape rows by opening each player card and its Complete Stats page.
 
-        print(f"Found {player_count} players on current page")
+        Each player is yielded once its page and card are closed again, so
+        the consumer may stop between players.
+
+        Args:
+            rows: Row records from ``ROWS_SCRIPT``, in table order
+
+        Yields:
+            Player objects from the rows
+        """
+        assert self.page, "Page object is None"
+        player_rows = self.page.locator('div[class*="players-table"]').locator(
+            'div[class*="player-info-section"]'
+        )
 
-        for i in range(player_count):
+        for i, row in enumerate(rows):
+            rank = self._row_offset + i + 1
+            player = None
             try:
-                # Get the row element
-                player_row = player_rows.nth(i)
+                player_name = (row.get("name") or "").strip()
+                link = parse_row_link(row, self.player_url)
+                if link and self._is_journaled(link.player_id):
+                    print(f"Skipping journaled player: {player_name}")
+                    continue
+                player = self._cached_player(link, rank)
+                if player is None:
+                    with self.timer.phase("player"):
+                        player = self.throttle.call(
+                            partial(self._scrape_player_modal, player_rows.nth(i), rank),
+                            player_name,
+                            link.url if link else "",
+                            self._category,
+                        )
+                    print(f"Scraped player: {player_name}")
 
-                # Find and click the player name element to open the player card
-                player_name_element = player_row.locator('div[class*="player-name"] a')
-                player_name = player_name_element.inner_text()
+            except Exception as e:
+                print(f"Error scraping player: {e}")
+                continue
 
-                # Click to open the player modal
-                player_name_element.click()
-                self.page.wait_for_selector('text="Complete Stats"')
+            if player is not None:
+                yield player
 
-                # Open Complete Stats in a new page
-                with self.page.context.expect_page() as new_page_info:
-                    self.page.click('text="Complete Stats"')
-                player_page = new_page_info.value
-                player_page.wait_for_load_state("networkidle")
+    def _scrape_player_modal(self, player_row, rank: int) -> Optional[Player]:
+        """Scrape one row through its player card and Complete Stats page.
 
-                # Scrape player info from the player page
-                player_data = self._scrape_player_data(player_page)
-                current_page_players.append(player_data)
+        Args:
+            player_row: Locator for the row's player info section
+            rank: The player's row position in the category table
 
-                # Close the player page
-                player_page.close()
+        Returns:
+            The scraped player, or None if the player turned out to be journaled
+        """
+        assert self.page, "Page object is None"
+        player = None
 
-                # Close the player modal if it's still open
-                if self.page.is_visible('div[role="dialog"]'):
-                    self.page.press("Escape", key="Enter")
+        # Find the player name element that opens the player card
+        player_name_element = player_row.locator('div[class*="player-name"] a')
 
-                print(f"Scraped player: {player_name}")
+        # Click to open the player modal
+        with self.timer.phase("modal_open"):
+            player_name_element.click()
+            self.page.wait_for_selector('text="Complete Stats"')
+        href = self.page.locator('a:has-text("Complete Stats")').first.get_attribute("href")
 
+        if not href:
+            # No link target to navigate to; let the card open its own tab
+            return self._scrape_player_popup(rank)
+
+        # Close the player modal and visit Complete Stats on a pooled page
+        with self.timer.phase("player_close"):
+            if self.page.is_visible('div[role="dialog"]'):
+                self.page.keyboard.press("Escape")
+        with self.page_pool.page() as player_page:
+            with self.timer.phase("player_goto"):
+                player_page.goto(urljoin(self.page.url, href))
+            self.waits.wait(player_page, "player")
+
+            # Scrape player info from the player page
+            player_data = self._scrape_player_data(player_page)
+        if not self._is_journaled(player_data.id):
+            player = player_data
+            self._scraped_player(player_data, rank)
+
+        return player
+
+    def _scrape_player_popup(self, rank: int) -> Optional[Player]:
+        """Scrape the open player card by clicking Complete Stats into a new tab.
+
+        Args:
+            rank: The player's row position in the category table
+
+        Returns:
+            The scraped player, or None if the player turned out to be journaled
+        """
+        assert self.page, "Page object is None"
+        player = None
+
+        # Open Complete Stats in a new page
+        with self.timer.phase("popup"):
+            with self.page.context.expect_page() as new_page_info:
+                self.page.click('text="Complete Stats"')
+            player_page = new_page_info.value
+        self.waits.wait(player_page, "player")
+
+        # Scrape player info from the player page
+        player_data = self._scrape_player_data(player_page)
+        if not self._is_journaled(player_data.id):
+            player = player_data
+            self._scraped_player(player_data, rank)
+
+        with self.timer.phase("player_close"):
+            # Close the player page
+            player_page.close()
+
+            # Close the player modal if it's still open
+            if self.page.is_visible('div[role="dialog"]'):
+                self.page.keyboard.press("Escape")
+
+        return player
+
+    def _capture_response(self, response) -> None:
+        """Keep player list API responses seen by the projections page.
+
+        Bodies are read later from the scraping loop rather than inside the
+        event handler.
+
+        Args:
+            response: Playwright response object
+        """
+        if is_player_payload_url(response.url):
+            self._captured_responses.append(response)
+
+    def _drain_captured_players(self) -> List[Player]:
+        """Parse the API responses captured since the last call.
+
+        Returns:
+            Players not seen before in this category, in payload order
+        """
+        players = []
+        responses, self._captured_responses = self._captured_responses, []
+
+        for response in responses:
+            try:
+                with self.timer.phase("payload_read"):
+                    payload = response.json()
             except Exception as e:
-                print(f"Error scraping player: {e}")
+                print(f"Error reading player payload: {e}")
                 continue
+            with self.timer.phase("payload_parse"):
+                parsed = parse_players_payload(payload)
+            for player in parsed:
+                if player.id in self._captured_ids:
+                    continue
+                self._captured_ids.add(player.id)
+                players.append(player)
+
+        print(f"Captured {len(players)} players from {len(responses)} responses")
+        return players
 
-        return current_page_players
+    def _iter_captured_players(self, max_rows: Optional[int] = None) -> Iterator[Player]:
+        """Yield players from the API responses captured since the last call.
 
-    def _scrape_player_data(self, page: Page) -> Player:
-        """Scrape player data from the player page.
+        Args:
+            max_rows: Only keep this many players from the top of the page
+
+        Yields:
+            Player objects, skipping IDs already seen in this category
+        """
+        captured = self._drain_captured_players()
+        self._page_rows = len(captured)
+        if max_rows is not None:
+            captured = captured[:max_rows]
+
+        for i, player in enumerate(captured):
+            if self._is_journaled(player.id):
+                continue
+            player.rank = self._row_offset + i + 1
+            self._record_player(player)
+            yield player
+
+    def _iter_table_rows(self, max_rows: Optional[int] = None) -> Iterator[Player]:
+        """Yield players read straight from the current table page's rows.
 
         Args:
-            page: The Playwright page object for the player page
+            max_rows: Only keep this many rows from the top of the page
 
-        Returns:
-            Player object with scraped data
+        Yields:
+            Player objects with projected stats, in table order
         """
-        # Get player header div
-        player_header = page.locator("div.PlayerHeader")
+        assert self.page, "Page object is None"
+        with self.timer.phase("rows"):
+            rows = self.page.evaluate(TABLE_SCRIPT)
+        self._page_rows = len(rows)
+        print(f"Found {len(rows)} players on current page")
+        if max_rows is not None:
+            rows = rows[:max_rows]
+
+        for i, row in enumerate(rows):
+            player = parse_table_row(row, self._category, self.player_url)
+            if player is None:
+                print(f"Error scraping player: no player ID in row for {row.get('name')}")
+                continue
+            if self._is_journaled(player.id):
+                continue
+            player.rank = self._row_offset + i + 1
+            self._record_player(player)
+            yield player
 
-        # Get player ID from URL
-        url = page.url
-        player_id = url.split("/")[-1]
+    def _iter_rows_direct(self, rows: List[dict]) -> Iterator[Player]:
+        """Scrape rows by visiting each player's URL directly.
 
-        # Get player name
-        name = player_header.locator("h1").inner_text()
+        The table page is left untouched, so pagination continues from it
+        afterwards, and pooled player pages are reused for every visit.
 
-        # Get team name
-        team_element = player_header.locator('li:has-text("Team")')
-        team = (
-            team_element.inner_text().replace("Team", "").strip()
-            if team_element.count() > 0
-            else ""
-        )
+        Args:
+            rows: Row records from ``ROWS_SCRIPT``, in table order
 
-        # Get player position
-        position_element = player_header.locator('li:has-text("Position")')
-        position = (
-            position_element.inner_text().replace("Position", "").strip()
-            if position_element.count() > 0
-            else ""
-        )
+        Yields:
+            Player objects from the rows
+        """
+        for i, row in enumerate(rows):
+            rank = self._row_offset + i + 1
+            link = parse_row_link(row, self.player_url)
+            if link is None:
+                print(f"Error scraping player: no player ID in row for {row.get('name')}")
+                continue
+            if self._is_journaled(link.player_id):
+                print(f"Skipping journaled player: {link.name}")
+                continue
+            cached = self._cached_player(link, rank)
+            if cached:
+                yield cached
+                continue
+            try:
+                with self.timer.phase("player"):
+                    player_data = self.throttle.call(
+                        partial(self._scrape_player_direct, link, rank),
+                        link.name,
+                        link.url,
+                        self._category,
+                    )
+                print(f"Scraped player: {link.name}")
+
+            except Exception as e:
+                print(f"Error scraping player: {e}")
+                continue
 
-        # Parse eligible positions from the position string
-        eligible_positions = [pos.strip() for pos in position.split(",")]
-        primary_position = eligible_positions[0] if eligible_positions else ""
+            yield player_data
 
-        return Player(
-            id=player_id,
-            name=name,
-            team=team,
-            position=primary_position,
-            eligible_positions=eligible_positions,
-        )
+    def _scrape_player_direct(self, link: PlayerLink, rank: int) -> Player:
+        """Scrape one player by visiting its URL on a pooled page.
+
+        Args:
+            link: Row link with the player page URL
+            rank: The player's row position in the category table
+
+        Returns:
+            The scraped player
+        """
+        with self.page_pool.page() as player_page:
+            with self.timer.phase("player_goto"):
+                player_page.goto(link.url)
+            self.waits.wait(player_page, "player")
+
+            player_data = self._scrape_player_data(player_page)
+        self._scraped_player(player_data, rank)
+        return player_data
+
+    def _scrape_player_data(self, page: Page) -> Player:
+        """Scrape player data from the player page.
+
+        Args:
+            page: The Playwright page object for the player page
+
+        Returns:
+            Player object with scraped data
+        """
+        with self.timer.phase("extract"):
+            return parse_player_header(page.evaluate(PLAYER_HEADER_SCRIPT), page.url)
@@ -0,0 +1,287 @@
+import gzip
+import http.client
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from espn_player_getter.models.player import Player
+from espn_player_getter.profiling import NULL_TIMER, PhaseTimer
+from espn_player_getter.scraper.espn_api import (
+    FILTER_HEADER,
+    parse_players_payload,
+    player_api_url,
+    player_filter,
+)
+from espn_player_getter.scraper.settings import CATEGORIES
+
+# Players requested per API call
+PAGE_SIZE = 50
+
+# Errors that mean a kept-alive connection was closed by the server while idle
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class APIError(RuntimeError):
+    """The player list API answered with an error status."""
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections to one host, shared between threads.
+
+    Connections are returned to the pool after each response and reused by
+    the next request, so pages after the first skip the TCP and TLS
+    handshakes. Responses are requested gzip-compressed and decoded here.
+    """
+
+    def __init__(self, url: str, size: int = 4, timeout: float = 30.0):
+        """Initialize the pool.
+
+        Args:
+            url: Any URL on the host to connect to
+            size: Maximum number of idle connections kept open
+            timeout: Socket timeout in seconds
+        """
+        parsed = urlparse(url)
+        self.https = parsed.scheme == "https"
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.size = size
+        self.timeout = timeout
+        self.created = 0
+        self.requests = 0
+        self.gzipped = 0
+        self._lock = threading.Lock()
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """Open a new connection to the host."""
+        connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        with self._lock:
+            self.created += 1
+        return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        """Take an idle connection, or open one if none is free."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        """Keep a connection for reuse, unless enough are idle already."""
+        if self._idle.qsize() < self.size:
+            self._idle.put(connection)
+        else:
+            connection.close()
+
+    def get(self, path: str, headers: Optional[Dict[str, str]] = None) -> bytes:
+        """GET a path on the host and return the decoded body.
+
+        A request on a kept-alive connection the server has since closed is
+        repeated once on a fresh connection.
+
+        Args:
+            path: Path and query string
+            headers: Extra request headers
+
+        Returns:
+            Response body, gunzipped if it was compressed
+
+        Raises:
+            APIError: If the response status is not 2xx
+        """
+        headers = {"Accept-Encoding": "gzip", "Connection": "keep-alive", **(headers or {})}
+        connection = self._acquire()
+        try:
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                connection.close()
+                connection = self._connect()
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+            body = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        with self._lock:
+            self.requests += 1
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            with self._lock:
+                self.gzipped += 1
+            body = gzip.decompress(body)
+        if not 200 <= response.status < 300:
+            raise APIError(f"{response.status} {response.reason} for {path}")
+        return body
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def summary(self) -> str:
+        """Describe how well connections were reused."""
+        return (
+            f"HTTP: {self.requests} requests over {self.created} connections, "
+            f"{self.gzipped} gzip responses"
+        )
+
+
+class HTTPScraper:
+    """Scraper that reads players straight from the fantasy player list API.
+
+    No browser is started: each category is paged through with concurrent
+    requests over a keep-alive connection pool. Players are the same as
+    those of ``ESPNScraper(extraction="network")``, ranked by their position
+    in the API's ordering.
+    """
+
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        concurrency: int = 4,
+        timeout: float = 30.0,
+        profiler: Optional[PhaseTimer] = None,
+    ):
+        """Initialize the scraper.
+
+        Args:
+            api_url: Player list API URL, e.g. of a local stand-in; the
+                current season's ESPN API by default
+            page_size: Players requested per API call
+            concurrency: Number of pages requested at the same time
+            timeout: Socket timeout in seconds
+            profiler: Optional timer recording how long each page request takes
+        """
+        if page_size < 1 or concurrency < 1:
+            raise ValueError("page_size and concurrency must be at least 1")
+        self.api_url = api_url or player_api_url()
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.timer = profiler or NULL_TIMER
+        self.pool: Optional[ConnectionPool] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self):
+        """Open the connection pool and request threads."""
+        self.pool = ConnectionPool(self.api_url, size=self.concurrency, timeout=self.timeout)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop the request threads and close the connections."""
+        if self.executor:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+        if self.pool:
+            self.pool.close()
+
+    def scrape_players(self, player_limit: int = 500) -> List[Player]:
+        """Fetch player data from the player list API.
+
+        Args:
+            player_limit: Maximum number of players to fetch per category (batters/pitchers)
+
+        Returns:
+            List of Player objects
+        """
+        return list(self.iter_players(player_limit))
+
+    def iter_players(
+        self, player_limit: int = 500, categories: Optional[Sequence[str]] = None
+    ) -> Iterator[Player]:
+        """Fetch player data, yielding players in order as their pages arrive.
+
+        Args:
+            player_limit: Maximum number of players to fetch per category (batters/pitchers)
+            categories: Player types to fetch ("batter", "pitcher"), all by default
+
+        Yields:
+            Player objects, batters first
+        """
+        assert self.pool, "Connection pool is not initialized"
+        print(f"Fetching player data from {self.api_url} with {self.concurrency} connections...")
+        total = 0
+        for category, label in CATEGORIES:
+            if categories is not None and category not in categories:
+                continue
+            count = 0
+            for player in self._iter_category(category, player_limit):
+                count += 1
+                yield player
+            print(f"Fetched {count} {label.lower()}")
+            total += count
+
+        print(f"Total players fetched: {total}")
+        print(self.pool.summary())
+
+    def _iter_category(self, category: str, player_limit: int) -> Iterator[Player]:
+        """Yield a category's players, requesting up to ``concurrency`` pages at once.
+
+        Pages are requested in waves; a page shorter than ``page_size`` is
+        the last one.
+
+        Args:
+            category: "batter" or "pitcher"
+            player_limit: Maximum number of players to yield
+
+        Yields:
+            Player objects with their player_type and rank set
+        """
+        assert self.executor, "Request threads are not initialized"
+        count = 0
+        offset = 0
+        while count < player_limit:
+            offsets = [
+                offset + i * self.page_size
+                for i in range(self.concurrency)
+                if offset + i * self.page_size < player_limit
+            ]
+            pages = self.executor.map(partial(self._fetch_page, category), offsets)
+            for page_offset, players in zip(offsets, pages):
+                for i, player in enumerate(players[:player_limit - count]):
+                    player.player_type = category
+                    player.rank = page_offset + i + 1
+                    count += 1
+                    yield player
+                if len(players) < self.page_size:
+                    return
+            offset = offsets[-1] + self.page_size
+
+    def _fetch_page(self, category: str, offset: int) -> List[Player]:
+        """Request one page of a category from the API.
+
+        Args:
+            category: "batter" or "pitcher"
+            offset: Index of the first player of the page
+
+        Returns:
+            Player objects in API order
+        """
+        assert self.pool, "Connection pool is not initialized"
+        parsed = urlparse(self.api_url)
+        path = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+        headers = {FILTER_HEADER: json.dumps(player_filter(category, offset, self.page_size))}
+        with self.timer.phase("api_page"):
+            body = self.pool.get(path, headers)
+        with self.timer.phase("payload_parse"):
+            return parse_players_payload(json.loads(body))
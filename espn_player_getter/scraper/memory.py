@@ -0,0 +1,169 @@
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+MB = 1024 * 1024
+
+# Seconds between memory samples taken while players are scraped
+DEFAULT_SAMPLE_INTERVAL = 1.0
+
+
+def read_rss(pid: int) -> int:
+    """Resident set size of a process in bytes, 0 if it cannot be read.
+
+    Reads ``/proc``, so memory is only measured on Linux.
+    """
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def descendant_pids(pid: int) -> List[int]:
+    """Process IDs of every descendant of a process (children, their children...)."""
+    children: Dict[int, List[int]] = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name is in parentheses and may itself contain spaces
+        fields = stat[stat.rfind(")") + 2:].split()
+        if len(fields) > 1:
+            children.setdefault(int(fields[1]), []).append(int(entry))
+
+    found, pending = [], [pid]
+    while pending:
+        for child in children.get(pending.pop(), []):
+            found.append(child)
+            pending.append(child)
+    return found
+
+
+def sample_rss(pid: Optional[int] = None) -> Tuple[int, int]:
+    """Measure the memory of a Python process and of the browser it started.
+
+    Args:
+        pid: Python process ID, this process by default
+
+    Returns:
+        Tuple of (Python RSS, summed RSS of its descendant processes: the
+        Playwright driver and the browser with its renderer processes), in bytes
+    """
+    pid = pid or os.getpid()
+    return read_rss(pid), sum(read_rss(child) for child in descendant_pids(pid))
+
+
+class MemoryMonitor:
+    """Samples memory during a scrape and decides when the browser should be recycled.
+
+    Recycling is due once ``max_players`` players were scraped since the
+    last recycle, or once the browser's memory reaches ``max_rss_mb``.
+    Without either limit the monitor only reports peak and average memory.
+    """
+
+    def __init__(
+        self,
+        max_players: Optional[int] = None,
+        max_rss_mb: Optional[float] = None,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        sampler: Callable[[], Tuple[int, int]] = sample_rss,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            max_players: Players after which the browser context is recycled
+            max_rss_mb: Browser memory in MB at which the context is recycled,
+                and the browser relaunched if recycling the context is not enough
+            sample_interval: Least seconds between samples taken per player
+            sampler: Function returning (Python RSS, browser RSS) in bytes,
+                replaceable in tests
+            clock: Monotonic clock, replaceable in tests
+        """
+        if max_players is not None and max_players < 1:
+            raise ValueError("max_players must be at least 1")
+        if max_rss_mb is not None and max_rss_mb <= 0:
+            raise ValueError("max_rss_mb must be positive")
+        self.max_players = max_players
+        self.max_rss_mb = max_rss_mb
+        self.sample_interval = sample_interval
+        self.sampler = sampler
+        self.clock = clock
+        self.samples = 0
+        self.python_peak = 0
+        self.browser_peak = 0
+        self.python_total = 0
+        self.browser_total = 0
+        self.browser_rss = 0
+        self.players_since_recycle = 0
+        self.context_recycles = 0
+        self.browser_relaunches = 0
+        self._last_sample: Optional[float] = None
+
+    def sample(self) -> None:
+        """Measure memory now."""
+        python_rss, browser_rss = self.sampler()
+        self._last_sample = self.clock()
+        self.samples += 1
+        self.python_total += python_rss
+        self.browser_total += browser_rss
+        self.python_peak = max(self.python_peak, python_rss)
+        self.browser_peak = max(self.browser_peak, browser_rss)
+        self.browser_rss = browser_rss
+
+    def record_player(self) -> None:
+        """Count a scraped player, sampling if the last sample is old enough."""
+        self.players_since_recycle += 1
+        if self._last_sample is None or self.clock() - self._last_sample >= self.sample_interval:
+            self.sample()
+
+    def over_memory_limit(self) -> bool:
+        """Check whether the last sample reached the browser memory limit."""
+        return self.max_rss_mb is not None and self.browser_rss >= self.max_rss_mb * MB
+
+    def recycle_reason(self) -> Optional[str]:
+        """Sample memory and say why the browser should be recycled now, if it should.
+
+        Returns:
+            Human readable reason, or None if no limit is reached
+        """
+        if self.max_players is None and self.max_rss_mb is None:
+            return None
+        self.sample()
+        if self.max_players is not None and self.players_since_recycle >= self.max_players:
+            return f"{self.players_since_recycle} players since the last recycle"
+        if self.over_memory_limit():
+            return f"browser memory at {self.browser_rss / MB:.0f}MB"
+        return None
+
+    def recycled(self, relaunched: bool = False) -> None:
+        """Record a recycled context (and relaunched browser) and restart the player count."""
+        self.players_since_recycle = 0
+        self.context_recycles += 1
+        if relaunched:
+            self.browser_relaunches += 1
+
+    def summary(self) -> str:
+        """Describe peak and average memory and how often the browser was recycled."""
+        if not self.samples:
+            return "Memory: no samples"
+        return (
+            f"Memory: Python peak {self.python_peak / MB:.0f}MB, "
+            f"avg {self.python_total / self.samples / MB:.0f}MB; "
+            f"browser peak {self.browser_peak / MB:.0f}MB, "
+            f"avg {self.browser_total / self.samples / MB:.0f}MB "
+            f"({self.samples} samples); context recycled {self.context_recycles} times, "
+            f"browser relaunched {self.browser_relaunches} times"
+        )
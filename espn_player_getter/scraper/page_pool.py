@@ -0,0 +1,171 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Awaitable, Callable, Deque, Dict
+
+from espn_player_getter.scraper.settings import DEFAULT_MAX_PAGE_USES
+
+
+class PagePool:
+    """Fixed set of warm pages reused by navigation instead of new tabs.
+
+    Pages are created on demand up to ``size`` and handed out with
+    ``page()``. A page is closed and later replaced after ``max_uses``
+    uses, or straight away if the work done on it raised.
+    """
+
+    def __init__(
+        self,
+        new_page: Callable[[], object],
+        size: int = 1,
+        max_uses: int = DEFAULT_MAX_PAGE_USES,
+    ):
+        """Initialize the pool.
+
+        Args:
+            new_page: Function opening a new page, e.g. ``context.new_page``
+            size: Maximum number of pages open at once
+            max_uses: Uses after which a page is recycled
+        """
+        if size < 1 or max_uses < 1:
+            raise ValueError("Page pool size and max uses must be at least 1")
+        self.new_page = new_page
+        self.size = size
+        self.max_uses = max_uses
+        self.created = 0
+        self.recycled = 0
+        self._idle: Deque = deque()
+        self._uses: Dict[int, int] = {}
+
+    @property
+    def open_pages(self) -> int:
+        """Number of pages currently open, idle or in use."""
+        return len(self._uses)
+
+    def acquire(self):
+        """Take an idle page, opening one if the pool is not full.
+
+        Raises:
+            RuntimeError: If every page is in use
+        """
+        if self._idle:
+            return self._idle.popleft()
+        if self.open_pages >= self.size:
+            raise RuntimeError(f"All {self.size} pooled pages are in use")
+        page = self.new_page()
+        self.created += 1
+        self._uses[id(page)] = 0
+        return page
+
+    def release(self, page, failed: bool = False) -> None:
+        """Return a page to the pool, recycling it if it is worn out or failed."""
+        self._uses[id(page)] += 1
+        if failed or self._uses[id(page)] >= self.max_uses:
+            self._discard(page)
+        else:
+            self._idle.append(page)
+
+    @contextmanager
+    def page(self):
+        """Borrow a page for one unit of work."""
+        page = self.acquire()
+        try:
+            yield page
+        except BaseException:
+            self.release(page, failed=True)
+            raise
+        self.release(page)
+
+    def _discard(self, page) -> None:
+        """Close a page and forget it."""
+        del self._uses[id(page)]
+        self.recycled += 1
+        try:
+            page.close()
+        except Exception as e:
+            print(f"Error closing pooled page: {e}")
+
+    def close(self) -> None:
+        """Close every idle page."""
+        while self._idle:
+            page = self._idle.popleft()
+            del self._uses[id(page)]
+            try:
+                page.close()
+            except Exception as e:
+                print(f"Error closing pooled page: {e}")
+
+    def summary(self) -> str:
+        """Describe how many pages were opened and recycled."""
+        return f"Page pool: {self.created} pages opened, {self.recycled} recycled"
+
+
+class AsyncPagePool(PagePool):
+    """Async version of PagePool; callers wait for a page when all are busy."""
+
+    def __init__(
+        self,
+        new_page: Callable[[], Awaitable[object]],
+        size: int = 1,
+        max_uses: int = DEFAULT_MAX_PAGE_USES,
+    ):
+        """Initialize the pool.
+
+        Args:
+            new_page: Coroutine function opening a new page
+            size: Maximum number of pages open at once
+            max_uses: Uses after which a page is recycled
+        """
+        super().__init__(new_page, size, max_uses)
+        self._slots = asyncio.Semaphore(size)
+
+    async def acquire_async(self):
+        """Take an idle page, opening one if needed, waiting while all are busy."""
+        await self._slots.acquire()
+        if self._idle:
+            return self._idle.popleft()
+        try:
+            page = await self.new_page()
+        except BaseException:
+            self._slots.release()
+            raise
+        self.created += 1
+        self._uses[id(page)] = 0
+        return page
+
+    async def release_async(self, page, failed: bool = False) -> None:
+        """Return a page to the pool, recycling it if it is worn out or failed."""
+        self._uses[id(page)] += 1
+        try:
+            if failed or self._uses[id(page)] >= self.max_uses:
+                del self._uses[id(page)]
+                self.recycled += 1
+                try:
+                    await page.close()
+                except Exception as e:
+                    print(f"Error closing pooled page: {e}")
+            else:
+                self._idle.append(page)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def page_async(self):
+        """Borrow a page for one unit of work."""
+        page = await self.acquire_async()
+        try:
+            yield page
+        except BaseException:
+            await self.release_async(page, failed=True)
+            raise
+        await self.release_async(page)
+
+    async def close_async(self) -> None:
+        """Close every idle page."""
+        while self._idle:
+            page = self._idle.popleft()
+            del self._uses[id(page)]
+            try:
+                await page.close()
+            except Exception as e:
+                print(f"Error closing pooled page: {e}")
@@ -0,0 +1,142 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Set
+from urllib.parse import urlparse
+
+# Resource types nothing in the scraper reads
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Ad, tracking and analytics hosts loaded by ESPN pages
+DEFAULT_BLOCKED_HOSTS = frozenset({
+    "2mdn.net",
+    "adnxs.com",
+    "adsafeprotected.com",
+    "amazon-adsystem.com",
+    "bluekai.com",
+    "casalemedia.com",
+    "chartbeat.com",
+    "chartbeat.net",
+    "criteo.com",
+    "demdex.net",
+    "doubleclick.net",
+    "facebook.net",
+    "google-analytics.com",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "hotjar.com",
+    "krxd.net",
+    "moatads.com",
+    "nr-data.net",
+    "omtrdc.net",
+    "optimizely.com",
+    "outbrain.com",
+    "pubmatic.com",
+    "rubiconproject.com",
+    "scorecardresearch.com",
+    "taboola.com",
+})
+
+
+def _host_matches(host: str, domains: Iterable[str]) -> bool:
+    """Check whether a host is one of the domains or a subdomain of one."""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+@dataclass
+class ResourcePolicy:
+    """Decides which browser requests are aborted, and counts what it saw.
+
+    Allowed hosts always win, so a host can be exempted from both the
+    resource type and the host deny lists.
+    """
+    blocked_resource_types: Set[str] = field(
+        default_factory=lambda: set(DEFAULT_BLOCKED_RESOURCE_TYPES)
+    )
+    blocked_hosts: Set[str] = field(default_factory=lambda: set(DEFAULT_BLOCKED_HOSTS))
+    allowed_hosts: Set[str] = field(default_factory=set)
+    blocked_requests: int = 0
+    allowed_requests: int = 0
+    allowed_bytes: int = 0
+    blocked_by_reason: Counter = field(default_factory=Counter)
+
+    def block_reason(self, url: str, resource_type: str) -> Optional[str]:
+        """Work out whether a request should be aborted.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type, e.g. "image" or "script"
+
+        Returns:
+            Reason such as "type:image" or "host:doubleclick.net", or None to let it through
+        """
+        host = (urlparse(url).hostname or "").lower()
+        if _host_matches(host, self.allowed_hosts):
+            return None
+        if resource_type in self.blocked_resource_types:
+            return f"type:{resource_type}"
+        for domain in self.blocked_hosts:
+            if host == domain or host.endswith("." + domain):
+                return f"host:{domain}"
+        return None
+
+    def check(self, url: str, resource_type: str) -> bool:
+        """Decide on a request and record the outcome.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type
+
+        Returns:
+            True if the request should be aborted
+        """
+        reason = self.block_reason(url, resource_type)
+        if reason is None:
+            self.allowed_requests += 1
+            return False
+        self.blocked_requests += 1
+        self.blocked_by_reason[reason] += 1
+        return True
+
+    def handle_route(self, route) -> None:
+        """Route handler for the sync Playwright API.
+
+        Allowed requests fall back to earlier route handlers, such as HAR
+        replay, before going to the network.
+        """
+        request = route.request
+        if self.check(request.url, request.resource_type):
+            route.abort()
+        else:
+            route.fallback()
+
+    async def handle_route_async(self, route) -> None:
+        """Route handler for the async Playwright API."""
+        request = route.request
+        if self.check(request.url, request.resource_type):
+            await route.abort()
+        else:
+            await route.fallback()
+
+    def record_response(self, response) -> None:
+        """Add a response's declared size to the allowed byte count.
+
+        Aborted requests never reach the network, so their size cannot be
+        known; the allowed byte count shows what a run still downloads.
+
+        Args:
+            response: Playwright response object
+        """
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.allowed_bytes += int(length)
+
+    def summary(self) -> str:
+        """Describe the blocked and allowed traffic of the run so far."""
+        lines = [
+            f"Blocked {self.blocked_requests} requests, allowed {self.allowed_requests} "
+            f"({self.allowed_bytes / 1_000_000:.1f} MB declared)"
+        ]
+        for reason, count in self.blocked_by_reason.most_common(10):
+            lines.append(f"  {reason}: {count}")
+        return "\n".join(lines)
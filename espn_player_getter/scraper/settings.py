@@ -0,0 +1,13 @@
+# Scraper choices shared by the scrapers and the CLI. This module imports
+# neither Playwright nor asyncio, so the CLI can offer these options without
+# paying for either until a scrape actually starts.
+
+NAVIGATION_MODES = ("modal", "direct")
+EXTRACTION_MODES = ("dom", "network", "table")
+
+# (player_type, tab label) in the order the tabs are scraped
+CATEGORIES = (("batter", "Batters"), ("pitcher", "Pitchers"))
+
+# Uses after which a pooled page is closed and replaced, so per-page state
+# (history, listeners, leaked memory) does not build up
+DEFAULT_MAX_PAGE_USES = 50
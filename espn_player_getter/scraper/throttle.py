@@ -0,0 +1,319 @@
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Recent request outcomes used for the error and timeout rates
+WINDOW_SIZE = 50
+
+# Outcomes needed in the window before the rates affect pacing
+MIN_RATE_SAMPLES = 10
+
+# Recent timeout rate at which a failure quadruples the delay instead of doubling it
+TIMEOUT_RATE_LIMIT = 0.2
+
+# Recent error rate at which successes stop shortening the delay
+ERROR_RATE_LIMIT = 0.5
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+@dataclass
+class FailedPlayer:
+    """A player that still failed after every retry, kept so it can be re-queued."""
+    name: str
+    url: str
+    error: str
+    attempts: int
+    category: str = ""
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Check whether an error is a timeout (builtin or Playwright's TimeoutError)."""
+    return isinstance(error, TimeoutError) or "Timeout" in type(error).__name__
+
+
+class Throttle:
+    """Paces player requests and retries failures, adapting to how the site copes.
+
+    Pacing and concurrency follow AIMD: every success shortens the delay
+    between requests by ``delay_step`` and, once per round of ``limit``
+    successes, allows one more concurrent request; every failure doubles
+    the delay and halves the concurrency. The error and timeout rates over
+    the last ``WINDOW_SIZE`` requests steer this further: while timeouts
+    are frequent a failure quadruples the delay, and while errors are
+    frequent successes leave it unchanged. Failed calls are retried with
+    exponential backoff and full jitter. After ``breaker_threshold``
+    failures in a row the circuit breaker opens and holds back all requests
+    for ``breaker_cooldown`` seconds, then lets a single probe through.
+    """
+
+    def __init__(
+        self,
+        retries: int = 2,
+        min_delay: float = 0.0,
+        max_delay: float = 30.0,
+        delay_step: float = 0.1,
+        max_concurrency: int = 1,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize the throttle.
+
+        Args:
+            retries: Extra attempts for a failed player before giving up
+            min_delay: Smallest delay between the starts of two requests
+            max_delay: Largest delay the pacing backs off to
+            delay_step: Delay removed after each success
+            max_concurrency: Largest number of requests allowed at once
+            backoff_base: Backoff cap in seconds after the first failed attempt,
+                doubled for each further attempt
+            backoff_max: Largest backoff cap
+            breaker_threshold: Failures in a row that open the circuit breaker
+            breaker_cooldown: Seconds the open breaker holds requests back
+            sleep: Blocking sleep function, replaceable in tests
+            clock: Monotonic clock, replaceable in tests
+            rng: Random source for the jitter
+        """
+        if retries < 0 or max_concurrency < 1 or breaker_threshold < 1:
+            raise ValueError("Invalid throttle settings")
+        if min_delay > max_delay:
+            raise ValueError("min_delay must not exceed max_delay")
+        self.attempts = retries + 1
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.delay_step = delay_step
+        self.max_concurrency = max_concurrency
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.sleep = sleep
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+        self.delay = min_delay
+        self.limit = max_concurrency
+        self.state = CLOSED
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.retried = 0
+        self.trips = 0
+        self.failed: List[FailedPlayer] = []
+        self._outcomes: Deque[str] = deque(maxlen=WINDOW_SIZE)
+        self._consecutive_failures = 0
+        self._round_successes = 0
+        self._next_start = 0.0
+        self._reopen_at = 0.0
+        self._active = 0
+        self._changed: Optional[asyncio.Condition] = None
+
+    @property
+    def error_rate(self) -> float:
+        """Share of recent requests that failed."""
+        if not self._outcomes:
+            return 0.0
+        return sum(outcome != "ok" for outcome in self._outcomes) / len(self._outcomes)
+
+    @property
+    def timeout_rate(self) -> float:
+        """Share of recent requests that timed out."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count("timeout") / len(self._outcomes)
+
+    def _rate_at_least(self, rate: float, limit: float) -> bool:
+        """Check a recent rate against a limit, once the window holds enough outcomes."""
+        return len(self._outcomes) >= MIN_RATE_SAMPLES and rate >= limit
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait after a failed attempt (1-based), with full jitter."""
+        cap = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return self.rng.uniform(0, cap)
+
+    def _reserve(self) -> float:
+        """Claim the next request start time and return how long to wait for it.
+
+        Also moves an open breaker whose cooldown is over to half-open.
+        """
+        now = self.clock()
+        start = max(now, self._next_start)
+        if self.state == OPEN:
+            start = max(start, self._reopen_at)
+            self.state = HALF_OPEN
+        self._next_start = start + self.delay
+        return start - now
+
+    def wait(self) -> None:
+        """Block until the pacing and the circuit breaker allow a request."""
+        pause = self._reserve()
+        if pause > 0:
+            self.sleep(pause)
+
+    async def wait_async(self) -> None:
+        """Async version of wait()."""
+        pause = self._reserve()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+    def record_success(self) -> None:
+        """Speed up after a successful request (additive increase)."""
+        self.requests += 1
+        self._outcomes.append("ok")
+        self._consecutive_failures = 0
+        if self.state == HALF_OPEN:
+            print("Circuit breaker closed")
+            self.state = CLOSED
+        if not self._rate_at_least(self.error_rate, ERROR_RATE_LIMIT):
+            self.delay = max(self.min_delay, self.delay - self.delay_step)
+        self._round_successes += 1
+        if self._round_successes >= self.limit:
+            self._round_successes = 0
+            self.limit = min(self.max_concurrency, self.limit + 1)
+
+    def record_failure(self, error: BaseException) -> None:
+        """Slow down after a failed request (multiplicative decrease)."""
+        self.requests += 1
+        self.errors += 1
+        if is_timeout(error):
+            self.timeouts += 1
+            self._outcomes.append("timeout")
+        else:
+            self._outcomes.append("error")
+        self._consecutive_failures += 1
+        self._round_successes = 0
+        # A site timing out often is overloaded: back off harder
+        factor = 4 if self._rate_at_least(self.timeout_rate, TIMEOUT_RATE_LIMIT) else 2
+        self.delay = min(
+            self.max_delay, max(self.delay * factor, self.delay_step, self.min_delay)
+        )
+        self.limit = max(1, self.limit // 2)
+        if self.state == HALF_OPEN or self._consecutive_failures >= self.breaker_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        """Open the circuit breaker, holding requests back for the cooldown."""
+        if self.state != OPEN:
+            self.trips += 1
+            print(
+                f"Circuit breaker open after {self._consecutive_failures} failures in a row; "
+                f"pausing {self.breaker_cooldown:.0f}s"
+            )
+        self.state = OPEN
+        self.limit = 1
+        self._reopen_at = self.clock() + self.breaker_cooldown
+
+    def _give_up(self, error: BaseException, name: str, url: str, category: str) -> None:
+        """Remember a player whose attempts are used up."""
+        self.failed.append(FailedPlayer(
+            name=name, url=url, error=str(error), attempts=self.attempts, category=category,
+        ))
+
+    def _retry_pause(self, attempt: int, name: str, error: BaseException) -> float:
+        """Count a retry and pick its backoff."""
+        pause = self.backoff(attempt)
+        self.retried += 1
+        print(f"Retrying {name} in {pause:.1f}s after error: {error}")
+        return pause
+
+    def call(self, fn: Callable[[], T], name: str, url: str = "", category: str = "") -> T:
+        """Run one player's scrape with pacing and retries.
+
+        Args:
+            fn: Function scraping the player
+            name: Player name, for messages and the failed list
+            url: Player page URL, for the failed list
+            category: Player type, for the failed list
+
+        Returns:
+            What ``fn`` returned
+
+        Raises:
+            Exception: The last error, once every attempt has failed
+        """
+        attempt = 1
+        while True:
+            self.wait()
+            try:
+                result = fn()
+            except Exception as e:
+                self.record_failure(e)
+                if attempt >= self.attempts:
+                    self._give_up(e, name, url, category)
+                    raise
+                self.sleep(self._retry_pause(attempt, name, e))
+            else:
+                self.record_success()
+                return result
+            attempt += 1
+
+    async def call_async(
+        self, fn: Callable[[], Awaitable[T]], name: str, url: str = "", category: str = ""
+    ) -> T:
+        """Async version of call(); attempts also wait for a concurrency slot."""
+        attempt = 1
+        while True:
+            try:
+                async with self._slot():
+                    await self.wait_async()
+                    try:
+                        result = await fn()
+                    except Exception as e:
+                        self.record_failure(e)
+                        raise
+                    self.record_success()
+                    return result
+            except Exception as e:
+                if attempt >= self.attempts:
+                    self._give_up(e, name, url, category)
+                    raise
+                await asyncio.sleep(self._retry_pause(attempt, name, e))
+            attempt += 1
+
+    @asynccontextmanager
+    async def _slot(self):
+        """Hold one of the currently allowed concurrent request slots.
+
+        Outcomes are recorded while a slot is held, so every change of the
+        limit is followed by a release that wakes the waiting workers.
+        """
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        try:
+            yield
+        finally:
+            async with self._changed:
+                self._active -= 1
+                self._changed.notify_all()
+
+    def summary(self) -> str:
+        """Describe request outcomes, the final pacing and permanent failures."""
+        lines = [
+            f"Throttle: {self.requests} requests, {self.errors} errors "
+            f"({self.timeouts} timeouts), {self.retried} retries, recent error rate "
+            f"{self.error_rate:.0%} (timeouts {self.timeout_rate:.0%}), "
+            f"delay {self.delay:.2f}s, concurrency {self.limit}/{self.max_concurrency}, "
+            f"circuit breaker opened {self.trips} times"
+        ]
+        if self.failed:
+            lines.append(f"{len(self.failed)} players failed permanently:")
+            for failure in self.failed:
+                lines.append(f"  {failure.name} ({failure.url}): {failure.error}")
+        return "\n".join(lines)
@@ -0,0 +1,200 @@
+from typing import Dict, Optional
+
+from espn_player_getter.profiling import NULL_TIMER
+
+ROWS_SELECTOR = 'div[class*="players-table"] div[class*="player-info-section"]'
+PLAYER_HEADER_SELECTOR = "div.PlayerHeader h1"
+
+# Steps the scraper waits on, and what each one is waiting for
+WAIT_STEPS = ("navigation", "pagination", "player")
+WAIT_STRATEGIES = ("networkidle", "domcontentloaded", "selector", "rows")
+DEFAULT_WAIT_STRATEGIES = {
+    "navigation": "selector",
+    "pagination": "rows",
+    "player": "selector",
+}
+STEP_SELECTORS = {
+    "navigation": ROWS_SELECTOR,
+    "pagination": ROWS_SELECTOR,
+    "player": PLAYER_HEADER_SELECTOR,
+}
+
+# Pagination and tab switches update the table in place: the document is
+# already parsed and the old rows are still visible, so these strategies
+# would return before the new rows are shown
+IN_PLACE_UNSAFE_STRATEGIES = ("domcontentloaded", "selector")
+
+# Count plus first row text identifies which table page is showing
+ROW_SIGNATURE_SCRIPT = f"""
+() => {{
+    const rows = document.querySelectorAll('{ROWS_SELECTOR}');
+    return rows.length + ":" + (rows.length ? rows[0].innerText : "");
+}}
+"""
+
+ROWS_CHANGED_SCRIPT = f"""
+before => {{
+    const rows = document.querySelectorAll('{ROWS_SELECTOR}');
+    return rows.length > 0 && (rows.length + ":" + rows[0].innerText) !== before;
+}}
+"""
+
+
+def parse_wait_option(value: str) -> tuple:
+    """Parse a ``STEP=STRATEGY`` command line value.
+
+    Args:
+        value: Option value such as "pagination=rows"
+
+    Returns:
+        Tuple of (step, strategy)
+
+    Raises:
+        ValueError: If the step or strategy is unknown
+    """
+    step, _, strategy = value.partition("=")
+    step, strategy = step.strip(), strategy.strip()
+    if step not in WAIT_STEPS:
+        raise ValueError(f"Unknown wait step '{step}', expected one of {', '.join(WAIT_STEPS)}")
+    if strategy not in WAIT_STRATEGIES:
+        raise ValueError(
+            f"Unknown wait strategy '{strategy}', expected one of {', '.join(WAIT_STRATEGIES)}"
+        )
+    if strategy == "rows" and STEP_SELECTORS[step] != ROWS_SELECTOR:
+        raise ValueError(f"The rows strategy only applies to table steps, not '{step}'")
+    if step == "pagination" and strategy in IN_PLACE_UNSAFE_STRATEGIES:
+        raise ValueError(
+            f"The {strategy} strategy cannot tell when a new table page is shown; "
+            "use rows or networkidle for pagination"
+        )
+    return step, strategy
+
+
+class WaitPlan:
+    """Per-step readiness conditions used in place of blanket networkidle waits.
+
+    Strategies:
+        networkidle: no network traffic for 500 ms (the old behaviour)
+        domcontentloaded: the document has been parsed
+        selector: the step's key element is visible (table rows or player header)
+        rows: the table shows different rows than before the click
+
+    Pagination only accepts rows and networkidle, see
+    ``IN_PLACE_UNSAFE_STRATEGIES``.
+
+    A targeted wait that times out falls back to networkidle. With a timer,
+    each wait is recorded as a ``wait_<step>`` phase and every networkidle
+    wait (strategy or fallback) as a ``networkidle`` phase.
+    """
+
+    def __init__(
+        self,
+        strategies: Optional[Dict[str, str]] = None,
+        timeout_ms: float = 10_000,
+        timer=NULL_TIMER,
+    ):
+        """Initialize the wait plan.
+
+        Args:
+            strategies: Mapping of step to strategy name, overriding the defaults
+            timeout_ms: How long a targeted wait may take before falling back
+            timer: PhaseTimer recording wait durations
+        """
+        self.strategies = dict(DEFAULT_WAIT_STRATEGIES)
+        for step, strategy in (strategies or {}).items():
+            parse_wait_option(f"{step}={strategy}")
+            self.strategies[step] = strategy
+        self.timeout_ms = timeout_ms
+        self.timer = timer
+        self.fallbacks = 0
+
+    def needs_snapshot(self, step: str) -> bool:
+        """Whether the step's strategy compares against the page before the action."""
+        return self.strategies[step] == "rows"
+
+    def snapshot(self, page, step: str) -> Optional[str]:
+        """Record the table state before an action that changes it.
+
+        Args:
+            page: Playwright page showing the projections table
+            step: Step about to be performed
+
+        Returns:
+            Row signature, or None if the step's strategy does not need one
+        """
+        if not self.needs_snapshot(step):
+            return None
+        return page.evaluate(ROW_SIGNATURE_SCRIPT)
+
+    def wait(self, page, step: str, before: Optional[str] = None) -> None:
+        """Wait until the page is ready after a step.
+
+        Args:
+            page: Playwright page to wait on
+            step: One of WAIT_STEPS
+            before: Row signature taken with ``snapshot`` before the action
+        """
+        with self.timer.phase(f"wait_{step}"):
+            self._wait(page, step, before)
+
+    def _wait(self, page, step: str, before: Optional[str]) -> None:
+        """Run the step's wait strategy."""
+        # Imported here so the CLI can read the wait options without Playwright
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        strategy = self.strategies[step]
+        if strategy == "networkidle":
+            with self.timer.phase("networkidle"):
+                page.wait_for_load_state("networkidle")
+            return
+        try:
+            if strategy == "domcontentloaded":
+                page.wait_for_load_state("domcontentloaded", timeout=self.timeout_ms)
+            elif strategy == "rows":
+                page.wait_for_function(ROWS_CHANGED_SCRIPT, arg=before, timeout=self.timeout_ms)
+            else:
+                page.wait_for_selector(
+                    STEP_SELECTORS[step], state="visible", timeout=self.timeout_ms
+                )
+        except PlaywrightTimeoutError:
+            self.fallbacks += 1
+            print(f"Timed out waiting for {step} ({strategy}), falling back to networkidle")
+            with self.timer.phase("networkidle"):
+                page.wait_for_load_state("networkidle")
+
+    async def snapshot_async(self, page, step: str) -> Optional[str]:
+        """Async version of ``snapshot``."""
+        if not self.needs_snapshot(step):
+            return None
+        return await page.evaluate(ROW_SIGNATURE_SCRIPT)
+
+    async def wait_async(self, page, step: str, before: Optional[str] = None) -> None:
+        """Async version of ``wait``."""
+        with self.timer.phase(f"wait_{step}"):
+            await self._wait_async(page, step, before)
+
+    async def _wait_async(self, page, step: str, before: Optional[str]) -> None:
+        """Async version of ``_wait``."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        strategy = self.strategies[step]
+        if strategy == "networkidle":
+            with self.timer.phase("networkidle"):
+                await page.wait_for_load_state("networkidle")
+            return
+        try:
+            if strategy == "domcontentloaded":
+                await page.wait_for_load_state("domcontentloaded", timeout=self.timeout_ms)
+            elif strategy == "rows":
+                await page.wait_for_function(
+                    ROWS_CHANGED_SCRIPT, arg=before, timeout=self.timeout_ms
+                )
+            else:
+                await page.wait_for_selector(
+                    STEP_SELECTORS[step], state="visible", timeout=self.timeout_ms
+                )
+        except PlaywrightTimeoutError:
+            self.fallbacks += 1
+            print(f"Timed out waiting for {step} ({strategy}), falling back to networkidle")
+            with self.timer.phase("networkidle"):
+                await page.wait_for_load_state("networkidle")
@@ -0,0 +1,205 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Iterable, Iterator, List, Optional
+
+from espn_player_getter.models.player import Player
+
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+# Two-way players are stored once per category, so rows are keyed by both
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id TEXT NOT NULL,
+    player_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    team TEXT NOT NULL,
+    position TEXT NOT NULL,
+    is_starter INTEGER NOT NULL DEFAULT 0,
+    rank INTEGER,
+    stats TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (id, player_type)
+);
+CREATE INDEX IF NOT EXISTS idx_players_team ON players (team);
+CREATE INDEX IF NOT EXISTS idx_players_position ON players (position);
+CREATE INDEX IF NOT EXISTS idx_players_player_type ON players (player_type);
+
+CREATE TABLE IF NOT EXISTS eligible_positions (
+    player_id TEXT NOT NULL,
+    player_type TEXT NOT NULL,
+    position TEXT NOT NULL,
+    sort_order INTEGER NOT NULL,
+    PRIMARY KEY (player_id, player_type, position),
+    FOREIGN KEY (player_id, player_type)
+        REFERENCES players (id, player_type) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_eligible_positions_position
+    ON eligible_positions (position);
+"""
+
+UPSERT_PLAYER = """
+INSERT INTO players
+    (id, player_type, name, team, position, is_starter, rank, stats, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id, player_type) DO UPDATE SET
+    name = excluded.name,
+    team = excluded.team,
+    position = excluded.position,
+    is_starter = excluded.is_starter,
+    rank = excluded.rank,
+    stats = excluded.stats,
+    updated_at = excluded.updated_at
+"""
+
+PLAYER_COLUMNS = "id, player_type, name, team, position, is_starter, rank, stats"
+
+
+def is_sqlite(path: str) -> bool:
+    """Check whether a path is a SQLite player store."""
+    return os.path.splitext(path)[1].lower() in SQLITE_EXTENSIONS
+
+
+class PlayerStore:
+    """SQLite store of players with indexed lookups.
+
+    Eligible positions live in their own table so players can be looked up
+    by any position they qualify for. The database runs in WAL mode, so
+    readers are not blocked while a scrape writes to it.
+    """
+
+    def __init__(self, path: str):
+        """Open the store, creating the database and schema if needed.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def upsert(self, players: Iterable[Player]) -> int:
+        """Insert or update players in a single transaction.
+
+        A player's eligible positions are replaced by the ones given. If the
+        same player (ID and category) appears more than once, the last copy wins.
+
+        Args:
+            players: Player objects to store
+
+        Returns:
+            Number of players written
+        """
+        players = list({(p.id, p.player_type): p for p in players}.values())
+        now = time.time()
+        player_rows = [
+            (
+                p.id, p.player_type, p.name, p.team, p.position, int(p.is_starter),
+                p.rank, json.dumps(p.stats) if p.stats is not None else None, now,
+            )
+            for p in players
+        ]
+        position_rows = [
+            (p.id, p.player_type, position, i)
+            for p in players
+            for i, position in enumerate(dict.fromkeys(p.eligible_positions))
+        ]
+        with self.conn:
+            self.conn.executemany(UPSERT_PLAYER, player_rows)
+            self.conn.executemany(
+                "DELETE FROM eligible_positions WHERE player_id = ? AND player_type = ?",
+                [(p.id, p.player_type) for p in players],
+            )
+            self.conn.executemany(
+                "INSERT INTO eligible_positions (player_id, player_type, position, sort_order) "
+                "VALUES (?, ?, ?, ?)",
+                position_rows,
+            )
+        return len(players)
+
+    def get(self, player_id: str, player_type: Optional[str] = None) -> List[Player]:
+        """Look up a player by ID.
+
+        Args:
+            player_id: ESPN player ID
+            player_type: Only return the player's entry for this category
+
+        Returns:
+            The player's entries, one per category (two for two-way players)
+        """
+        if player_type is None:
+            return self._query("WHERE id = ?", (player_id,))
+        return self._query("WHERE id = ? AND player_type = ?", (player_id, player_type))
+
+    def by_team(self, team: str, player_type: Optional[str] = None) -> List[Player]:
+        """Players on a team, optionally limited to one category."""
+        if player_type is None:
+            return self._query("WHERE team = ?", (team,))
+        return self._query("WHERE team = ? AND player_type = ?", (team, player_type))
+
+    def by_position(self, position: str, player_type: Optional[str] = None) -> List[Player]:
+        """Players eligible at a position, optionally limited to one category."""
+        where = (
+            "WHERE (id, player_type) IN ("
+            "SELECT player_id, player_type FROM eligible_positions WHERE position = ?)"
+        )
+        if player_type is None:
+            return self._query(where, (position,))
+        return self._query(where + " AND player_type = ?", (position, player_type))
+
+    def iter_all(self) -> Iterator[Player]:
+        """Yield every stored player, batters first, in table rank order."""
+        yield from self._iter_query("", ())
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def _query(self, where: str, params: tuple) -> List[Player]:
+        """Run a players query and return the matching players."""
+        return list(self._iter_query(where, params))
+
+    def _iter_query(self, where: str, params: tuple) -> Iterator[Player]:
+        """Run a players query and attach each row's eligible positions."""
+        cursor = self.conn.execute(
+            f"SELECT {PLAYER_COLUMNS} FROM players {where} "
+            "ORDER BY player_type, rank IS NULL, rank, id",
+            params,
+        )
+        for row in cursor:
+            player_id, player_type, name, team, position, is_starter, rank, stats = row
+            positions = [
+                position_row[0]
+                for position_row in self.conn.execute(
+                    "SELECT position FROM eligible_positions "
+                    "WHERE player_id = ? AND player_type = ? ORDER BY sort_order",
+                    (player_id, player_type),
+                )
+            ]
+            yield Player(
+                id=player_id,
+                name=name,
+                team=team,
+                position=position,
+                eligible_positions=positions,
+                is_starter=bool(is_starter),
+                player_type=player_type,
+                stats=json.loads(stats) if stats is not None else None,
+                rank=rank,
+            )
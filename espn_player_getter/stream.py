@@ -0,0 +1,227 @@
+import queue
+import threading
+from functools import partial
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from espn_player_getter.models.player import Player
+
+# Players held between the scraping thread and a slower consumer
+DEFAULT_BUFFER_SIZE = 50
+
+# Seconds between checks for a closed stream while blocked on the buffer
+POLL_SECONDS = 0.1
+
+# Marks the end of the players in the buffer
+_DONE = object()
+
+
+def make_scraper(backend: str = "browser", **options):
+    """Build an unopened scraper, importing only the backend that is used.
+
+    Args:
+        backend: "browser" for ESPNScraper or "http" for HTTPScraper
+        **options: Keyword arguments for the scraper class
+
+    Returns:
+        Scraper to use as a context manager
+    """
+    if backend == "browser":
+        from espn_player_getter.scraper.espn_scraper import ESPNScraper
+
+        return ESPNScraper(**options)
+    if backend == "http":
+        from espn_player_getter.scraper.http_scraper import HTTPScraper
+
+        return HTTPScraper(**options)
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def stream_players(
+    player_limit: int = 500,
+    categories: Optional[Sequence[str]] = None,
+    backend: str = "browser",
+    **options,
+) -> Iterator[Player]:
+    """Scrape in the calling thread, yielding each player as it is extracted.
+
+    The scrape only moves on when the next player is requested, so a slow
+    consumer slows the scrape down instead of players piling up. Leaving the
+    loop early stops the scrape and closes the browser.
+
+    Args:
+        player_limit: Maximum number of players per category
+        categories: Player types to scrape ("batter", "pitcher"), all by default
+        backend: "browser" or "http"
+        **options: Keyword arguments for the scraper, e.g. ``extraction="table"``
+
+    Yields:
+        Player objects, batters first
+    """
+    with make_scraper(backend, **options) as scraper:
+        yield from scraper.iter_players(player_limit=player_limit, categories=categories)
+
+
+def scrape_players(on_player: Callable[[Player], Any], **kwargs) -> int:
+    """Scrape, calling ``on_player`` with each player as it is extracted.
+
+    The scrape waits for each callback to return before extracting the
+    next player.
+
+    Args:
+        on_player: Called once per player, e.g. to insert it into a database
+        **kwargs: Arguments for stream_players()
+
+    Returns:
+        Number of players handed to the callback
+    """
+    count = 0
+    for player in stream_players(**kwargs):
+        on_player(player)
+        count += 1
+    return count
+
+
+class PlayerStream:
+    """Players scraped in a background thread, handed over through a bounded buffer.
+
+    The scraper runs ahead of the consumer by at most ``buffer_size``
+    players, then waits for the consumer to catch up, so scraping and
+    consuming overlap without unbounded buffering. Iterate it with ``for``,
+    or with ``async for`` from an asyncio application (the sync Playwright
+    API cannot run inside an event loop, but it can in this thread).
+
+    Errors raised by the scraper are raised again to the consumer once the
+    players extracted before them are consumed. Closing the stream, leaving
+    its ``with`` block or breaking out of the loop stops the scrape after
+    the current player and closes the browser.
+    """
+
+    def __init__(
+        self,
+        player_limit: int = 500,
+        categories: Optional[Sequence[str]] = None,
+        backend: str = "browser",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        scraper_factory: Optional[Callable[[], Any]] = None,
+        **options,
+    ):
+        """Initialize the stream; the scrape starts on iteration or ``start()``.
+
+        Args:
+            player_limit: Maximum number of players per category
+            categories: Player types to scrape ("batter", "pitcher"), all by default
+            backend: "browser" or "http"
+            buffer_size: Most players extracted but not yet consumed
+            scraper_factory: Callable returning an unopened scraper, used
+                instead of ``backend`` and ``options``
+            **options: Keyword arguments for the scraper, e.g. ``extraction="table"``
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self.player_limit = player_limit
+        self.categories = categories
+        self.scraper_factory = scraper_factory or partial(make_scraper, backend, **options)
+        self.buffer_size = buffer_size
+        self.count = 0
+        self.max_buffered = 0
+        self.error: Optional[BaseException] = None
+        self._buffer: "queue.Queue" = queue.Queue(maxsize=buffer_size)
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def start(self) -> None:
+        """Start scraping in the background thread, if not started yet."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="player-stream", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Stop the scrape and wait for the scraper to close."""
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Scrape into the buffer; runs in the background thread."""
+        try:
+            with self.scraper_factory() as scraper:
+                players = scraper.iter_players(
+                    player_limit=self.player_limit, categories=self.categories
+                )
+                try:
+                    for player in players:
+                        if not self._put(player):
+                            return
+                finally:
+                    close = getattr(players, "close", None)
+                    if close:
+                        close()
+        except Exception as e:
+            self.error = e
+        self._put(_DONE)
+
+    def _put(self, item) -> bool:
+        """Add an item to the buffer, waiting while it is full.
+
+        Returns:
+            False if the stream was closed while waiting
+        """
+        while not self._stopped.is_set():
+            try:
+                self._buffer.put(item, timeout=POLL_SECONDS)
+            except queue.Full:
+                continue
+            self.max_buffered = max(self.max_buffered, self._buffer.qsize())
+            return True
+        return False
+
+    def _get(self):
+        """Take the next item from the buffer, or _DONE once the stream is closed."""
+        while not self._stopped.is_set():
+            try:
+                return self._buffer.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _next(self) -> Optional[Player]:
+        """Return the next player, None at the end, raising the scraper's error."""
+        item = self._get()
+        if item is _DONE:
+            self.close()
+            if self.error:
+                raise self.error
+            return None
+        self.count += 1
+        return item
+
+    def __iter__(self) -> Iterator[Player]:
+        self.start()
+        try:
+            while True:
+                player = self._next()
+                if player is None:
+                    return
+                yield player
+        finally:
+            self.close()
+
+    async def __aiter__(self):
+        import asyncio
+
+        self.start()
+        try:
+            while True:
+                player = await asyncio.to_thread(self._next)
+                if player is None:
+                    return
+                yield player
+        finally:
+            await asyncio.to_thread(self.close)
@@ -0,0 +1,267 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from espn_player_getter.scraper.async_scraper import AsyncESPNScraper
+from espn_player_getter.scraper.espn_scraper import PLAYER_HEADER_SCRIPT
+from espn_player_getter.scraper.throttle import Throttle
+from espn_player_getter.models.player import Player
+
+
+@pytest.fixture
+def mock_context():
+    """Create a mock browser context whose pages are async mocks."""
+    mock_context = MagicMock()
+    mock_context.new_page = AsyncMock(side_effect=lambda: AsyncMock())
+    return mock_context
+
+
+@pytest.fixture
+def mock_table_page():
+    """Create a mock projections table page with three rows."""
+    mock_page = MagicMock()
+    mock_page.url = "https://fantasy.espn.com/baseball/players/projections"
+    mock_page.evaluate = AsyncMock(return_value=[{"name": "A"}, {"name": "B"}, {"name": "C"}])
+    return mock_page
+
+
+def make_scraper(mock_context, mock_table_page, concurrency=3):
+    """Build a scraper wired to mocks instead of a real browser."""
+    # Retry straight away so failure tests do not sleep
+    throttle = Throttle(max_concurrency=concurrency, backoff_base=0, delay_step=0)
+    scraper = AsyncESPNScraper(concurrency=concurrency, throttle=throttle)
+    scraper.context = mock_context
+    scraper.page = mock_table_page
+    return scraper
+
+
+def test_invalid_concurrency():
+    """Test that a worker pool needs at least one worker."""
+    with pytest.raises(ValueError):
+        AsyncESPNScraper(concurrency=0)
+
+
+@patch("espn_player_getter.scraper.async_scraper.async_playwright")
+def test_scraper_initialization(mock_async_playwright):
+    """Test that entering the scraper opens a browser, context and page."""
+    mock_playwright = AsyncMock()
+    mock_async_playwright.return_value.start = AsyncMock(return_value=mock_playwright)
+
+    async def run():
+        async with AsyncESPNScraper(concurrency=2) as scraper:
+            assert scraper.browser is not None
+            assert scraper.context is not None
+            assert scraper.page is not None
+
+    asyncio.run(run())
+    mock_playwright.stop.assert_awaited_once()
+
+
+def test_scrape_player_category_preserves_row_order(mock_context, mock_table_page):
+    """Test that concurrent workers return players in table order."""
+    scraper = make_scraper(mock_context, mock_table_page)
+    links = iter([("A", "url/1"), ("B", "url/2"), ("C", "url/3")])
+
+    async def slow_first(page):
+        # Finish rows in reverse order to prove results are reordered
+        index = int(page.goto.await_args.args[0].split("/")[-1])
+        await asyncio.sleep(0.01 * (4 - index))
+        return Player(id=str(index), name="", team="", position="", eligible_positions=[])
+
+    with patch.object(scraper, "_collect_player_link", AsyncMock(side_effect=lambda row, name: next(links))), \
+            patch.object(scraper, "_go_to_next_page", AsyncMock(return_value=False)), \
+            patch.object(scraper, "_scrape_player_data", side_effect=slow_first):
+        players = asyncio.run(scraper._scrape_player_category(player_limit=10))
+
+    assert [player.id for player in players] == ["1", "2", "3"]
+    # One warm page per worker, reused for every player
+    assert mock_context.new_page.await_count == 3
+
+
+def test_scrape_player_category_limit_and_pagination(mock_context, mock_table_page):
+    """Test that pagination continues until the player limit is reached."""
+    scraper = make_scraper(mock_context, mock_table_page, concurrency=2)
+    counter = iter(range(100))
+
+    async def collect(row, name):
+        n = next(counter)
+        return f"Player{n}", f"url/{n}"
+
+    async def scrape(page):
+        return Player(id=page.goto.await_args.args[0], name="", team="", position="", eligible_positions=[])
+
+    with patch.object(scraper, "_collect_player_link", side_effect=collect), \
+            patch.object(scraper, "_go_to_next_page", AsyncMock(return_value=True)) as mock_next, \
+            patch.object(scraper, "_scrape_player_data", side_effect=scrape):
+        players = asyncio.run(scraper._scrape_player_category(player_limit=5))
+
+    assert len(players) == 5
+    assert [player.id for player in players] == [f"url/{n}" for n in range(5)]
+    # Ranks continue across table pages, as in the sync scraper
+    assert [player.rank for player in players] == [1, 2, 3, 4, 5]
+    assert mock_next.await_count == 1
+
+
+def test_worker_failure_drops_player(mock_context, mock_table_page):
+    """Test that a player failing every retry is skipped without stopping the pool."""
+    scraper = make_scraper(mock_context, mock_table_page, concurrency=2)
+    links = iter([("A", "url/1"), ("B", "url/2"), ("C", "url/3")])
+
+    async def scrape(page):
+        url = page.goto.await_args.args[0]
+        if url == "url/2":
+            raise RuntimeError("boom")
+        return Player(id=url, name="", team="", position="", eligible_positions=[])
+
+    with patch.object(scraper, "_collect_player_link", AsyncMock(side_effect=lambda row, name: next(links))), \
+            patch.object(scraper, "_go_to_next_page", AsyncMock(return_value=False)), \
+            patch.object(scraper, "_scrape_player_data", side_effect=scrape):
+        players = asyncio.run(scraper._scrape_player_category(player_limit=10))
+
+    assert [player.id for player in players] == ["url/1", "url/3"]
+    assert [player.rank for player in players] == [1, 3]
+    # The failing player was retried, then reported for re-queueing
+    assert scraper.throttle.retried == 2
+    assert [(f.name, f.url, f.category) for f in scraper.throttle.failed] == [("B", "url/2", "batter")]
+
+
+def test_scrape_player_data():
+    """Test scraping player data from a player page."""
+    mock_player_page = MagicMock()
+    mock_player_page.url = "https://www.espn.com/mlb/player/_/id/12345"
+    mock_player_page.evaluate = AsyncMock(return_value={
+        "name": "Player Name",
+        "team": "TeamLos Angeles Angels",
+        "position": "PositionCF, OF",
+    })
+
+    scraper = AsyncESPNScraper()
+    player = asyncio.run(scraper._scrape_player_data(mock_player_page))
+
+    assert player.id == "12345"
+    assert player.name == "Player Name"
+    assert player.team == "Los Angeles Angels"
+    assert player.position == "CF"
+    assert player.eligible_positions == ["CF", "OF"]
+    mock_player_page.evaluate.assert_awaited_once_with(PLAYER_HEADER_SCRIPT)
+
+
+def test_enqueue_current_page_direct(mock_context, mock_table_page):
+    """Test that direct navigation queues URLs built from the row markup."""
+    scraper = make_scraper(mock_context, mock_table_page)
+    scraper.navigation = "direct"
+    mock_table_page.evaluate = AsyncMock(return_value=[
+        {"name": "Player One", "player_id": "1"},
+        {"name": "No Id", "player_id": None},
+        {"name": "Player Two", "hrefs": ["/mlb/player/_/id/2"]},
+    ])
+
+    async def run():
+        queue = asyncio.Queue()
+        with patch.object(scraper, "_collect_player_link") as mock_collect:
+            queued = await scraper._enqueue_current_page(queue, row_offset=10)
+            mock_collect.assert_not_called()
+        return queued, [queue.get_nowait() for _ in range(queue.qsize())]
+
+    queued, items = asyncio.run(run())
+
+    assert queued == 2
+    assert items == [
+        (11, ("Player One", "https://www.espn.com/mlb/player/_/id/1")),
+        (13, ("Player Two", "https://www.espn.com/mlb/player/_/id/2")),
+    ]
+
+
+def make_parallel_scraper(concurrency=2):
+    """Build a parallel-category scraper on a mock browser."""
+    scraper = AsyncESPNScraper(concurrency=concurrency, parallel_categories=True)
+    scraper.browser = MagicMock()
+    contexts = []
+
+    async def new_context():
+        context = MagicMock()
+        context.new_page = AsyncMock(side_effect=lambda: AsyncMock())
+        context.close = AsyncMock()
+        contexts.append(context)
+        return context
+
+    scraper.browser.new_context = AsyncMock(side_effect=new_context)
+    return scraper, contexts
+
+
+def test_scrape_players_parallel_categories():
+    """Test that categories run at once in separate contexts and merge in order."""
+    scraper, contexts = make_parallel_scraper()
+    started = []
+
+    async def scrape_tab(self, index, player_limit):
+        started.append(index)
+        # Batters finish last, but still come first in the output
+        await asyncio.sleep(0.02 if index == 0 else 0)
+        category = ["batter", "pitcher"][index]
+        return [Player(id=f"{category}-{n}", name="", team="", position="",
+                       eligible_positions=[], player_type=category) for n in range(2)]
+
+    with patch.object(AsyncESPNScraper, "_scrape_category_tab", scrape_tab):
+        players = asyncio.run(scraper.scrape_players(player_limit=2))
+
+    assert [p.id for p in players] == ["batter-0", "batter-1", "pitcher-0", "pitcher-1"]
+    assert sorted(started) == [0, 1]
+    # One isolated context per category, all from the same browser, all closed
+    assert len(contexts) == 2
+    assert all(context.close.await_count == 1 for context in contexts)
+
+
+def test_parallel_categories_each_get_their_concurrency():
+    """Test that category contexts do not share one category's throttle slots."""
+    scraper, _ = make_parallel_scraper(concurrency=1)
+    active = []
+    peak = []
+
+    async def visit():
+        active.append(1)
+        peak.append(len(active))
+        await asyncio.sleep(0.02)
+        active.pop()
+        return Player(id="1", name="", team="", position="", eligible_positions=[])
+
+    async def scrape_tab(self, index, player_limit):
+        return [await self.throttle.call_async(visit, f"player {index}")]
+
+    with patch.object(AsyncESPNScraper, "_scrape_category_tab", scrape_tab):
+        asyncio.run(scraper.scrape_players(player_limit=1))
+
+    assert scraper.throttle.max_concurrency == 2
+    assert max(peak) == 2
+
+
+def test_scrape_players_parallel_category_failure():
+    """Test that an error in one category does not abort the other."""
+    scraper, contexts = make_parallel_scraper()
+
+    async def scrape_tab(self, index, player_limit):
+        if index == 0:
+            raise RuntimeError("batters table never loaded")
+        return [Player(id="p", name="", team="", position="", eligible_positions=[],
+                       player_type="pitcher")]
+
+    with patch.object(AsyncESPNScraper, "_scrape_category_tab", scrape_tab):
+        players = asyncio.run(scraper.scrape_players(player_limit=2))
+
+    assert [p.id for p in players] == ["p"]
+    assert all(context.close.await_count == 1 for context in contexts)
+
+
+def test_scrape_category_tab_switches_tab(mock_context, mock_table_page):
+    """Test that later categories click their tab before scraping."""
+    scraper = make_scraper(mock_context, mock_table_page)
+    mock_table_page.click = AsyncMock()
+    mock_table_page.wait_for_function = AsyncMock()
+    player = Player(id="1", name="", team="", position="", eligible_positions=[])
+
+    with patch.object(scraper, "_scrape_player_category", AsyncMock(return_value=[player])):
+        players = asyncio.run(scraper._scrape_category_tab(1, 10))
+
+    mock_table_page.click.assert_awaited_once_with('label:has-text("Pitchers")')
+    assert players[0].player_type == "pitcher"
@@ -0,0 +1,58 @@
+import pytest
+
+from benchmarks.bench_replay import check_baseline, compare, record, replay
+from benchmarks.standin import StandInConfig, StandInServer
+from espn_player_getter.models.player import Player
+from tests.test_standin import chromium_available
+
+
+def make_player(player_id, hr=1.0):
+    """Create a batter with one stat."""
+    return Player(
+        id=player_id,
+        name=f"Player {player_id}",
+        team="NYY",
+        position="OF",
+        eligible_positions=["OF"],
+        player_type="batter",
+        stats={"HR": hr},
+        rank=int(player_id),
+    )
+
+
+def test_compare_and_check_baseline():
+    """Test that a replay is checked against its recording and an earlier replay."""
+    session = {
+        "recorded_seconds": 4.0,
+        "players": [make_player("1").to_dict(), make_player("2").to_dict()],
+    }
+
+    same = compare(session, [make_player("1"), make_player("2")], seconds=2.0, latency_ms=10)
+    changed = compare(session, [make_player("1"), make_player("2", hr=5.0)], seconds=2.0)
+    reordered = compare(session, [make_player("2"), make_player("1")], seconds=2.0)
+
+    assert same["identical"] and same["players"] == 2
+    assert not changed["identical"]
+    assert "HR" in changed["diff"]
+    assert not reordered["identical"]
+
+    assert check_baseline(same, dict(same, seconds=1.9), max_slowdown=1.2) == []
+    problems = check_baseline(same, dict(same, seconds=1.0, latency_ms=0), max_slowdown=1.2)
+    assert len(problems) == 2
+
+
+@pytest.mark.skipif(not chromium_available(), reason="Chromium is not installed")
+def test_record_then_replay_offline(tmp_path):
+    """Test that a recorded session replays identically once the site is gone."""
+    har = str(tmp_path / "session.har")
+    config = StandInConfig(batter_pages=1, pitcher_pages=1, page_size=3)
+    with StandInServer(config) as server:
+        session = record(
+            har, 5, {"extraction": "network"}, server.projections_url, server.player_url
+        )
+
+    result = replay(har, latency_ms=5)
+
+    assert len(session["players"]) == 6
+    assert result["identical"]
+    assert result["players"] == 6
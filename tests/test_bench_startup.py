@@ -0,0 +1,43 @@
+import os
+
+from benchmarks.bench_startup import (
+    heavy_imports,
+    parse_importtime,
+    run_command,
+    sample_players,
+    top_level_time,
+)
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | encodings
+import time:       900 |       1500 |     playwright._impl._api_structures
+import time:      1000 |       2500 |   playwright.sync_api
+import time:      2000 |       4500 | espn_player_getter.cli
+"""
+
+
+def test_parse_importtime():
+    """Test that modules keep their nesting and only top-level imports are summed."""
+    modules = parse_importtime(IMPORTTIME)
+
+    assert modules["espn_player_getter.cli"] == 4500
+    assert modules["  playwright.sync_api"] == 2500
+    assert top_level_time(modules) == 4920
+    assert heavy_imports(modules) == ["playwright._impl._api_structures", "playwright.sync_api"]
+
+
+def test_non_scrape_commands_skip_heavy_imports(tmp_path, monkeypatch):
+    """Test that inspect and --help start without Playwright or asyncio."""
+    players = str(tmp_path / "players.json")
+    sample_players(players, count=3)
+    # Run the CLI from the checkout, as the benchmark does
+    monkeypatch.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    results = [run_command(["inspect", players]), run_command(["--help"])]
+
+    for result in results:
+        assert result["exit_code"] == 0
+        assert result["heavy_imports"] == []
+        assert result["cli_import_ms"] > 0
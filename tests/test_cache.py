@@ -0,0 +1,96 @@
+import json
+
+from espn_player_getter.cache import PlayerCache
+from espn_player_getter.models.player import Player
+
+
+class FakeClock:
+    """Controllable clock for TTL tests."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_player(player_id, team="NYY"):
+    """Create a minimal player."""
+    return Player(
+        id=player_id,
+        name=f"Player {player_id}",
+        team=team,
+        position="RF",
+        eligible_positions=["RF", "OF"],
+        player_type="batter",
+    )
+
+
+def test_hit_and_miss(tmp_path):
+    """Test lookups of cached and unknown players."""
+    cache = PlayerCache(str(tmp_path / "cache.json"), clock=FakeClock())
+    cache.put(make_player("1"))
+
+    hit = cache.get("1")
+    assert hit.team == "NYY"
+    assert hit.eligible_positions == ["RF", "OF"]
+    # The tab decides the type, so it is not cached
+    assert hit.player_type == ""
+    assert cache.get("2") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_expiry(tmp_path):
+    """Test that entries older than the TTL are refreshed."""
+    clock = FakeClock()
+    cache = PlayerCache(str(tmp_path / "cache.json"), ttl_seconds=3600, clock=clock)
+    cache.put(make_player("1"))
+
+    clock.now += 3599
+    assert cache.get("1") is not None
+    clock.now += 2
+    assert cache.get("1") is None
+    assert cache.stale == 1
+
+    cache.put(make_player("1", team="LAD"))
+    assert cache.get("1").team == "LAD"
+
+
+def test_save_reload_and_eviction(tmp_path):
+    """Test persistence and that the oldest entries are evicted first."""
+    path = str(tmp_path / "nested" / "cache.json")
+    clock = FakeClock()
+    cache = PlayerCache(path, max_entries=2, clock=clock)
+    for player_id in ["1", "2", "3"]:
+        cache.put(make_player(player_id))
+        clock.now += 1
+    cache.save()
+
+    reloaded = PlayerCache(path, clock=clock)
+    assert len(reloaded) == 2
+    assert reloaded.get("1") is None
+    assert reloaded.get("3").name == "Player 3"
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    """Test that a corrupt cache file starts an empty cache."""
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+
+    cache = PlayerCache(str(path))
+    assert len(cache) == 0
+    cache.put(make_player("1"))
+    cache.save()
+    assert "1" in json.loads(path.read_text())
+
+
+def test_summary(tmp_path):
+    """Test the hit and miss report."""
+    cache = PlayerCache(str(tmp_path / "cache.json"))
+    cache.put(make_player("1"))
+    cache.get("1")
+    cache.get("1")
+    cache.get("2")
+    cache.get("3")
+
+    assert cache.summary() == "Player cache: 2 hits, 2 misses (0 stale), 50% hit rate"
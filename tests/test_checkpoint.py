@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+
+import pytest
+
+from espn_player_getter.checkpoint import CheckpointJournal
+from espn_player_getter.models.player import Player
+
+
+def make_player(player_id):
+    """Create a minimal player."""
+    return Player(id=player_id, name=f"Player {player_id}", team="", position="", eligible_positions=[])
+
+
+@pytest.fixture
+def journal_path():
+    """Path for a journal file in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield os.path.join(tmp, "checkpoints", "run.journal")
+
+
+def test_journal_records_are_flushed(journal_path):
+    """Test that every entry is on disk as soon as it is recorded."""
+    journal = CheckpointJournal(journal_path)
+    journal.record_player("batter", 1, make_player("1"))
+
+    with open(journal_path) as f:
+        entries = [json.loads(line) for line in f]
+    assert entries == [{
+        "event": "player",
+        "category": "batter",
+        "page": 1,
+        "player": make_player("1").to_dict(),
+    }]
+    journal.close()
+
+
+def test_resume_state(journal_path):
+    """Test reloading players, pages and categories from a journal."""
+    journal = CheckpointJournal(journal_path)
+    journal.record_player("batter", 1, make_player("1"))
+    journal.record_page("batter", 1)
+    journal.record_player("batter", 2, make_player("2"))
+    journal.record_page("batter", 2)
+    journal.record_category("batter")
+    journal.record_player("pitcher", 1, make_player("3"))
+    journal.record_page("pitcher", 1)
+    journal.record_player("pitcher", 2, make_player("2"))
+    journal.close()
+
+    resumed = CheckpointJournal(journal_path, resume=True)
+
+    assert resumed.is_category_done("batter")
+    assert not resumed.is_category_done("pitcher")
+    assert [p.id for p in resumed.players("batter")] == ["1", "2"]
+    assert [p.player_type for p in resumed.players("pitcher")] == ["pitcher", "pitcher"]
+    # Two-way players are tracked per category
+    assert resumed.has_player("batter", "2")
+    assert resumed.has_player("pitcher", "2")
+    assert not resumed.has_player("pitcher", "1")
+    # Page 2 of pitchers was interrupted part way through
+    assert resumed.resume_page("pitcher") == 2
+    assert resumed.resume_page("batter") == 3
+
+    # Resuming appends rather than truncating
+    resumed.record_player("pitcher", 2, make_player("4"))
+    resumed.close()
+    assert [p.id for p in CheckpointJournal(journal_path, resume=True).players("pitcher")] == ["3", "2", "4"]
+
+
+def test_resume_ignores_half_written_line(journal_path):
+    """Test that a line cut short by a crash is skipped."""
+    journal = CheckpointJournal(journal_path)
+    journal.record_player("batter", 1, make_player("1"))
+    journal.close()
+    with open(journal_path, "a") as f:
+        f.write('{"event": "player", "category": "bat')
+
+    resumed = CheckpointJournal(journal_path, resume=True)
+    assert [p.id for p in resumed.players("batter")] == ["1"]
+    assert resumed.resume_page("batter") == 1
+    resumed.close()
+
+
+def test_fresh_run_discards_journal(journal_path):
+    """Test that not resuming starts a new journal, and remove() deletes it."""
+    CheckpointJournal(journal_path).record_player("batter", 1, make_player("1"))
+
+    journal = CheckpointJournal(journal_path)
+    assert journal.players("batter") == []
+    journal.remove()
+    assert not os.path.exists(journal_path)
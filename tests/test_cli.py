@@ -1,8 +1,27 @@
+import json
+import os
 import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock, AsyncMock
 
-from espn_player_getter.cli import parse_args, run_scraper
+from espn_player_getter.cli import (
+    build_memory,
+    build_resource_policy,
+    build_throttle,
+    can_use_daemon,
+    parse_args,
+    run_scraper,
+    scraper_options,
+    shard_output_path,
+)
+from espn_player_getter.scraper.espn_api import player_api_url
+
+
+@pytest.fixture(autouse=True)
+def no_daemon():
+    """Keep scrapes in process even if a real daemon listens on the default socket."""
+    with patch('espn_player_getter.daemon.is_running', return_value=False) as mock_is_running:
+        yield mock_is_running
 
 
 def test_parse_args():
@@ -13,29 +32,48 @@ def test_parse_args():
         assert args.output == "data/espn_players.json"
         assert args.no_headless is False
         assert args.limit == 500
+        assert args.concurrency == 1
+        assert args.parallel_categories is False
+        assert args.page_uses == 50
+        assert args.navigation == "modal"
+        assert args.extraction == "dom"
+        assert args.checkpoint is None
+        assert args.resume is False
 
     # Test with custom arguments
     with patch.object(sys, 'argv', [
         'espn_player_getter', 
         '-o', 'custom_output.json',
         '--no-headless',
-        '--limit', '100'
+        '--limit', '100',
+        '--navigation', 'direct',
+        '--wait', 'pagination=networkidle',
+        '--wait', 'player=domcontentloaded',
+        '--checkpoint', 'run.journal',
+        '--page-uses', '10',
+        '--resume'
     ]):
         args = parse_args()
         assert args.output == "custom_output.json"
         assert args.no_headless is True
         assert args.limit == 100
+        assert args.navigation == "direct"
+        assert dict(args.wait) == {"pagination": "networkidle", "player": "domcontentloaded"}
+        assert args.checkpoint == "run.journal"
+        assert args.page_uses == 10
+        assert args.resume is True
 
 
-@patch('espn_player_getter.cli.ESPNScraper')
+@patch('espn_player_getter.cli.CheckpointJournal')
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
 @patch('espn_player_getter.cli.save_players')
-def test_run_scraper_success(mock_save_players, mock_scraper_class):
+def test_run_scraper_success(mock_save_players, mock_scraper_class, mock_journal_class):
     """Test successful execution of the scraper."""
     # Setup mocks
     mock_scraper = MagicMock()
     mock_scraper_class.return_value.__enter__.return_value = mock_scraper
     mock_players = [MagicMock(), MagicMock()]
-    mock_scraper.scrape_players.return_value = mock_players
+    mock_scraper.iter_players.return_value = mock_players
     
     # Test with default arguments
     with patch.object(sys, 'argv', ['espn_player_getter']):
@@ -43,22 +81,78 @@ def test_run_scraper_success(mock_save_players, mock_scraper_class):
         
         # Verify scraper was called with correct parameters
         mock_scraper_class.assert_called_once()
-        mock_scraper.scrape_players.assert_called_once()
+        mock_scraper.iter_players.assert_called_once_with(player_limit=500, categories=None)
         
         # Verify players were saved
         mock_save_players.assert_called_once_with(mock_players, "data/espn_players.json")
         
+        # Verify the journal was used and removed after the save
+        mock_journal_class.assert_called_once_with(
+            "data/espn_players.json.journal", resume=False
+        )
+        mock_journal_class.return_value.remove.assert_called_once()
+
         # Verify exit code
         assert exit_code == 0
 
 
-@patch('espn_player_getter.cli.ESPNScraper')
-def test_run_scraper_error(mock_scraper_class):
+@patch('espn_player_getter.cli.CheckpointJournal')
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
+@patch('espn_player_getter.scraper.http_scraper.HTTPScraper')
+@patch('espn_player_getter.cli.save_players')
+def test_run_scraper_http_backend(mock_save_players, mock_http_class, mock_browser_class, mock_journal_class):
+    """Test that --backend http fetches from the API without a browser."""
+    mock_scraper = mock_http_class.return_value.__enter__.return_value
+    mock_scraper.iter_players.return_value = ["player"]
+
+    with patch.object(sys, 'argv', ['espn_player_getter', '--backend', 'http', '--concurrency', '4']):
+        exit_code = run_scraper()
+
+    assert exit_code == 0
+    mock_http_class.assert_called_once_with(
+        api_url=player_api_url(), concurrency=4, profiler=None
+    )
+    mock_scraper.iter_players.assert_called_once_with(player_limit=500, categories=None)
+    mock_save_players.assert_called_once_with(["player"], "data/espn_players.json")
+    mock_browser_class.assert_not_called()
+    mock_journal_class.assert_not_called()
+
+    with patch.object(sys, 'argv', ['espn_player_getter', '--backend', 'http', '--shard', '1/2']):
+        assert run_scraper() == 1
+
+    with patch.object(sys, 'argv', ['espn_player_getter', '--backend', 'http', '--replay-har', 'a.har']):
+        assert run_scraper() == 1
+
+
+@patch('espn_player_getter.scraper.http_scraper.HTTPScraper')
+@patch('espn_player_getter.cli.save_players')
+def test_run_scraper_http_season_and_api_url(mock_save_players, mock_http_class):
+    """Test that --season and --api-url pick the player list API."""
+    with patch.object(sys, 'argv', ['espn_player_getter', '--backend', 'http', '--season', '2031']):
+        assert run_scraper() == 0
+    assert "/seasons/2031/" in mock_http_class.call_args.kwargs["api_url"]
+
+    with patch.object(sys, 'argv', ['espn_player_getter', '--backend', 'http', '--api-url', 'http://x/api']):
+        assert run_scraper() == 0
+    assert mock_http_class.call_args.kwargs["api_url"] == "http://x/api"
+
+    # The browser backend follows the site and cannot pick a season
+    with patch.object(sys, 'argv', ['espn_player_getter', '--season', '2031']):
+        assert run_scraper() == 1
+    with patch.object(sys, 'argv', [
+        'espn_player_getter', '--backend', 'http', '--season', '2031', '--api-url', 'http://x/api',
+    ]):
+        assert run_scraper() == 1
+
+
+@patch('espn_player_getter.cli.CheckpointJournal')
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
+def test_run_scraper_error(mock_scraper_class, mock_journal_class):
     """Test error handling in the scraper."""
     # Setup mock to raise an exception
     mock_scraper = MagicMock()
     mock_scraper_class.return_value.__enter__.return_value = mock_scraper
-    mock_scraper.scrape_players.side_effect = Exception("Test error")
+    mock_scraper.iter_players.side_effect = Exception("Test error")
     
     # Test with default arguments
     with patch.object(sys, 'argv', ['espn_player_getter']):
@@ -66,4 +160,377 @@ def test_run_scraper_error(mock_scraper_class):
             exit_code = run_scraper()
             
             # Verify exit code indicates error
-            assert exit_code == 1
\ No newline at end of file
+            assert exit_code == 1
+
+            # The journal is kept so the run can be resumed
+            mock_journal_class.return_value.remove.assert_not_called()
+
+@patch('espn_player_getter.scraper.async_scraper.AsyncESPNScraper')
+@patch('espn_player_getter.cli.save_players')
+def test_run_scraper_concurrent(mock_save_players, mock_scraper_class):
+    """Test that --concurrency switches to the async worker pool."""
+    mock_scraper = MagicMock()
+    mock_scraper.scrape_players = AsyncMock(return_value=["player"])
+    mock_scraper_class.return_value.__aenter__ = AsyncMock(return_value=mock_scraper)
+    mock_scraper_class.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    with patch.object(sys, 'argv', ['espn_player_getter', '--concurrency', '4']):
+        exit_code = run_scraper()
+
+    assert exit_code == 0
+    mock_scraper_class.assert_called_once_with(
+        headless=True,
+        concurrency=4,
+        navigation="modal",
+        resource_policy=None,
+        wait_strategies={},
+        parallel_categories=False,
+        profiler=None,
+        max_page_uses=50,
+        throttle=ANY,
+    )
+    throttle = mock_scraper_class.call_args.kwargs["throttle"]
+    assert throttle.max_concurrency == 4
+    mock_save_players.assert_called_once_with(["player"], "data/espn_players.json")
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ['--backend', 'http', '--resume'],
+        ['--backend', 'http', '--checkpoint', 'run.journal'],
+        ['--backend', 'http', '--cache', 'cache.json'],
+        ['--concurrency', '4', '--resume'],
+        ['--concurrency', '4', '--checkpoint', 'run.journal'],
+        ['--parallel-categories', '--cache', 'cache.json'],
+        ['--backend', 'http', '--recycle-after', '100'],
+        ['--backend', 'http', '--extraction', 'table'],
+        ['--backend', 'http', '--retries', '5'],
+        ['--backend', 'http', '--block-resources'],
+        ['--backend', 'http', '--parallel-categories'],
+        ['--backend', 'http', '--no-headless'],
+        ['--extraction', 'table', '--parallel-categories'],
+        ['--extraction', 'network', '--concurrency', '4'],
+        ['--concurrency', '4', '--max-browser-mb', '800'],
+    ],
+)
+@patch('espn_player_getter.cli.CheckpointJournal')
+@patch('espn_player_getter.scraper.async_scraper.AsyncESPNScraper')
+@patch('espn_player_getter.scraper.http_scraper.HTTPScraper')
+def test_run_scraper_rejects_unsupported_options(
+    mock_http_class, mock_async_class, mock_journal_class, argv, capsys
+):
+    """Test that the async and HTTP scrapers reject options they would ignore."""
+    with patch.object(sys, 'argv', ['espn_player_getter', *argv]):
+        assert run_scraper() == 1
+
+    assert "not supported with" in capsys.readouterr().err
+    mock_http_class.assert_not_called()
+    mock_async_class.assert_not_called()
+    mock_journal_class.assert_not_called()
+
+
+def test_build_throttle():
+    """Test building the player request throttle from arguments."""
+    with patch.object(sys, 'argv', [
+        'espn_player_getter', '--retries', '4', '--min-delay', '0.5',
+        '--max-delay', '10', '--breaker-cooldown', '120',
+    ]):
+        throttle = build_throttle(parse_args())
+
+    assert throttle.attempts == 5
+    assert throttle.delay == 0.5
+    assert throttle.max_delay == 10
+    assert throttle.breaker_cooldown == 120
+    assert throttle.max_concurrency == 1
+
+    # Each category context gets its own --concurrency workers
+    args = parse_args(['--concurrency', '3', '--parallel-categories'])
+    assert build_throttle(args).max_concurrency == 6
+
+
+def test_build_memory():
+    """Test building the memory monitor from arguments."""
+    monitor = build_memory(parse_args(['--recycle-after', '200', '--max-browser-mb', '800']))
+    assert monitor.max_players == 200
+    assert monitor.max_rss_mb == 800
+
+    monitor = build_memory(parse_args([]))
+    assert monitor.max_players is None
+    assert monitor.max_rss_mb is None
+
+
+def test_build_resource_policy():
+    """Test building the request blocking policy from arguments."""
+    with patch.object(sys, 'argv', ['espn_player_getter']):
+        assert build_resource_policy(parse_args()) is None
+
+    with patch.object(sys, 'argv', [
+        'espn_player_getter',
+        '--block-resources',
+        '--block-types', 'image, font',
+        '--block-host', 'ads.example.com',
+        '--allow-host', 'espncdn.com',
+    ]):
+        policy = build_resource_policy(parse_args())
+
+    assert policy.blocked_resource_types == {"image", "font"}
+    assert "ads.example.com" in policy.blocked_hosts
+    assert "doubleclick.net" in policy.blocked_hosts
+    assert policy.allowed_hosts == {"espncdn.com"}
+
+
+def test_parse_args_rejects_bad_wait():
+    """Test that unknown wait steps and strategies are rejected."""
+    for value in ["checkout=selector", "player=forever", "player=rows", "pagination=selector"]:
+        with patch.object(sys, 'argv', ['espn_player_getter', '--wait', value]):
+            with patch('sys.stderr'), pytest.raises(SystemExit):
+                parse_args()
+
+
+def test_parse_args_shard():
+    """Test parsing and validating --shard K/N."""
+    with patch.object(sys, 'argv', ['espn_player_getter', '--shard', '2/4']):
+        assert parse_args().shard == (2, 4)
+
+    for value in ["0/4", "5/4", "two/4", "2"]:
+        with patch.object(sys, 'argv', ['espn_player_getter', '--shard', value]):
+            with patch('sys.stderr'), pytest.raises(SystemExit):
+                parse_args()
+
+
+def test_shard_output_path():
+    """Test that shard outputs get distinct file names."""
+    assert shard_output_path("data/players.json", None) == "data/players.json"
+    assert shard_output_path("data/players.json", (2, 4)) == "data/players.shard-2-of-4.json"
+
+
+@patch('espn_player_getter.cli.CheckpointJournal')
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
+@patch('espn_player_getter.cli.save_players')
+def test_run_scraper_shard(mock_save_players, mock_scraper_class, mock_journal_class):
+    """Test that a sharded run passes the shard on and writes a shard file."""
+    mock_scraper = mock_scraper_class.return_value.__enter__.return_value
+    mock_scraper.iter_players.return_value = ["player"]
+
+    with patch.object(sys, 'argv', ['espn_player_getter', '-o', 'out/players.json', '--shard', '1/3']):
+        assert run_scraper() == 0
+
+    assert mock_scraper_class.call_args.kwargs["shard"] == (1, 3)
+    mock_save_players.assert_called_once_with(["player"], "out/players.shard-1-of-3.json")
+    mock_journal_class.assert_called_once_with("out/players.shard-1-of-3.json.journal", resume=False)
+
+
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
+@patch('espn_player_getter.cli.save_players')
+@patch('espn_player_getter.cli.load_players')
+def test_run_scraper_merge(mock_load_players, mock_save_players, mock_scraper_class):
+    """Test that the merge subcommand combines files without scraping."""
+    from espn_player_getter.models.player import Player
+    batter = Player(id="1", name="A", team="", position="", eligible_positions=[], player_type="batter", rank=1)
+    mock_load_players.side_effect = [[batter], [batter]]
+
+    with patch.object(sys, 'argv', ['espn_player_getter', 'merge', 'a.json', 'b.json', '-o', 'all.json']):
+        assert run_scraper() == 0
+
+    assert [c.args[0] for c in mock_load_players.call_args_list] == ["a.json", "b.json"]
+    mock_save_players.assert_called_once_with([batter], "all.json")
+    mock_scraper_class.assert_not_called()
+
+
+def test_run_scraper_diff(tmp_path, capsys):
+    """Test that the diff subcommand prints and writes the differences."""
+    import json
+    from espn_player_getter.data_handler import save_players
+    from espn_player_getter.models.player import Player
+
+    def player(team):
+        return Player(id="1", name="A", team=team, position="C", eligible_positions=["C"], player_type="batter")
+
+    old, new, report = (str(tmp_path / name) for name in ["old.json", "new.json", "diff.json"])
+    save_players([player("NYY")], old)
+    save_players([player("BOS")], new)
+
+    with patch.object(sys, 'argv', ['espn_player_getter', 'diff', old, new, '-o', report]):
+        assert run_scraper() == 0
+
+    assert "~ A (1, batter): team: 'NYY' -> 'BOS'" in capsys.readouterr().out
+    with open(report) as f:
+        assert json.load(f)["changed"][0]["changes"] == [{"field": "team", "old": "NYY", "new": "BOS"}]
+
+
+@patch('espn_player_getter.cli.CheckpointJournal')
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
+@patch('espn_player_getter.cli.save_players')
+def test_run_scraper_profile(mock_save_players, mock_scraper_class, mock_journal_class, tmp_path, capsys):
+    """Test that --profile passes a timer to the scraper and reports it."""
+    def scrape(player_limit, categories):
+        profiler = mock_scraper_class.call_args.kwargs["profiler"]
+        with profiler.phase("goto"):
+            pass
+        return []
+
+    mock_scraper = mock_scraper_class.return_value.__enter__.return_value
+    mock_scraper.iter_players.side_effect = scrape
+    metrics = str(tmp_path / "scraper.prom")
+
+    with patch.object(sys, 'argv', ['espn_player_getter', '--profile', '--profile-output', metrics]):
+        assert run_scraper() == 0
+
+    assert "goto" in capsys.readouterr().out
+    with open(metrics) as f:
+        assert 'espn_scraper_phase_seconds_count{phase="goto"} 1' in f.read()
+
+    with patch.object(sys, 'argv', ['espn_player_getter']):
+        run_scraper()
+    assert mock_scraper_class.call_args.kwargs["profiler"] is None
+
+
+@patch('espn_player_getter.daemon.is_running', return_value=True)
+@patch('espn_player_getter.daemon.request')
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
+def test_run_scraper_sends_job_to_daemon(mock_scraper_class, mock_request, mock_is_running):
+    """Test that a running daemon gets the job instead of a new browser."""
+    mock_request.return_value = {"ok": True, "players": 3}
+
+    with patch.object(sys, 'argv', [
+        'espn_player_getter', '-o', 'out/players.json', '--limit', '20',
+        '--category', 'pitcher', '--socket', '/tmp/test.sock',
+    ]):
+        assert run_scraper() == 0
+
+    mock_request.assert_called_once_with(
+        {
+            "command": "scrape",
+            "limit": 20,
+            "categories": ["pitcher"],
+            "output": os.path.abspath("out/players.json"),
+            "options": ANY,
+        },
+        "/tmp/test.sock",
+    )
+    options = mock_request.call_args.args[0]["options"]
+    assert options["extraction"] == "dom"
+    assert options["headless"] is True
+    mock_scraper_class.assert_not_called()
+
+
+@patch('espn_player_getter.daemon.is_running', return_value=True)
+def test_can_use_daemon(mock_is_running):
+    """Test that runs needing per-run state are scraped in process."""
+    def check(*argv):
+        with patch.object(sys, 'argv', ['espn_player_getter', *argv]):
+            return can_use_daemon(parse_args())
+
+    assert check()
+    assert check('--extraction', 'table')
+    assert not check('--no-daemon')
+    assert not check('--backend', 'http')
+    assert not check('--concurrency', '4')
+    assert not check('--resume')
+    assert not check('--checkpoint', 'run.journal')
+    assert not check('--shard', '1/2')
+    assert not check('--profile')
+    assert not check('--record-har', 'session.har')
+    assert not check('--replay-har', 'session.har')
+
+    mock_is_running.return_value = False
+    assert not check()
+
+
+@patch('espn_player_getter.daemon.ScraperDaemon')
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
+def test_run_scraper_daemon_command(mock_scraper_class, mock_daemon_class):
+    """Test that 'daemon' serves with a factory building the configured scraper."""
+    with patch.object(sys, 'argv', [
+        'espn_player_getter', '--extraction', 'table', '--socket', '/tmp/test.sock', 'daemon',
+    ]):
+        assert run_scraper() == 0
+
+    factory, socket_path, options = mock_daemon_class.call_args.args
+    assert socket_path == "/tmp/test.sock"
+    assert options["extraction"] == "table"
+    mock_daemon_class.return_value.serve_forever.assert_called_once()
+    mock_scraper_class.assert_not_called()
+    factory()
+    assert mock_scraper_class.call_args.kwargs["extraction"] == "table"
+
+
+@patch('espn_player_getter.daemon.request')
+def test_run_scraper_daemon_stop(mock_request):
+    """Test that 'daemon --stop' asks the daemon to shut down."""
+    with patch.object(sys, 'argv', ['espn_player_getter', '--socket', '/tmp/test.sock', 'daemon', '--stop']):
+        assert run_scraper() == 0
+
+    mock_request.assert_called_once_with({"command": "shutdown"}, "/tmp/test.sock", timeout=ANY)
+
+
+def test_scraper_options():
+    """Test that scraper options survive a JSON round trip, as sent to the daemon."""
+    args = parse_args([
+        '--extraction', 'table', '--block-host', 'b.com', '--block-host', 'a.com',
+        '--wait', 'navigation=selector', '--retries', '4',
+    ])
+    options = scraper_options(args)
+
+    assert json.loads(json.dumps(options)) == options
+    assert options["block_host"] == ["a.com", "b.com"]
+    assert options["wait"] == {"navigation": "selector"}
+    assert options["retries"] == 4
+    assert scraper_options(parse_args([])) != options
+
+
+def test_parse_args_scrape_command():
+    """Test that scrape options work before and after the scrape command."""
+    args = parse_args(['--limit', '10', 'scrape', '--extraction', 'table', '-o', 'out.json'])
+
+    assert args.command == "scrape"
+    assert args.limit == 10
+    assert args.extraction == "table"
+    assert args.output == "out.json"
+    assert args.navigation == "modal"
+    assert parse_args(['scrape']).limit == 500
+
+
+def test_run_scraper_convert_and_inspect(tmp_path, capsys):
+    """Test that convert rewrites a file in another format and inspect summarizes it."""
+    from espn_player_getter.data_handler import load_players, save_players
+    from espn_player_getter.models.player import Player
+
+    players = [
+        Player(id="1", name="A", team="NYY", position="C", eligible_positions=["C"],
+               player_type="batter", stats={"HR": 30.0}, rank=1),
+        Player(id="2", name="B", team="BOS", position="SP", eligible_positions=["SP"],
+               player_type="pitcher", rank=1),
+    ]
+    source, converted = str(tmp_path / "players.json"), str(tmp_path / "players.jsonl")
+    save_players(players, source)
+
+    with patch.object(sys, 'argv', ['espn_player_getter', 'convert', source, converted]):
+        assert run_scraper() == 0
+    assert load_players(converted) == players
+
+    capsys.readouterr()
+    with patch.object(sys, 'argv', ['espn_player_getter', 'inspect', converted, '--show', '1']):
+        assert run_scraper() == 0
+    out = capsys.readouterr().out
+    assert f"{converted}: 2 players" in out
+    assert "batter: 1, pitcher: 1" in out
+    assert "2 teams, 1 players without stats" in out
+    assert "1. A (NYY, C) batter" in out
+    assert "B (BOS" not in out
+
+
+@patch('espn_player_getter.cli.CheckpointJournal')
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
+@patch('espn_player_getter.cli.save_players')
+def test_run_scraper_replay_har(mock_save_players, mock_scraper_class, mock_journal_class):
+    """Test that the HAR options reach the browser scraper."""
+    argv = ['espn_player_getter', '--replay-har', 'session.har', '--replay-latency-ms', '40']
+    with patch.object(sys, 'argv', argv):
+        assert run_scraper() == 0
+
+    kwargs = mock_scraper_class.call_args.kwargs
+    assert kwargs["record_har_path"] is None
+    assert kwargs["replay_har_path"] == "session.har"
+    assert kwargs["replay_latency_ms"] == 40
@@ -0,0 +1,85 @@
+import importlib.util
+
+import pytest
+
+from espn_player_getter.columnar import (
+    is_columnar,
+    load_columns,
+    players_to_table,
+)
+from espn_player_getter.data_handler import iter_players, load_players, save_players
+from espn_player_getter.models.player import Player
+
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None, reason="pyarrow is not installed"
+)
+
+
+@pytest.fixture
+def sample_players():
+    """Create a batter with projected stats and a pitcher without any."""
+    return [
+        Player(
+            id="33192",
+            name="Aaron Judge",
+            team="NYY",
+            position="RF",
+            eligible_positions=["RF", "OF", "DH"],
+            player_type="batter",
+            stats={"HR": 49, "AVG": 0.295},
+            rank=1,
+        ),
+        Player(
+            id="32081",
+            name="Gerrit Cole",
+            team="NYY",
+            position="SP",
+            eligible_positions=["SP", "P"],
+            player_type="pitcher",
+        ),
+    ]
+
+
+def test_is_columnar():
+    """Test format detection from the file extension."""
+    assert is_columnar("players.parquet")
+    assert is_columnar("players.ARROW")
+    assert not is_columnar("players.json")
+
+
+def test_players_to_table_schema(sample_players):
+    """Test the typed columns and flattened stats."""
+    import pyarrow as pa
+
+    table = players_to_table(sample_players)
+
+    assert table.schema.field("eligible_positions").type == pa.list_(pa.string())
+    assert table.schema.field("rank").type == pa.int32()
+    assert table.schema.field("stat_HR").type == pa.float64()
+    assert table.column("stat_HR").to_pylist() == [49.0, None]
+
+
+@pytest.mark.parametrize("filename", ["players.parquet", "players.arrow"])
+def test_save_and_load_columnar(sample_players, tmp_path, filename):
+    """Test a round trip through each columnar format."""
+    path = str(tmp_path / filename)
+    save_players(sample_players, path)
+
+    loaded = load_players(path)
+
+    assert [p.to_dict() for p in loaded] == [
+        {**sample_players[0].to_dict(), "stats": {"HR": 49.0, "AVG": 0.295}},
+        sample_players[1].to_dict(),
+    ]
+    assert [p.id for p in iter_players(path)] == ["33192", "32081"]
+
+
+def test_load_columns_reads_selected_columns(sample_players, tmp_path):
+    """Test reading a subset of columns."""
+    path = str(tmp_path / "players.parquet")
+    save_players(sample_players, path)
+
+    table = load_columns(path, columns=["id", "stat_HR"])
+
+    assert table.column_names == ["id", "stat_HR"]
+    assert table.to_pydict() == {"id": ["33192", "32081"], "stat_HR": [49.0, None]}
@@ -0,0 +1,143 @@
+import json
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from espn_player_getter.daemon import DaemonError, ScraperDaemon, is_running, request
+from espn_player_getter.models.player import Player
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """Short socket path, since Unix socket paths are limited to ~100 bytes."""
+    path = os.path.join(os.path.dirname(str(tmp_path)), f"d{os.getpid()}.sock")
+    yield path
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def make_scraper():
+    """Mock scraper whose iter_players yields one player per requested category."""
+    scraper = MagicMock()
+    scraper.__enter__.return_value = scraper
+
+    def iter_players(player_limit, categories=None):
+        for category in categories or ["batter", "pitcher"]:
+            yield Player(
+                id=category, name=category.title(), team="NYY", position="",
+                eligible_positions=[], player_type=category,
+            )
+
+    scraper.iter_players.side_effect = iter_players
+    return scraper
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """Daemon serving in a background thread, stopped after the test."""
+    factory = MagicMock(side_effect=make_scraper)
+    daemon = ScraperDaemon(factory, socket_path)
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    if thread.is_alive():
+        request({"command": "shutdown"}, socket_path, timeout=5)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_daemon_reuses_warm_scraper(daemon, socket_path, tmp_path):
+    """Test that consecutive jobs run on one scraper started by the first job."""
+    first = str(tmp_path / "first.json")
+    second = str(tmp_path / "second.json")
+
+    assert is_running(socket_path)
+    assert request({"command": "scrape", "limit": 10, "output": first}, socket_path)["players"] == 2
+    response = request(
+        {"command": "scrape", "limit": 5, "categories": ["pitcher"], "output": second},
+        socket_path,
+    )
+
+    assert response["players"] == 1
+    with open(second) as f:
+        assert [p["id"] for p in json.load(f)] == ["pitcher"]
+    assert daemon.scraper_factory.call_count == 1
+    daemon.scraper.iter_players.assert_called_with(player_limit=5, categories=["pitcher"])
+    assert request({"command": "ping"}, socket_path) == {"ok": True, "jobs": 2, "launches": 1}
+
+
+def test_daemon_relaunches_after_failed_job(daemon, socket_path, tmp_path):
+    """Test that a failed job closes the scraper and the next job starts a new one."""
+    output = str(tmp_path / "players.json")
+    request({"command": "scrape", "output": output}, socket_path)
+    broken = daemon.scraper
+    broken.iter_players.side_effect = RuntimeError("browser crashed")
+
+    with pytest.raises(DaemonError, match="browser crashed"):
+        request({"command": "scrape", "output": output}, socket_path)
+    broken.__exit__.assert_called_once()
+
+    request({"command": "scrape", "output": output}, socket_path)
+    assert daemon.launches == 2
+
+
+def test_daemon_rejects_bad_requests(daemon, socket_path):
+    """Test that relative outputs and unknown commands are reported to the client."""
+    with pytest.raises(DaemonError, match="absolute"):
+        request({"command": "scrape", "output": "players.json"}, socket_path)
+    with pytest.raises(DaemonError, match="Unknown command"):
+        request({"command": "dance"}, socket_path)
+    daemon.scraper_factory.assert_not_called()
+
+
+def test_daemon_shutdown_and_socket_cleanup(daemon, socket_path):
+    """Test that shutdown stops the daemon and removes its socket."""
+    request({"command": "ping"}, socket_path)
+    request({"command": "shutdown"}, socket_path, timeout=5)
+
+    for _ in range(100):
+        if not os.path.exists(socket_path):
+            break
+        threading.Event().wait(0.01)
+    assert not is_running(socket_path)
+    with pytest.raises(DaemonError):
+        request({"command": "ping"}, socket_path, timeout=1)
+
+
+def test_daemon_refuses_second_instance_and_replaces_stale_socket(daemon, socket_path):
+    """Test that bind() fails while a daemon listens but removes a dead socket file."""
+    with pytest.raises(DaemonError, match="already listening"):
+        ScraperDaemon(MagicMock(), socket_path).bind()
+
+    stale = socket_path + ".stale"
+    with open(stale, "w"):
+        pass
+    replacement = ScraperDaemon(MagicMock(), stale)
+    try:
+        replacement.bind()
+        assert is_running(stale)
+    finally:
+        replacement._server.close()
+        os.remove(stale)
+
+
+def test_daemon_rejects_jobs_with_other_options(socket_path, tmp_path):
+    """Test that a job asking for other scraper options is not run on the warm scraper."""
+    factory = MagicMock(side_effect=make_scraper)
+    daemon = ScraperDaemon(factory, socket_path, {"extraction": "table", "wait": {}})
+    output = str(tmp_path / "players.json")
+
+    rejected = daemon.handle({
+        "command": "scrape", "output": output, "options": {"extraction": "dom", "wait": {}},
+    })
+    accepted = daemon.handle({
+        "command": "scrape", "output": output, "options": {"extraction": "table", "wait": {}},
+    })
+
+    assert not rejected["ok"]
+    assert "extraction: 'dom' instead of 'table'" in rejected["error"]
+    assert accepted == {"ok": True, "players": 2}
+    assert factory.call_count == 1
@@ -4,7 +4,13 @@ import tempfile
 
 import pytest
 
-from espn_player_getter.data_handler import save_players, load_players
+from espn_player_getter.data_handler import (
+    JsonlWriter,
+    iter_players,
+    load_players,
+    merge_players,
+    save_players,
+)
 from espn_player_getter.models.player import Player
 
 
@@ -65,3 +71,64 @@ def test_save_and_load_players(sample_players):
     finally:
         # Clean up temporary file
         os.unlink(temp_file)
+
+
+def test_merge_players():
+    """Test merging shard outputs into one deduplicated, ordered list."""
+    def player(player_id, player_type, rank):
+        return Player(
+            id=player_id, name=player_id, team="", position="", eligible_positions=[],
+            player_type=player_type, rank=rank,
+        )
+
+    shard_2 = [player("3", "batter", 3), player("20", "pitcher", 2)]
+    shard_1 = [
+        player("1", "batter", 1), player("2", "batter", 2),
+        player("10", "pitcher", 1), player("1", "pitcher", 3),
+    ]
+
+    merged = merge_players([shard_2, shard_1, shard_1])
+
+    assert [(p.player_type, p.id) for p in merged] == [
+        ("batter", "1"), ("batter", "2"), ("batter", "3"),
+        ("pitcher", "10"), ("pitcher", "20"), ("pitcher", "1"),
+    ]
+
+
+def test_save_and_iter_players_jsonl(sample_players, tmp_path):
+    """Test streaming players to JSONL and reading them back lazily."""
+    output = str(tmp_path / "out" / "players.jsonl")
+
+    save_players(iter(sample_players), output, flush_every=1)
+
+    with open(output) as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1])["stats"] == {"HR": 52, "AVG": 0.311}
+
+    players = iter_players(output)
+    assert next(players).name == "Mike Trout"
+    assert [p.name for p in players] == ["Aaron Judge"]
+    assert [p.id for p in load_players(output)] == ["12345", "67890"]
+
+
+def test_iter_players_skips_partial_last_line(sample_players, tmp_path):
+    """Test that a line still being written is not read."""
+    output = str(tmp_path / "players.jsonl")
+    with JsonlWriter(output) as writer:
+        writer.write(sample_players[0])
+    with open(output, "a") as f:
+        f.write('{"id": "678')
+
+    assert [p.id for p in iter_players(output)] == ["12345"]
+
+
+def test_jsonl_writer_flushes_periodically(sample_players, tmp_path):
+    """Test that written players reach the file before the writer closes."""
+    output = str(tmp_path / "players.jsonl")
+    writer = JsonlWriter(output, flush_every=2)
+    writer.write(sample_players[0])
+    writer.write(sample_players[1])
+
+    assert [p.id for p in iter_players(output)] == ["12345", "67890"]
+    writer.close()
@@ -0,0 +1,73 @@
+import time
+
+from espn_player_getter.diff import content_hash, diff_players
+from espn_player_getter.models.player import Player
+
+
+def make_player(player_id, player_type="batter", **fields):
+    """Create a player with default fields for diffing."""
+    data = dict(
+        id=player_id, name=f"Player {player_id}", team="NYY", position="1B",
+        eligible_positions=["1B"], player_type=player_type,
+    )
+    data.update(fields)
+    return Player(**data)
+
+
+def test_diff_players_added_removed_changed():
+    """Test classifying players and reporting field-level changes."""
+    old = [
+        make_player("1"),
+        make_player("2", stats={"HR": 30.0, "SB": 5.0}),
+        make_player("3"),
+        make_player("4", player_type="pitcher"),
+    ]
+    new = [
+        make_player("1"),
+        make_player("2", team="BOS", eligible_positions=["1B", "3B"], stats={"HR": 32.0, "SB": 5.0}),
+        make_player("5"),
+        make_player("4", player_type="pitcher"),
+        make_player("4", player_type="batter"),
+    ]
+
+    diff = diff_players(old, new)
+
+    assert [(p.id, p.player_type) for p in diff.added] == [("5", "batter"), ("4", "batter")]
+    assert [p.id for p in diff.removed] == ["3"]
+    (change,) = diff.changed
+    assert [(c.field, c.old, c.new) for c in change.changes] == [
+        ("eligible_positions", ["1B"], ["1B", "3B"]),
+        ("stats.HR", 30.0, 32.0),
+        ("team", "NYY", "BOS"),
+    ]
+    assert change.positions_added == ["3B"]
+    assert change.positions_removed == []
+    assert "~ Player 2 (2, batter): stats.HR: 30.0 -> 32.0; team: 'NYY' -> 'BOS'; gained 3B" in diff.summary()
+
+
+def test_diff_players_ignores_rank_and_position_order():
+    """Test that rank moves and reordered eligibility are not changes."""
+    old = [make_player("1", eligible_positions=["1B", "OF"], rank=1)]
+    new = [make_player("1", eligible_positions=["OF", "1B"], rank=7)]
+
+    assert diff_players(old, new).changed == []
+    (change,) = diff_players(old, new, ignore=()).changed
+    assert [c.field for c in change.changes] == ["rank"]
+
+
+def test_content_hash():
+    """Test that the hash covers compared fields only."""
+    assert content_hash(make_player("1", rank=1)) == content_hash(make_player("1", rank=2))
+    assert content_hash(make_player("1")) != content_hash(make_player("1", team="BOS"))
+
+
+def test_diff_players_scales_linearly():
+    """Test that tens of thousands of players diff quickly."""
+    old = [make_player(str(i), stats={"HR": float(i % 40)}) for i in range(30_000)]
+    new = [make_player(str(i), stats={"HR": float(i % 41)}) for i in range(30_000)]
+
+    start = time.perf_counter()
+    diff = diff_players(old, new)
+
+    assert time.perf_counter() - start < 5
+    assert len(diff.changed) == sum(1 for i in range(30_000) if i % 40 != i % 41)
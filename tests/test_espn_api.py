@@ -0,0 +1,119 @@
+import datetime
+import json
+from pathlib import Path
+
+from espn_player_getter.scraper.espn_api import (
+    current_season,
+    is_player_payload_url,
+    parse_player_entry,
+    innings_to_outs,
+    parse_players_payload,
+    parse_projection_columns,
+    parse_stat_value,
+    parse_stats,
+    player_api_url,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(name):
+    """Load a saved player list API response."""
+    with open(FIXTURES / name) as f:
+        return json.load(f)
+
+
+def test_is_player_payload_url():
+    """Test recognising the player list API calls."""
+    assert is_player_payload_url(
+        "https://lm-api-reads.fantasy.espn.com/apis/v3/games/flb/seasons/2025"
+        "/segments/0/leaguedefaults/3?view=kona_player_info"
+    )
+    assert not is_player_payload_url("https://fantasy.espn.com/baseball/players/projections")
+    assert not is_player_payload_url(
+        "https://lm-api-reads.fantasy.espn.com/apis/v3/games/flb/seasons/2025?view=proTeamSchedules_wl"
+    )
+
+
+def test_parse_batters_payload():
+    """Test building batters from a saved response."""
+    players = parse_players_payload(load_fixture("kona_player_info_batters.json"))
+
+    assert [player.id for player in players] == ["33192", "30836", "39832"]
+
+    judge = players[0]
+    assert judge.name == "Aaron Judge"
+    assert judge.team == "NYY"
+    assert judge.position == "RF"
+    assert judge.eligible_positions == ["RF", "OF", "CF", "DH"]
+    assert judge.player_type == "batter"
+    # Only the season projection is kept, not last season's actuals
+    assert judge.stats == {"AB": 540.0, "AVG": 0.287, "HR": 49.0, "R": 112.0, "RBI": 118.0, "SB": 8.0}
+
+    ohtani = players[2]
+    assert ohtani.position == "DH"
+    assert ohtani.eligible_positions == ["DH"]
+    assert ohtani.stats is None
+
+
+def test_parse_pitchers_payload():
+    """Test building pitchers from a saved response."""
+    players = parse_players_payload(load_fixture("kona_player_info_pitchers.json"))
+
+    assert [player.name for player in players] == ["Gerrit Cole", "Emmanuel Clase"]
+    assert all(player.player_type == "pitcher" for player in players)
+    assert players[0].eligible_positions == ["SP"]
+    assert players[1].team == "CLE"
+    assert players[1].stats["SV"] == 38.0
+
+
+def test_parse_player_entry_without_id():
+    """Test that entries without an ID are skipped."""
+    assert parse_player_entry({"player": {"fullName": "Nobody"}}) is None
+    assert parse_players_payload({}) == []
+
+
+def test_parse_stats_unknown_ids():
+    """Test that unmapped stat IDs keep their numeric key."""
+    stats = parse_stats([{"statSourceId": 1, "statSplitTypeId": 0, "stats": {"5": 10.0, "999": 1.0}}])
+    assert stats == {"HR": 10.0, "999": 1.0}
+
+
+def test_parse_stat_value():
+    """Test reading numbers out of projections table cells."""
+    assert parse_stat_value("42") == 42.0
+    assert parse_stat_value(".285") == 0.285
+    assert parse_stat_value("1,204") == 1204.0
+    assert parse_stat_value("--") is None
+    assert parse_stat_value("") is None
+    assert innings_to_outs("180.1") == 541.0
+    assert innings_to_outs("65") == 195.0
+    assert innings_to_outs("--") is None
+
+
+def test_parse_projection_columns():
+    """Test that table columns map to the stat names the API payload uses."""
+    batter = parse_projection_columns(
+        ["", "AB", "R", "HR", "K", "AVG"],
+        ["2025 Projections", "601", "104", "42", "160", ".276"],
+        "batter",
+    )
+    assert batter == {"AB": 601.0, "R": 104.0, "HR": 42.0, "SO": 160.0, "AVG": 0.276}
+
+    pitcher = parse_projection_columns(
+        ["", "IP", "H", "BB", "K", "ERA"],
+        ["2025 Projections", "190.2", "150", "48", "221", "3.05"],
+        "pitcher",
+    )
+    assert pitcher == {"OUTS": 572.0, "P_H": 150.0, "P_BB": 48.0, "K": 221.0, "ERA": 3.05}
+
+    assert parse_projection_columns(["", "AB"], ["2025 Projections", "--"], "batter") is None
+
+
+def test_current_season_and_api_url():
+    """Test that the season switches in February and picks the API URL."""
+    assert current_season(datetime.date(2027, 1, 31)) == 2026
+    assert current_season(datetime.date(2027, 2, 1)) == 2027
+    assert current_season(datetime.date(2027, 11, 5)) == 2027
+    assert "/seasons/2030/" in player_api_url(2030)
+    assert is_player_payload_url(player_api_url())
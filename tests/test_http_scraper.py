@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from benchmarks.standin import API_PATH, StandInConfig, StandInServer
+from espn_player_getter.profiling import PhaseTimer
+from espn_player_getter.scraper.espn_api import player_filter
+from espn_player_getter.scraper.http_scraper import APIError, ConnectionPool, HTTPScraper
+
+
+@pytest.fixture
+def server():
+    """Serve a stand-in with 25 batters and 15 pitchers."""
+    config = StandInConfig(batter_pages=5, pitcher_pages=3, page_size=5)
+    with StandInServer(config) as server:
+        yield server
+
+
+def test_http_scraper_matches_standin(server):
+    """Test that every player is fetched, in order, as the stand-in defines it."""
+    with HTTPScraper(api_url=server.api_url, page_size=4, concurrency=3) as scraper:
+        players = scraper.scrape_players(player_limit=100)
+
+    expected = server.site.expected_players("batter") + server.site.expected_players("pitcher")
+    assert [p.id for p in players] == [p.id for p in expected]
+    assert [(p.team, p.eligible_positions, p.stats) for p in players] == [
+        (p.team, p.eligible_positions, p.stats) for p in expected
+    ]
+    assert [p.player_type for p in players] == ["batter"] * 25 + ["pitcher"] * 15
+    assert [p.rank for p in players[:3]] == [1, 2, 3]
+    assert players[-1].rank == 15
+
+
+def test_http_scraper_limit(server):
+    """Test that the limit applies per category and stops paging early."""
+    timer = PhaseTimer()
+    with HTTPScraper(api_url=server.api_url, page_size=4, concurrency=2, profiler=timer) as scraper:
+        players = list(scraper.iter_players(player_limit=6))
+
+    assert [p.id for p in players] == [
+        p.id
+        for category in ("batter", "pitcher")
+        for p in server.site.expected_players(category, 6)
+    ]
+    # Two pages of four per category cover the six players
+    assert timer.stats()["api_page"]["count"] == 4
+
+
+def test_http_scraper_categories(server):
+    """Test that only the requested categories are fetched."""
+    with HTTPScraper(api_url=server.api_url, page_size=5) as scraper:
+        players = scraper.scrape_players(player_limit=100)
+        pitchers = list(scraper.iter_players(player_limit=100, categories=["pitcher"]))
+
+    assert [p.id for p in pitchers] == [p.id for p in players if p.player_type == "pitcher"]
+
+
+def test_http_scraper_reuses_gzip_connections(server):
+    """Test that sequential pages share one keep-alive connection and arrive gzipped."""
+    with HTTPScraper(api_url=server.api_url, page_size=5, concurrency=1) as scraper:
+        scraper.scrape_players(player_limit=100)
+        pool = scraper.pool
+
+    # 5 + 3 full pages plus one empty page per category
+    assert pool.requests == 10
+    assert pool.created == 1
+    assert pool.gzipped == 10
+    assert server.connections == 1
+
+
+def test_connection_pool_errors(server):
+    """Test that error statuses raise and do not poison the pool."""
+    pool = ConnectionPool(server.base_url)
+    with pytest.raises(APIError):
+        pool.get("/nowhere")
+    body = pool.get(API_PATH, {
+        "X-Fantasy-Filter": json.dumps(player_filter("pitcher", 0, 2)),
+    })
+    pool.close()
+
+    assert b"Pitcher 1" in body
+    assert pool.created == 1
+
+
+def test_http_scraper_rejects_bad_settings():
+    """Test that page size and concurrency must be positive."""
+    with pytest.raises(ValueError):
+        HTTPScraper(concurrency=0)
@@ -0,0 +1,99 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from espn_player_getter.scraper.memory import (
+    MB,
+    MemoryMonitor,
+    descendant_pids,
+    read_rss,
+    sample_rss,
+)
+
+
+class FakeSampler:
+    """Sampler returning queued (Python, browser) readings in MB."""
+
+    def __init__(self, *readings):
+        self.readings = list(readings)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        python_mb, browser_mb = self.readings[min(self.calls, len(self.readings)) - 1]
+        return python_mb * MB, browser_mb * MB
+
+
+def test_memory_monitor_peak_and_average():
+    """Test that samples feed the peak and average in the summary."""
+    monitor = MemoryMonitor(sampler=FakeSampler((100, 200), (300, 400)))
+
+    monitor.sample()
+    monitor.sample()
+
+    assert monitor.python_peak == 300 * MB
+    assert monitor.browser_peak == 400 * MB
+    assert monitor.summary() == (
+        "Memory: Python peak 300MB, avg 200MB; browser peak 400MB, avg 300MB "
+        "(2 samples); context recycled 0 times, browser relaunched 0 times"
+    )
+
+
+def test_memory_monitor_samples_players_by_interval():
+    """Test that players are sampled at most once per interval."""
+    now = [0.0]
+    sampler = FakeSampler((1, 1))
+    monitor = MemoryMonitor(sampler=sampler, sample_interval=1.0, clock=lambda: now[0])
+
+    for step in (0.0, 0.5, 0.9, 1.0, 1.2, 2.5):
+        now[0] = step
+        monitor.record_player()
+
+    assert sampler.calls == 3
+    assert monitor.players_since_recycle == 6
+
+
+def test_memory_monitor_recycle_reasons():
+    """Test the player count and browser memory limits."""
+    assert MemoryMonitor().recycle_reason() is None
+
+    by_players = MemoryMonitor(max_players=2, sampler=FakeSampler((1, 1)))
+    by_players.players_since_recycle = 1
+    assert by_players.recycle_reason() is None
+    by_players.players_since_recycle = 2
+    assert by_players.recycle_reason() == "2 players since the last recycle"
+    by_players.recycled()
+    assert by_players.players_since_recycle == 0
+    assert by_players.context_recycles == 1
+
+    by_memory = MemoryMonitor(max_rss_mb=500, sampler=FakeSampler((1, 499), (1, 500)))
+    assert by_memory.recycle_reason() is None
+    assert by_memory.recycle_reason() == "browser memory at 500MB"
+    by_memory.recycled(relaunched=True)
+    assert by_memory.browser_relaunches == 1
+
+
+def test_memory_monitor_rejects_bad_limits():
+    """Test that limits must be positive."""
+    with pytest.raises(ValueError):
+        MemoryMonitor(max_players=0)
+    with pytest.raises(ValueError):
+        MemoryMonitor(max_rss_mb=0)
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs /proc")
+def test_sample_rss_counts_child_processes():
+    """Test that the process and its child processes are measured."""
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+    try:
+        assert child.pid in descendant_pids(os.getpid())
+        python_rss, children_rss = sample_rss()
+        assert python_rss == read_rss(os.getpid()) or python_rss > 0
+        assert children_rss >= read_rss(child.pid) > 0
+    finally:
+        child.kill()
+        child.wait()
+
+    assert read_rss(child.pid) == 0
@@ -0,0 +1,99 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from espn_player_getter.scraper.page_pool import AsyncPagePool, PagePool
+
+
+def test_page_pool_reuses_pages():
+    """Test that a released page is handed out again instead of a new one."""
+    new_page = MagicMock(side_effect=lambda: MagicMock())
+    pool = PagePool(new_page, size=1, max_uses=10)
+
+    with pool.page() as first:
+        pass
+    with pool.page() as second:
+        pass
+
+    assert first is second
+    new_page.assert_called_once()
+    first.close.assert_not_called()
+
+
+def test_page_pool_recycles_worn_out_pages():
+    """Test that a page is replaced after its maximum number of uses."""
+    pool = PagePool(MagicMock(side_effect=lambda: MagicMock()), max_uses=2)
+
+    pages = []
+    for _ in range(5):
+        with pool.page() as page:
+            pages.append(page)
+
+    assert pages[0] is pages[1]
+    assert pages[2] is pages[3]
+    assert pages[1] is not pages[2]
+    pages[0].close.assert_called_once()
+    assert pool.created == 3
+    assert pool.recycled == 2
+    assert pool.summary() == "Page pool: 3 pages opened, 2 recycled"
+
+
+def test_page_pool_recycles_failed_pages():
+    """Test that a page is closed when the work done on it raises."""
+    pool = PagePool(MagicMock(side_effect=lambda: MagicMock()), max_uses=10)
+
+    with pytest.raises(RuntimeError):
+        with pool.page() as failed:
+            raise RuntimeError("navigation timed out")
+    with pool.page() as page:
+        pass
+
+    failed.close.assert_called_once()
+    assert page is not failed
+    assert pool.open_pages == 1
+
+
+def test_page_pool_size_and_close():
+    """Test the size limit and that close() closes idle pages."""
+    pool = PagePool(MagicMock(side_effect=lambda: MagicMock()), size=2)
+    first = pool.acquire()
+    second = pool.acquire()
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+    pool.release(first)
+    pool.release(second)
+    pool.close()
+
+    first.close.assert_called_once()
+    second.close.assert_called_once()
+    assert pool.open_pages == 0
+
+    with pytest.raises(ValueError):
+        PagePool(MagicMock(), max_uses=0)
+
+
+def test_async_page_pool_shares_pages_between_workers():
+    """Test that concurrent workers never open more pages than the pool size."""
+    new_page = AsyncMock(side_effect=lambda: AsyncMock())
+    pool = AsyncPagePool(new_page, size=2, max_uses=3)
+    busy = []
+
+    async def work():
+        async with pool.page_async() as page:
+            assert page not in busy
+            busy.append(page)
+            await asyncio.sleep(0.001)
+            busy.remove(page)
+
+    async def run():
+        await asyncio.gather(*(work() for _ in range(6)))
+        await pool.close_async()
+
+    asyncio.run(run())
+
+    # Six uses at three per page on two pages, all closed at the end
+    assert new_page.await_count == 2
+    assert pool.recycled == 2
+    assert pool.open_pages == 0
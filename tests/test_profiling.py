@@ -0,0 +1,75 @@
+import json
+
+from espn_player_getter.profiling import NULL_TIMER, PhaseTimer, percentile
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([], 50) == 0.0
+
+
+def test_phase_timer_records_samples():
+    """Test that each pass through a phase adds one sample."""
+    timer = PhaseTimer()
+    for seconds in [0.1, 0.2, 0.3]:
+        timer.record("player", seconds)
+    with timer.phase("goto"):
+        pass
+
+    stats = timer.stats()
+
+    assert list(stats) == ["player", "goto"]
+    assert stats["player"]["count"] == 3
+    assert stats["player"]["p50"] == 0.2
+    assert stats["player"]["max"] == 0.3
+    assert round(stats["player"]["total"], 6) == 0.6
+    assert stats["goto"]["count"] == 1
+    report = timer.report()
+    assert report.splitlines()[1].startswith("player")
+
+
+def test_phase_timer_records_failed_phases():
+    """Test that a phase that raises is still timed."""
+    timer = PhaseTimer()
+    try:
+        with timer.phase("popup"):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+
+    assert timer.stats()["popup"]["count"] == 1
+
+
+def test_phase_timer_write_json_and_prometheus(tmp_path):
+    """Test the machine-readable outputs."""
+    timer = PhaseTimer()
+    timer.record("wait_player", 0.25)
+    json_path = str(tmp_path / "metrics" / "profile.json")
+    prom_path = str(tmp_path / "scraper.prom")
+
+    timer.write(json_path)
+    timer.write(prom_path)
+
+    with open(json_path) as f:
+        assert json.load(f)["phases"]["wait_player"]["p95"] == 0.25
+    with open(prom_path) as f:
+        lines = f.read().splitlines()
+    assert "# TYPE espn_scraper_phase_seconds summary" in lines
+    assert 'espn_scraper_phase_seconds{phase="wait_player",quantile="0.95"} 0.250000' in lines
+    assert 'espn_scraper_phase_seconds_count{phase="wait_player"} 1' in lines
+    assert 'espn_scraper_phase_max_seconds{phase="wait_player"} 0.250000' in lines
+
+
+def test_null_timer_records_nothing():
+    """Test the disabled timer shares one no-op context."""
+    with NULL_TIMER.phase("goto"):
+        pass
+    NULL_TIMER.record("goto", 1.0)
+
+    assert NULL_TIMER.phase("a") is NULL_TIMER.phase("b")
+    assert not NULL_TIMER.enabled
@@ -0,0 +1,79 @@
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock
+
+from espn_player_getter.scraper.resource_policy import ResourcePolicy
+
+
+def make_route(url, resource_type):
+    """Create a mock route for a request."""
+    route = MagicMock()
+    route.request.url = url
+    route.request.resource_type = resource_type
+    return route
+
+
+def test_block_reason_defaults():
+    """Test the built-in resource type and host deny lists."""
+    policy = ResourcePolicy()
+
+    assert policy.block_reason("https://a.espncdn.com/i/headshots/1.png", "image") == "type:image"
+    assert policy.block_reason("https://fonts.espn.com/font.woff2", "font") == "type:font"
+    assert policy.block_reason(
+        "https://securepubads.g.doubleclick.net/tag/js/gpt.js", "script"
+    ) == "host:doubleclick.net"
+    assert policy.block_reason("https://fantasy.espn.com/baseball/players/projections", "document") is None
+    assert policy.block_reason("https://lm-api-reads.fantasy.espn.com/apis/v3/games/flb", "fetch") is None
+    # Lookalike hosts are not treated as subdomains
+    assert policy.block_reason("https://notdoubleclick.net/x.js", "script") is None
+
+
+def test_allowed_hosts_override_deny_lists():
+    """Test that allowed hosts pass through both deny lists."""
+    policy = ResourcePolicy(allowed_hosts={"espncdn.com"}, blocked_hosts={"espncdn.com"})
+
+    assert policy.block_reason("https://a.espncdn.com/i/headshots/1.png", "image") is None
+    assert policy.block_reason("https://b.example.com/logo.png", "image") == "type:image"
+
+
+def test_handle_route_counts_requests():
+    """Test that routed requests are aborted or passed on and counted."""
+    policy = ResourcePolicy()
+    blocked = make_route("https://www.google-analytics.com/analytics.js", "script")
+    allowed = make_route("https://fantasy.espn.com/baseball/players/projections", "document")
+
+    policy.handle_route(blocked)
+    policy.handle_route(allowed)
+
+    blocked.abort.assert_called_once()
+    blocked.fallback.assert_not_called()
+    allowed.fallback.assert_called_once()
+    assert policy.blocked_requests == 1
+    assert policy.allowed_requests == 1
+    assert policy.blocked_by_reason == {"host:google-analytics.com": 1}
+
+
+def test_handle_route_async():
+    """Test the async route handler."""
+    policy = ResourcePolicy()
+    route = make_route("https://a.espncdn.com/video.mp4", "media")
+    route.abort = AsyncMock()
+
+    asyncio.run(policy.handle_route_async(route))
+
+    route.abort.assert_awaited_once()
+    assert policy.blocked_by_reason == {"type:media": 1}
+
+
+def test_record_response_and_summary():
+    """Test the allowed byte count and run summary."""
+    policy = ResourcePolicy()
+    policy.record_response(MagicMock(headers={"content-length": "1500000"}))
+    policy.record_response(MagicMock(headers={}))
+    policy.check("https://a.espncdn.com/1.png", "image")
+
+    assert policy.allowed_bytes == 1500000
+    summary = policy.summary()
+    assert "Blocked 1 requests" in summary
+    assert "1.5 MB" in summary
+    assert "type:image: 1" in summary
@@ -1,8 +1,43 @@
+import json
+from pathlib import Path
+
 import pytest
 from unittest.mock import MagicMock, patch
 
-from espn_player_getter.scraper.espn_scraper import ESPNScraper
+from espn_player_getter.scraper.espn_scraper import (
+    PLAYER_HEADER_SCRIPT,
+    ROWS_SCRIPT,
+    TABLE_SCRIPT,
+    ESPNScraper,
+    PlayerLink,
+    parse_player_header,
+    parse_row_link,
+)
+from espn_player_getter.cache import PlayerCache
+from espn_player_getter.checkpoint import CheckpointJournal
 from espn_player_getter.models.player import Player
+from espn_player_getter.scraper.memory import MB, MemoryMonitor
+from espn_player_getter.scraper.resource_policy import ResourcePolicy
+from espn_player_getter.scraper.throttle import Throttle
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+HEADER_RECORD = {
+    "name": "Player Name",
+    "team": "TeamLos Angeles Angels",
+    "position": "PositionCF, OF",
+}
+
+
+def fake_evaluate(rows=(), header=None):
+    """Create an evaluate() stand-in that answers the scraper's page scripts."""
+    def evaluate(script, *args):
+        if script == ROWS_SCRIPT:
+            return list(rows)
+        if script == PLAYER_HEADER_SCRIPT:
+            return header
+        return ""
+    return MagicMock(side_effect=evaluate)
 
 
 @pytest.fixture
@@ -31,8 +66,17 @@ def mock_page():
     # Set up wait_for_selector to not actually wait
     mock_page.wait_for_selector = MagicMock()
     
+    # Rows and header are read with a single evaluate() call each
+    mock_page.evaluate = fake_evaluate(
+        rows=[{"name": f"Player {i}"} for i in range(5)], header=HEADER_RECORD
+    )
+
     # Set up is_visible for modal detection
     mock_page.is_visible = MagicMock(return_value=True)
+
+    # The player card's Complete Stats link
+    mock_page.first = mock_page
+    mock_page.get_attribute = MagicMock(return_value="/mlb/player/_/id/12345")
     
     # Setup mock URL that will be parsed for player ID
     mock_page.url = "https://www.espn.com/mlb/player/_/id/12345"
@@ -44,6 +88,7 @@ def mock_page():
     mock_player_page.inner_text = MagicMock(return_value="Player Name")
     mock_player_page.wait_for_load_state = MagicMock()
     mock_player_page.count = MagicMock(return_value=1)
+    mock_player_page.evaluate = fake_evaluate(header=HEADER_RECORD)
     mock_player_page.close = MagicMock()
     
     # Make expect_page return mock_player_page
@@ -63,7 +108,7 @@ def mock_playwright():
     
     # Set up the browser
     mock_browser = MagicMock()
-    mock_browser.new_page = MagicMock()
+    mock_browser.new_context.return_value.new_page = MagicMock()
     mock_playwright.chromium.launch = MagicMock(return_value=mock_browser)
     
     return mock_playwright
@@ -78,7 +123,10 @@ def test_scraper_initialization(mock_sync_playwright, mock_playwright):
         assert scraper.headless is True
         assert scraper.playwright is not None
         assert scraper.browser is not None
+        assert scraper.context is not None
         assert scraper.page is not None
+        # Requests are not routed unless a resource policy is given
+        scraper.context.route.assert_not_called()
     
     # Verify resources are cleaned up
     mock_playwright.stop.assert_called_once()
@@ -90,7 +138,7 @@ def test_process_current_page(mock_sync_playwright, mock_page, mock_playwright):
     # Setup mocks
     mock_sync_playwright.return_value.start.return_value = mock_playwright
     mock_browser = mock_playwright.chromium.launch.return_value
-    mock_browser.new_page.return_value = mock_page
+    mock_browser.new_context.return_value.new_page.return_value = mock_page
     
     with ESPNScraper(headless=True) as scraper:
         # Override the page with our mock
@@ -100,8 +148,10 @@ def test_process_current_page(mock_sync_playwright, mock_page, mock_playwright):
         players = scraper._process_current_page()
         
         # Verify results
-        assert len(players) == 5  # We set count to return 5
+        assert len(players) == 5  # One per row record
         assert all(isinstance(player, Player) for player in players)
+        # Names come from the single rows evaluate() call, not per-row inner_text
+        mock_page.inner_text.assert_not_called()
 
 
 @patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
@@ -110,12 +160,9 @@ def test_scrape_player_data(mock_sync_playwright, mock_page, mock_playwright):
     # Setup mocks
     mock_sync_playwright.return_value.start.return_value = mock_playwright
     mock_browser = mock_playwright.chromium.launch.return_value
-    mock_browser.new_page.return_value = mock_page
+    mock_browser.new_context.return_value.new_page.return_value = mock_page
     
-    # Mock the split method
-    mock_page.url = MagicMock()
-    mock_split_result = mock_page.url.split.return_value
-    mock_split_result.__getitem__.return_value = "12345"
+    mock_page.url = "https://www.espn.com/mlb/player/_/id/12345/player-name"
     
     with ESPNScraper(headless=True) as scraper:
         # Call the method with the mock player page
@@ -133,10 +180,10 @@ def test_scrape_players(mock_sync_playwright, mock_page, mock_playwright):
     # Setup mocks
     mock_sync_playwright.return_value.start.return_value = mock_playwright
     mock_browser = mock_playwright.chromium.launch.return_value
-    mock_browser.new_page.return_value = mock_page
+    mock_browser.new_context.return_value.new_page.return_value = mock_page
     
-    # Setup mock for _scrape_player_category method
-    with patch.object(ESPNScraper, '_scrape_player_category') as mock_scrape_category:
+    # Setup mock for _iter_player_category method
+    with patch.object(ESPNScraper, '_iter_player_category') as mock_scrape_category:
         # Create mock batters and pitchers
         mock_batters = [
             Player(id="1", name="Batter1", team="Team1", position="1B", eligible_positions=["1B"]),
@@ -173,7 +220,7 @@ def test_scrape_player_category(mock_sync_playwright, mock_page, mock_playwright
     # Setup mocks
     mock_sync_playwright.return_value.start.return_value = mock_playwright
     mock_browser = mock_playwright.chromium.launch.return_value
-    mock_browser.new_page.return_value = mock_page
+    mock_browser.new_context.return_value.new_page.return_value = mock_page
     
     # Mock the next button behavior - first enabled, then disabled
     next_button_mock = MagicMock()
@@ -181,7 +228,7 @@ def test_scrape_player_category(mock_sync_playwright, mock_page, mock_playwright
     next_button_mock.count.return_value = 1
     
     # Setup processing for two pages
-    with patch.object(ESPNScraper, '_process_current_page') as mock_process_page:
+    with patch.object(ESPNScraper, '_iter_current_page') as mock_process_page:
         # Return 3 players for first page, 2 for second page
         page1_players = [
             Player(id="1", name="Player1", team="Team1", position="1B", eligible_positions=["1B"]),
@@ -206,4 +253,671 @@ def test_scrape_player_category(mock_sync_playwright, mock_page, mock_playwright
             assert mock_process_page.call_count == 2
             
             # Verify results - we should get all 5 players
-            assert len(players) == 5
\ No newline at end of file
+            assert len(players) == 5
+
+def test_parse_row_link():
+    """Test reading player IDs and URLs from row markup."""
+    from_href = parse_row_link({
+        "name": " Mike Trout ",
+        "player_id": None,
+        "hrefs": ["#", "/mlb/player/_/id/30836/mike-trout"],
+        "srcs": [],
+    })
+    assert from_href == PlayerLink(
+        name="Mike Trout",
+        player_id="30836",
+        url="https://www.espn.com/mlb/player/_/id/30836",
+    )
+
+    from_headshot = parse_row_link({
+        "name": "Aaron Judge",
+        "player_id": None,
+        "hrefs": ["#"],
+        "srcs": ["https://a.espncdn.com/combiner/i?img=/i/headshots/mlb/players/full/33192.png&w=96"],
+    })
+    assert from_headshot.player_id == "33192"
+
+    from_attribute = parse_row_link({"name": "Shohei Ohtani", "player_id": "39832"})
+    assert from_attribute.url == "https://www.espn.com/mlb/player/_/id/39832"
+
+    assert parse_row_link({"name": "Nobody", "player_id": None, "hrefs": ["#"], "srcs": []}) is None
+
+
+def test_invalid_navigation_mode():
+    """Test that unknown navigation modes are rejected."""
+    with pytest.raises(ValueError):
+        ESPNScraper(navigation="teleport")
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_process_current_page_direct(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that direct navigation visits row URLs without opening the modal."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_page.evaluate = fake_evaluate(rows=[
+        {"name": "Player One", "player_id": "1"},
+        {"name": "No Id", "player_id": None, "hrefs": [], "srcs": []},
+        {"name": "Player Two", "player_id": "2"},
+    ])
+    detail_page = mock_page.context.new_page.return_value
+    detail_page.url = "https://www.espn.com/mlb/player/_/id/2"
+    detail_page.evaluate = fake_evaluate(header=HEADER_RECORD)
+
+    with ESPNScraper(headless=True, navigation="direct") as scraper:
+        scraper.page = mock_page
+        scraper.context = mock_page.context
+
+        players = scraper._process_current_page()
+
+        assert len(players) == 2
+        mock_page.click.assert_not_called()
+        mock_page.context.expect_page.assert_not_called()
+        # The same player page is reused for every visit
+        mock_page.context.new_page.assert_called_once()
+        assert [c.args[0] for c in detail_page.goto.call_args_list] == [
+            "https://www.espn.com/mlb/player/_/id/1",
+            "https://www.espn.com/mlb/player/_/id/2",
+        ]
+
+
+class StandInResponse:
+    """Local stand-in for a Playwright response serving a saved payload."""
+
+    def __init__(self, url, fixture=None):
+        self.url = url
+        self.fixture = fixture
+
+    def json(self):
+        with open(FIXTURES / self.fixture) as f:
+            return json.load(f)
+
+
+API_URL = (
+    "https://lm-api-reads.fantasy.espn.com/apis/v3/games/flb/seasons/2025"
+    "/segments/0/leaguedefaults/3?view=kona_player_info"
+)
+
+
+def serve_network_fixtures(mock_page):
+    """Have the mock page serve the saved player list API responses to its handlers."""
+    handlers = []
+    mock_page.on = MagicMock(side_effect=lambda event, handler: handlers.append(handler))
+
+    def serve(*fixtures):
+        def respond(*args, **kwargs):
+            for handler in handlers:
+                handler(StandInResponse("https://fantasy.espn.com/static/app.js"))
+                for fixture in fixtures:
+                    handler(StandInResponse(API_URL, fixture))
+        return respond
+
+    # Loading the page serves the batters list (twice, as a refetch would),
+    # clicking the pitchers tab serves the pitchers list
+    mock_page.goto = MagicMock(side_effect=serve(
+        "kona_player_info_batters.json", "kona_player_info_batters.json"
+    ))
+    mock_page.click = MagicMock(side_effect=serve("kona_player_info_pitchers.json"))
+    next_button = MagicMock()
+    next_button.count.return_value = 0
+    mock_page.locator = MagicMock(return_value=next_button)
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scrape_players_network(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that network extraction builds players from captured responses."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_playwright.chromium.launch.return_value.new_context.return_value.new_page.return_value = mock_page
+    serve_network_fixtures(mock_page)
+
+    with ESPNScraper(headless=True, extraction="network") as scraper:
+        players = scraper.scrape_players(player_limit=10)
+
+    assert [player.name for player in players] == [
+        "Aaron Judge", "Mike Trout", "Shohei Ohtani", "Gerrit Cole", "Emmanuel Clase",
+    ]
+    assert [player.player_type for player in players] == ["batter"] * 3 + ["pitcher"] * 2
+    assert players[0].stats["HR"] == 49.0
+    # No player pages are opened in network mode
+    mock_page.context.expect_page.assert_not_called()
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scrape_pitchers_only_network(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that the batters list loaded with the page is not taken for pitchers."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_playwright.chromium.launch.return_value.new_context.return_value.new_page.return_value = mock_page
+    serve_network_fixtures(mock_page)
+
+    with ESPNScraper(headless=True, extraction="network") as scraper:
+        players = list(scraper.iter_players(player_limit=10, categories=["pitcher"]))
+
+    assert [(player.name, player.player_type) for player in players] == [
+        ("Gerrit Cole", "pitcher"), ("Emmanuel Clase", "pitcher"),
+    ]
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scrape_players_network_resume(mock_sync_playwright, mock_page, mock_playwright, tmp_path):
+    """Test that resuming after a finished batters category yields only new pitchers."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_playwright.chromium.launch.return_value.new_context.return_value.new_page.return_value = mock_page
+    serve_network_fixtures(mock_page)
+    journal_path = str(tmp_path / "run.journal")
+    journal = CheckpointJournal(journal_path)
+    journal.record_player("batter", 1, Player(
+        id="33192", name="Aaron Judge", team="NYY", position="RF", eligible_positions=["RF"],
+    ))
+    journal.record_page("batter", 1)
+    journal.record_category("batter")
+    journal.close()
+
+    resumed = CheckpointJournal(journal_path, resume=True)
+    with ESPNScraper(headless=True, extraction="network", journal=resumed) as scraper:
+        players = scraper.scrape_players(player_limit=10)
+    resumed.close()
+
+    assert [(player.name, player.player_type) for player in players] == [
+        ("Aaron Judge", "batter"), ("Gerrit Cole", "pitcher"), ("Emmanuel Clase", "pitcher"),
+    ]
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scraper_routes_through_resource_policy(mock_sync_playwright, mock_playwright):
+    """Test that a resource policy is installed on the browser context."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    policy = ResourcePolicy()
+
+    with ESPNScraper(headless=True, resource_policy=policy) as scraper:
+        scraper.context.route.assert_called_once_with("**/*", policy.handle_route)
+        scraper.context.on.assert_called_once_with("response", policy.record_response)
+
+
+def legacy_scrape_player_data(page):
+    """The per-field locator implementation the evaluate() path replaced."""
+    player_header = page.locator("div.PlayerHeader")
+    player_id = page.url.split("/")[-1]
+    name = player_header.locator("h1").inner_text()
+    team_element = player_header.locator('li:has-text("Team")')
+    team = (
+        team_element.inner_text().replace("Team", "").strip()
+        if team_element.count() > 0
+        else ""
+    )
+    position_element = player_header.locator('li:has-text("Position")')
+    position = (
+        position_element.inner_text().replace("Position", "").strip()
+        if position_element.count() > 0
+        else ""
+    )
+    eligible_positions = [pos.strip() for pos in position.split(",")]
+    primary_position = eligible_positions[0] if eligible_positions else ""
+    return Player(
+        id=player_id,
+        name=name,
+        team=team,
+        position=primary_position,
+        eligible_positions=eligible_positions,
+    )
+
+
+def header_page(url, title, items):
+    """Create a player page that serves the same header to both code paths."""
+    def matching(label):
+        return [item for item in items if label.lower() in item.lower()]
+
+    def locator(selector):
+        element = MagicMock()
+        if selector == "h1":
+            element.inner_text.return_value = title
+        elif selector.startswith("li:has-text"):
+            found = matching(selector.split('"')[1])
+            element.count.return_value = len(found)
+            element.inner_text.return_value = found[0] if found else ""
+        else:
+            element.locator.side_effect = locator
+        return element
+
+    def item(label):
+        found = matching(label)
+        return found[0] if found else None
+
+    page = MagicMock()
+    page.url = url
+    page.locator.side_effect = locator
+    page.evaluate = fake_evaluate(
+        header={"name": title, "team": item("Team"), "position": item("Position")}
+    )
+    return page
+
+
+@pytest.mark.parametrize("title, items", [
+    ("Mike Trout", ["TeamLos Angeles Angels", "PositionCF, OF", "Bats/ThrowsRight/Right"]),
+    ("Shohei Ohtani", ["TeamLos Angeles Dodgers", "PositionDH"]),
+    ("Free Agent", ["PositionRP"]),
+    ("Unknown", []),
+    ("Spacing", ["  Team  NYY ", "position  1B ,2B , 3B"]),
+])
+def test_scrape_player_data_matches_locator_path(title, items):
+    """Test that the single evaluate() call matches the old locator output."""
+    page = header_page("https://www.espn.com/mlb/player/_/id/30836", title, items)
+
+    player = ESPNScraper()._scrape_player_data(page)
+
+    assert player == legacy_scrape_player_data(page)
+    page.evaluate.assert_called_once_with(PLAYER_HEADER_SCRIPT)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.espn.com/mlb/player/_/id/33192",
+        "https://www.espn.com/mlb/player/_/id/33192/aaron-judge",
+        "https://www.espn.com/mlb/player/_/id/33192/",
+        "https://www.espn.com/mlb/player/_/id/33192?season=2025",
+    ],
+)
+def test_parse_player_header_id_matches_row_link(url):
+    """Test that the header ID is read as row links read it, so cache and journal keys match."""
+    record = {"name": "Aaron Judge", "team": "NYY", "position": "RF, DH"}
+    link = parse_row_link({"name": "Aaron Judge", "hrefs": [url]})
+
+    assert parse_player_header(record, url).id == link.player_id == "33192"
+
+
+def test_parse_player_header_without_header():
+    """Test that a page without a player header is reported as an error."""
+    with pytest.raises(ValueError):
+        parse_player_header(None, "https://www.espn.com/mlb/player/_/id/1")
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scrape_players_resume(mock_sync_playwright, mock_page, mock_playwright, tmp_path):
+    """Test resuming from a journal: finished categories are reused, the
+    interrupted category jumps to its page and journaled IDs are skipped."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_playwright.chromium.launch.return_value.new_context.return_value.new_page.return_value = mock_page
+
+    journal_path = str(tmp_path / "run.journal")
+    journal = CheckpointJournal(journal_path)
+    for player_id in ["1", "2"]:
+        journal.record_player("batter", 1, Player(id=player_id, name="", team="", position="", eligible_positions=[]))
+    journal.record_page("batter", 1)
+    journal.record_category("batter")
+    journal.record_player("pitcher", 1, Player(id="10", name="", team="", position="", eligible_positions=[]))
+    journal.record_page("pitcher", 1)
+    journal.record_player("pitcher", 2, Player(id="20", name="", team="", position="", eligible_positions=[]))
+    journal.close()
+
+    # Page 2 of the pitchers table: one journaled row, one new row
+    mock_page.evaluate = fake_evaluate(rows=[
+        {"name": "Done", "player_id": "20"},
+        {"name": "New", "player_id": "21"},
+    ])
+    next_button = MagicMock()
+    next_button.count.return_value = 1
+    next_button.is_enabled.side_effect = [True, False]
+    mock_page.locator = MagicMock(return_value=next_button)
+    detail_page = MagicMock()
+    detail_page.url = "https://www.espn.com/mlb/player/_/id/21"
+    detail_page.evaluate = fake_evaluate(header=HEADER_RECORD)
+
+    resumed = CheckpointJournal(journal_path, resume=True)
+    with ESPNScraper(headless=True, navigation="direct", journal=resumed) as scraper:
+        scraper.context.new_page.return_value = detail_page
+        players = scraper.scrape_players(player_limit=10)
+    resumed.close()
+
+    assert [(p.id, p.player_type) for p in players] == [
+        ("1", "batter"), ("2", "batter"),
+        ("10", "pitcher"), ("20", "pitcher"), ("21", "pitcher"),
+    ]
+    # Only the new player was visited; one click skipped to page 2
+    assert [c.args[0] for c in detail_page.goto.call_args_list] == [
+        "https://www.espn.com/mlb/player/_/id/21"
+    ]
+    assert next_button.click.call_count == 1
+    assert CheckpointJournal(journal_path, resume=True).is_category_done("pitcher")
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_process_current_page_uses_cache(mock_sync_playwright, mock_page, mock_playwright, tmp_path):
+    """Test that fresh cache entries skip the player page and misses fill the cache."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_page.evaluate = fake_evaluate(rows=[
+        {"name": "Cached", "player_id": "1"},
+        {"name": "Fresh", "player_id": "2"},
+    ])
+    detail_page = MagicMock()
+    detail_page.url = "https://www.espn.com/mlb/player/_/id/2"
+    detail_page.evaluate = fake_evaluate(header=HEADER_RECORD)
+
+    cache_path = str(tmp_path / "cache.json")
+    cache = PlayerCache(cache_path)
+    cache.put(Player(id="1", name="Cached", team="NYY", position="RF", eligible_positions=["RF"]))
+
+    with ESPNScraper(headless=True, navigation="direct", cache=cache) as scraper:
+        scraper.page = mock_page
+        scraper.context.new_page.return_value = detail_page
+
+        players = scraper._process_current_page()
+
+    assert [(p.id, p.name) for p in players] == [("1", "Cached"), ("2", "Player Name")]
+    assert [c.args[0] for c in detail_page.goto.call_args_list] == [
+        "https://www.espn.com/mlb/player/_/id/2"
+    ]
+    assert (cache.hits, cache.misses) == (1, 1)
+    # The cache is written when the scraper closes
+    assert PlayerCache(cache_path).get("2").name == "Player Name"
+
+
+@pytest.mark.parametrize("shard, expected", [
+    ((1, 2), [("1", 1), ("2", 2), ("5", 5)]),
+    ((2, 2), [("3", 3), ("4", 4)]),
+])
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scrape_player_category_shard(mock_sync_playwright, mock_page, mock_playwright, shard, expected):
+    """Test that a shard scrapes only its pages and ranks rows across the table."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    pages = [["1", "2"], ["3", "4"], ["5", "6"]]
+    current = {"page": 0}
+
+    def evaluate(script, *args):
+        if script == ROWS_SCRIPT:
+            return [{"name": f"Player {i}", "player_id": i} for i in pages[current["page"]]]
+        return ""
+
+    def next_page():
+        current["page"] += 1
+
+    mock_page.evaluate = MagicMock(side_effect=evaluate)
+    next_button = MagicMock()
+    next_button.count.return_value = 1
+    next_button.is_enabled.side_effect = lambda: current["page"] < len(pages) - 1
+    next_button.click.side_effect = next_page
+    mock_page.locator = MagicMock(return_value=next_button)
+
+    detail_page = MagicMock()
+    detail_page.goto.side_effect = lambda url: setattr(detail_page, "url", url)
+    detail_page.evaluate = fake_evaluate(header=HEADER_RECORD)
+
+    with ESPNScraper(headless=True, navigation="direct", shard=shard) as scraper:
+        scraper.page = mock_page
+        scraper.context.new_page.return_value = detail_page
+        players = scraper._scrape_player_category(player_limit=5)
+
+    assert [(p.id, p.rank) for p in players] == expected
+
+
+def test_invalid_shard():
+    """Test that shard indexes outside 1..N are rejected."""
+    with pytest.raises(ValueError):
+        ESPNScraper(shard=(3, 2))
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_iter_players_is_lazy(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that players are yielded while the scrape runs and stopping early stops scraping."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_playwright.chromium.launch.return_value.new_context.return_value.new_page.return_value = mock_page
+    mock_page.evaluate = fake_evaluate(rows=[
+        {"name": f"Player {i}", "player_id": str(i)} for i in range(1, 4)
+    ])
+    detail_page = MagicMock()
+    detail_page.goto.side_effect = lambda url: setattr(detail_page, "url", url)
+    detail_page.evaluate = fake_evaluate(header=HEADER_RECORD)
+
+    with ESPNScraper(headless=True, navigation="direct") as scraper:
+        scraper.context.new_page.return_value = detail_page
+        players = scraper.iter_players(player_limit=10)
+
+        first = next(players)
+        assert (first.id, first.player_type, first.rank) == ("1", "batter", 1)
+        assert detail_page.goto.call_count == 1
+        players.close()
+
+    assert detail_page.goto.call_count == 1
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_process_current_page_records_phases(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that a profiler gets one sample per player for per-player phases."""
+    from espn_player_getter.profiling import PhaseTimer
+
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_page.evaluate = fake_evaluate(rows=[
+        {"name": "Player One", "player_id": "1"},
+        {"name": "Player Two", "player_id": "2"},
+    ])
+    detail_page = MagicMock()
+    detail_page.url = "https://www.espn.com/mlb/player/_/id/2"
+    detail_page.evaluate = fake_evaluate(header=HEADER_RECORD)
+    timer = PhaseTimer()
+
+    with ESPNScraper(headless=True, navigation="direct", profiler=timer) as scraper:
+        scraper.page = mock_page
+        scraper.context.new_page.return_value = detail_page
+        scraper._process_current_page()
+
+    counts = {name: phase["count"] for name, phase in timer.stats().items()}
+    assert counts == {
+        "launch": 1, "rows": 1, "player": 2, "player_goto": 2, "wait_player": 2, "extract": 2,
+    }
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_process_current_page_modal_uses_page_pool(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that modal navigation visits Complete Stats on a reused pooled page."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_page.url = "https://fantasy.espn.com/baseball/players/projections"
+    detail_page = mock_page.context.new_page.return_value
+    detail_page.url = "https://www.espn.com/mlb/player/_/id/12345"
+    detail_page.evaluate = fake_evaluate(header=HEADER_RECORD)
+
+    with ESPNScraper(headless=True, max_page_uses=2) as scraper:
+        scraper.page = mock_page
+        scraper.context = mock_page.context
+
+        players = scraper._process_current_page()
+
+    assert len(players) == 5
+    mock_page.context.expect_page.assert_not_called()
+    mock_page.keyboard.press.assert_called_with("Escape")
+    detail_page.goto.assert_called_with("https://fantasy.espn.com/mlb/player/_/id/12345")
+    # Five visits at two per page: three pages opened, all closed by the end
+    assert mock_page.context.new_page.call_count == 3
+    assert detail_page.close.call_count == 3
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_process_current_page_modal_popup_fallback(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that a card without a link target falls back to its popup tab."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_page.get_attribute = MagicMock(return_value=None)
+
+    with ESPNScraper(headless=True) as scraper:
+        scraper.page = mock_page
+        scraper.context = mock_page.context
+
+        players = scraper._process_current_page()
+
+    assert len(players) == 5
+    assert mock_page.context.expect_page.call_count == 5
+    mock_page.context.new_page.assert_not_called()
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_process_current_page_direct_retries(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that a player page failing once is retried on a fresh page."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_page.evaluate = fake_evaluate(rows=[{"name": "Player One", "player_id": "1"}])
+    detail_page = mock_page.context.new_page.return_value
+    detail_page.url = "https://www.espn.com/mlb/player/_/id/1"
+    detail_page.evaluate = fake_evaluate(header=HEADER_RECORD)
+    detail_page.goto = MagicMock(side_effect=[TimeoutError("Timeout 30000ms exceeded"), None])
+    throttle = Throttle(backoff_base=0, delay_step=0)
+
+    with ESPNScraper(headless=True, navigation="direct", throttle=throttle) as scraper:
+        scraper.page = mock_page
+        scraper.context = mock_page.context
+
+        players = scraper._process_current_page()
+
+    assert [player.id for player in players] == ["1"]
+    assert throttle.timeouts == 1
+    assert throttle.retried == 1
+    assert throttle.failed == []
+    # The page that timed out was recycled
+    assert mock_page.context.new_page.call_count == 2
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_process_current_page_table(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that table extraction builds players from the rows without player pages."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    table_rows = [
+        {
+            "name": "Mike Trout",
+            "player_id": None,
+            "hrefs": ["/mlb/player/_/id/30836/mike-trout"],
+            "srcs": [],
+            "team": "LAA",
+            "positions": "CF, DH",
+            "columns": ["", "AB", "HR", "AVG"],
+            "values": ["2025 Projections", "480", "35", ".270"],
+        },
+        {"name": "No Id", "player_id": None, "hrefs": [], "srcs": []},
+    ]
+    mock_page.evaluate = MagicMock(
+        side_effect=lambda script: table_rows if script == TABLE_SCRIPT else []
+    )
+
+    with ESPNScraper(headless=True, extraction="table") as scraper:
+        scraper.page = mock_page
+        scraper._row_offset = 20
+
+        players = scraper._process_current_page()
+
+    assert players == [Player(
+        id="30836",
+        name="Mike Trout",
+        team="LAA",
+        position="CF",
+        eligible_positions=["CF", "DH"],
+        player_type="batter",
+        stats={"AB": 480.0, "HR": 35.0, "AVG": 0.27},
+        rank=21,
+    )]
+    mock_page.click.assert_not_called()
+    mock_page.context.expect_page.assert_not_called()
+    assert scraper.page_pool.created == 0
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scrape_player_category_recycles_context(mock_sync_playwright, mock_page, mock_playwright):
+    """Test that the context is replaced after N players and the table reopened at the next page."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_browser = mock_playwright.chromium.launch.return_value
+    mock_browser.new_context.return_value.new_page.return_value = mock_page
+    next_button = MagicMock()
+    next_button.count.return_value = 1
+    # The reopened table is paged forward from page 1: 1, 2 and 2 + 1 failed clicks
+    next_button.is_enabled.side_effect = [True, True, True, True, True, False]
+    pages = [
+        [Player(id=f"{page}{i}", name="", team="", position="", eligible_positions=[]) for i in range(2)]
+        for page in range(3)
+    ]
+    memory = MemoryMonitor(max_players=2, sampler=lambda: (50 * MB, 300 * MB))
+
+    with patch.object(ESPNScraper, '_iter_current_page', side_effect=pages):
+        with ESPNScraper(headless=True, memory=memory) as scraper:
+            mock_page.locator.return_value = next_button
+            players = scraper._scrape_player_category(player_limit=10, category="pitcher")
+
+    assert [p.id for p in players] == ["00", "01", "10", "11", "20", "21"]
+    # A recycle after every page; the last one finds no page 4
+    assert mock_browser.new_context.return_value.close.call_count == 3
+    assert memory.context_recycles == 3
+    assert memory.browser_relaunches == 0
+    assert mock_page.goto.call_count == 3
+    assert next_button.click.call_count == 5
+    mock_page.click.assert_called_with('label:has-text("Pitchers")')
+    assert "browser peak 300MB" in memory.summary()
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scrape_player_category_relaunches_browser_over_memory_limit(
+    mock_sync_playwright, mock_page, mock_playwright
+):
+    """Test that the browser is relaunched when a new context does not bring memory down."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_browser = mock_playwright.chromium.launch.return_value
+    mock_browser.new_context.return_value.new_page.return_value = mock_page
+    next_button = MagicMock()
+    next_button.count.return_value = 1
+    next_button.is_enabled.side_effect = [True, True, False]
+    pages = [
+        [Player(id=str(page), name="", team="", position="", eligible_positions=[])]
+        for page in range(2)
+    ]
+    memory = MemoryMonitor(max_rss_mb=200, sampler=lambda: (50 * MB, 300 * MB))
+
+    with patch.object(ESPNScraper, '_iter_current_page', side_effect=pages):
+        with ESPNScraper(headless=True, memory=memory) as scraper:
+            mock_page.locator.return_value = next_button
+            players = scraper._scrape_player_category(player_limit=10)
+
+    assert [p.id for p in players] == ["0", "1"]
+    assert memory.browser_relaunches == 2
+    assert mock_playwright.chromium.launch.call_count == 3
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scraper_records_har(mock_sync_playwright, mock_playwright, tmp_path):
+    """Test that recording opens the context with a HAR file and closes it on exit."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    mock_browser = mock_playwright.chromium.launch.return_value
+    har = str(tmp_path / "session.har")
+
+    with ESPNScraper(headless=True, record_har_path=har) as scraper:
+        mock_browser.new_context.assert_called_once_with(record_har_path=har)
+        scraper.context.route_from_har.assert_not_called()
+
+    # Closing the context is what writes the HAR file
+    mock_browser.new_context.return_value.close.assert_called_once()
+
+
+@patch('espn_player_getter.scraper.espn_scraper.sync_playwright')
+def test_scraper_replays_har_with_latency(mock_sync_playwright, mock_playwright):
+    """Test that replay routes from the HAR file, delaying each response."""
+    mock_sync_playwright.return_value.start.return_value = mock_playwright
+    policy = ResourcePolicy()
+
+    with ESPNScraper(
+        headless=True,
+        resource_policy=policy,
+        replay_har_path="session.har",
+        replay_latency_ms=25,
+    ) as scraper:
+        scraper.context.route_from_har.assert_called_once_with("session.har", not_found="abort")
+        # The resource policy is registered last, so it sees requests first
+        assert scraper.context.route.call_args_list == [
+            (("**/*", scraper._delay_replayed_route),),
+            (("**/*", policy.handle_route),),
+        ]
+        route = MagicMock()
+        scraper._delay_replayed_route(route)
+        scraper.page.wait_for_timeout.assert_called_once_with(25)
+        route.fallback.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"record_har_path": "a.har", "replay_har_path": "b.har"},
+        {"replay_har_path": "a.har", "replay_latency_ms": -1},
+        {"record_har_path": "a.har", "memory": MemoryMonitor(max_players=100)},
+    ],
+)
+def test_invalid_har_options(options):
+    """Test that conflicting record and replay options are rejected."""
+    with pytest.raises(ValueError):
+        ESPNScraper(**options)
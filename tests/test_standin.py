@@ -0,0 +1,113 @@
+import json
+import time
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from benchmarks.standin import API_PATH, API_QUERY, StandInConfig, StandInServer, StandInSite
+from espn_player_getter.scraper.espn_api import is_player_payload_url, parse_players_payload
+
+
+def fetch(url):
+    """GET a URL and return the decoded body."""
+    with urlopen(url, timeout=5) as response:
+        return response.read().decode()
+
+
+def chromium_available():
+    """Check whether Playwright can launch Chromium here."""
+    try:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as playwright:
+            playwright.chromium.launch().close()
+        return True
+    except Exception:
+        return False
+
+
+def test_standin_serves_table_pages():
+    """Test the player list API behind the projections table."""
+    config = StandInConfig(batter_pages=2, pitcher_pages=1, page_size=3)
+    with StandInServer(config) as server:
+        html = fetch(server.projections_url)
+        url = f"{server.base_url}{API_PATH}?{API_QUERY}"
+        page_2 = json.loads(fetch(f"{url}&category=batter&page=2"))
+        pitchers = json.loads(fetch(f"{url}&category=pitcher&page=1"))
+
+    assert 'class="players-table' in html
+    assert "Pagination__Button--next" in html
+    assert '{"batter": 2, "pitcher": 1}' in html
+    assert is_player_payload_url(url)
+    assert [p.name for p in parse_players_payload(page_2)] == ["Batter 4", "Batter 5", "Batter 6"]
+    assert {p.player_type for p in parse_players_payload(pitchers)} == {"pitcher"}
+
+
+def test_standin_table_rows_match_players():
+    """Test that the displayed row cells parse back into the site's players."""
+    from espn_player_getter.scraper.espn_scraper import parse_table_row
+
+    site = StandInSite(StandInConfig(page_size=4))
+    for category in ("batter", "pitcher"):
+        page = site.table_page(category, 1)
+        for entry, row in zip(page["players"], page["rows"]):
+            record = {"name": entry["player"]["fullName"], "player_id": str(entry["id"]), **row}
+            player = parse_table_row(record, category)
+            expected = site.players[str(entry["id"])]
+            assert (player.team, player.eligible_positions, player.stats) == (
+                expected.team, expected.eligible_positions, expected.stats,
+            )
+
+
+def test_standin_serves_player_pages():
+    """Test that player pages carry the header the scraper reads."""
+    with StandInServer(StandInConfig(page_size=2)) as server:
+        player = server.site.expected_players("batter")[1]
+        html = fetch(server.player_url.format(player_id=player.id))
+        with pytest.raises(HTTPError):
+            fetch(server.player_url.format(player_id="1"))
+
+    assert '<div class="PlayerHeader">' in html
+    assert f"<h1>{player.name}</h1>" in html
+    assert f"<span>Team</span><span>{player.team}</span>" in html
+    assert f"<span>Position</span><span>{', '.join(player.eligible_positions)}</span>" in html
+
+
+def test_standin_latency():
+    """Test the configurable response and player page delays."""
+    config = StandInConfig(page_size=1, latency_ms=20, player_latency_ms=80)
+    with StandInServer(config) as server:
+        start = time.perf_counter()
+        fetch(server.projections_url)
+        table = time.perf_counter() - start
+        start = time.perf_counter()
+        fetch(server.player_url.format(player_id=server.site.expected_players("batter")[0].id))
+        player = time.perf_counter() - start
+
+    assert 0.02 <= table < player
+    assert player >= 0.1
+
+
+@pytest.mark.skipif(not chromium_available(), reason="Chromium is not installed for Playwright")
+@pytest.mark.parametrize("options", [
+    {"navigation": "modal"},
+    {"navigation": "direct"},
+    {"extraction": "network"},
+    {"extraction": "table"},
+])
+def test_scraper_against_standin(options):
+    """Test a full scrape of the stand-in matches its players."""
+    from espn_player_getter.scraper.espn_scraper import ESPNScraper
+
+    config = StandInConfig(batter_pages=2, pitcher_pages=1, page_size=3)
+    with StandInServer(config) as server:
+        with ESPNScraper(
+            projections_url=server.projections_url, player_url=server.player_url, **options
+        ) as scraper:
+            players = scraper.scrape_players(player_limit=5)
+        expected = server.site.expected_players("batter", 5) + server.site.expected_players("pitcher", 5)
+
+    assert [(p.id, p.team, p.position) for p in players] == [
+        (p.id, p.team, p.position) for p in expected
+    ]
@@ -0,0 +1,115 @@
+import sqlite3
+
+import pytest
+
+from espn_player_getter.data_handler import load_players, save_players
+from espn_player_getter.models.player import Player
+from espn_player_getter.store import PlayerStore
+
+
+@pytest.fixture
+def sample_players():
+    """Create sample players, including a two-way player."""
+    return [
+        Player(
+            id="39832", name="Shohei Ohtani", team="LAD", position="DH",
+            eligible_positions=["DH"], player_type="batter", stats={"HR": 47.0}, rank=2,
+        ),
+        Player(
+            id="33192", name="Aaron Judge", team="NYY", position="RF",
+            eligible_positions=["RF", "OF", "DH"], player_type="batter", rank=1,
+        ),
+        Player(
+            id="39832", name="Shohei Ohtani", team="LAD", position="SP",
+            eligible_positions=["SP", "P"], player_type="pitcher", rank=1,
+        ),
+    ]
+
+
+def test_upsert_and_get(sample_players, tmp_path):
+    """Test storing players and looking them up by ID."""
+    with PlayerStore(str(tmp_path / "players.db")) as store:
+        assert store.upsert(sample_players) == 3
+
+        assert len(store) == 3
+        assert [p.player_type for p in store.get("39832")] == ["batter", "pitcher"]
+        (judge,) = store.get("33192", "batter")
+        assert judge.to_dict() == sample_players[1].to_dict()
+        assert store.get("missing") == []
+
+
+def test_upsert_replaces_existing_players(sample_players, tmp_path):
+    """Test that a second upsert updates rows and eligible positions."""
+    with PlayerStore(str(tmp_path / "players.db")) as store:
+        store.upsert(sample_players)
+        traded = Player(
+            id="33192", name="Aaron Judge", team="BOS", position="RF",
+            eligible_positions=["RF"], player_type="batter", rank=1,
+        )
+        store.upsert([traded])
+
+        assert len(store) == 3
+        assert store.get("33192")[0].team == "BOS"
+        assert [p.id for p in store.by_position("OF")] == []
+        assert [p.id for p in store.by_team("NYY")] == []
+
+
+def test_upsert_repeated_player_keeps_last_copy(sample_players, tmp_path):
+    """Test that a batch holding a player twice stores it once."""
+    traded = Player(
+        id="33192", name="Aaron Judge", team="BOS", position="RF",
+        eligible_positions=["RF", "OF"], player_type="batter", rank=1,
+    )
+    with PlayerStore(str(tmp_path / "players.db")) as store:
+        assert store.upsert(sample_players + [traded]) == 3
+
+        assert len(store) == 3
+        assert store.get("33192")[0].to_dict() == traded.to_dict()
+
+
+def test_queries_by_team_and_position(sample_players, tmp_path):
+    """Test the team and eligible position lookups."""
+    with PlayerStore(str(tmp_path / "players.db")) as store:
+        store.upsert(sample_players)
+
+        assert [(p.id, p.player_type) for p in store.by_team("LAD")] == [
+            ("39832", "batter"), ("39832", "pitcher"),
+        ]
+        assert [p.id for p in store.by_team("LAD", "pitcher")] == ["39832"]
+        # Players are ordered by table rank within each category
+        assert [p.id for p in store.by_position("DH")] == ["33192", "39832"]
+        assert [p.player_type for p in store.by_position("SP")] == ["pitcher"]
+
+
+def test_store_uses_wal_and_indexes(tmp_path):
+    """Test the journal mode and that lookups use the indexes."""
+    path = str(tmp_path / "players.db")
+    PlayerStore(path).close()
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = " ".join(
+        row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM players WHERE team = ?", ("NYY",)
+        )
+    )
+    assert "idx_players_team" in plan
+    conn.close()
+
+
+def test_save_and_load_players_sqlite(sample_players, tmp_path):
+    """Test that .db paths go through the store."""
+    path = str(tmp_path / "players.db")
+    save_players(iter(sample_players), path)
+
+    assert [(p.player_type, p.id) for p in load_players(path)] == [
+        ("batter", "33192"), ("batter", "39832"), ("pitcher", "39832"),
+    ]
+
+
+def test_save_players_sqlite_repeated_player(sample_players, tmp_path):
+    """Test that saving a player list with a repeated player to .db does not fail."""
+    path = str(tmp_path / "players.db")
+    save_players(sample_players + [sample_players[0]], path)
+
+    assert len(load_players(path)) == 3
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from benchmarks.standin import StandInConfig, StandInServer
+from espn_player_getter import PlayerStream, scrape_players, stream_players
+from espn_player_getter.models.player import Player
+
+
+def make_player(i):
+    return Player(
+        id=str(i), name=f"Player {i}", team="NYY", position="OF",
+        eligible_positions=["OF"], player_type="batter", rank=i + 1,
+    )
+
+
+def make_factory(count=20, error=None):
+    """Factory of mock scrapers yielding ``count`` players, recording how many were made."""
+    produced = []
+
+    def iter_players(player_limit, categories=None):
+        for i in range(min(count, player_limit)):
+            produced.append(i)
+            yield make_player(i)
+        if error:
+            raise error
+
+    scraper = MagicMock()
+    scraper.__enter__.return_value = scraper
+    scraper.iter_players.side_effect = iter_players
+    return MagicMock(return_value=scraper), scraper, produced
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_player_stream_yields_players_in_order():
+    """Test that every player arrives in scrape order and the scraper is closed."""
+    factory, scraper, _ = make_factory(count=20)
+
+    with PlayerStream(player_limit=15, scraper_factory=factory, buffer_size=4) as stream:
+        players = list(stream)
+
+    assert [p.id for p in players] == [str(i) for i in range(15)]
+    assert stream.count == 15
+    assert stream.max_buffered <= 4
+    scraper.__exit__.assert_called_once()
+
+
+def test_player_stream_backpressure():
+    """Test that a consumer that stops reading holds the scraper back."""
+    factory, _, produced = make_factory(count=100)
+    stream = PlayerStream(scraper_factory=factory, buffer_size=5)
+    players = iter(stream)
+
+    next(players)
+    # One consumed, five buffered and one waiting for room in the buffer
+    wait_for(lambda: len(produced) == 7)
+    time.sleep(0.05)
+    assert len(produced) == 7
+
+    next(players)
+    wait_for(lambda: len(produced) == 8)
+    stream.close()
+
+
+def test_player_stream_close_stops_scrape():
+    """Test that breaking out of the loop stops the scraper thread and closes the scraper."""
+    factory, scraper, produced = make_factory(count=1000)
+
+    with PlayerStream(scraper_factory=factory, buffer_size=2) as stream:
+        for player in stream:
+            if player.id == "3":
+                break
+
+    scraper.__exit__.assert_called_once()
+    assert len(produced) < 10
+    assert not any(thread.name == "player-stream" for thread in threading.enumerate())
+
+
+def test_player_stream_reraises_scraper_errors():
+    """Test that players before an error are delivered, then the error is raised."""
+    factory, _, _ = make_factory(count=3, error=RuntimeError("browser crashed"))
+    received = []
+
+    with pytest.raises(RuntimeError, match="browser crashed"):
+        for player in PlayerStream(scraper_factory=factory):
+            received.append(player.id)
+
+    assert received == ["0", "1", "2"]
+
+
+def test_player_stream_async_iteration():
+    """Test that an asyncio consumer can read the stream."""
+    factory, _, _ = make_factory(count=6)
+
+    async def consume():
+        ids = []
+        async for player in PlayerStream(scraper_factory=factory, buffer_size=2):
+            ids.append(player.id)
+            await asyncio.sleep(0)
+        return ids
+
+    assert asyncio.run(consume()) == [str(i) for i in range(6)]
+
+
+@patch('espn_player_getter.scraper.espn_scraper.ESPNScraper')
+def test_stream_players_and_callback(mock_scraper_class):
+    """Test the generator and callback APIs with options passed to the scraper."""
+    factory, scraper, _ = make_factory(count=4)
+    mock_scraper_class.return_value = scraper
+
+    assert [p.id for p in stream_players(player_limit=2, extraction="table")] == ["0", "1"]
+    mock_scraper_class.assert_called_with(extraction="table")
+    scraper.iter_players.assert_called_with(player_limit=2, categories=None)
+
+    received = []
+    assert scrape_players(received.append, categories=["batter"]) == 4
+    assert len(received) == 4
+    scraper.iter_players.assert_called_with(player_limit=500, categories=["batter"])
+
+
+def test_player_stream_http_backend():
+    """Test streaming from the stand-in's player list API without a browser."""
+    config = StandInConfig(batter_pages=2, pitcher_pages=1, page_size=5)
+    with StandInServer(config) as server:
+        with PlayerStream(backend="http", api_url=server.api_url, page_size=5, buffer_size=3) as stream:
+            players = list(stream)
+        expected = server.site.expected_players("batter") + server.site.expected_players("pitcher")
+
+    assert [p.id for p in players] == [p.id for p in expected]
+
+
+def test_player_stream_rejects_bad_buffer():
+    """Test that the buffer must hold at least one player."""
+    with pytest.raises(ValueError):
+        PlayerStream(buffer_size=0)
@@ -0,0 +1,166 @@
+import asyncio
+import random
+
+import pytest
+
+from espn_player_getter.scraper.throttle import CLOSED, HALF_OPEN, OPEN, Throttle
+
+
+class FakeClock:
+    """Clock whose sleeps only move time forward."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_throttle(**kwargs):
+    clock = FakeClock()
+    throttle = Throttle(sleep=clock.sleep, clock=clock, rng=random.Random(0), **kwargs)
+    return throttle, clock
+
+
+def test_throttle_aimd_pacing():
+    """Test that failures double the delay and halve concurrency, successes recover."""
+    throttle, _ = make_throttle(max_concurrency=8, delay_step=0.5, max_delay=4)
+
+    throttle.record_failure(RuntimeError("503"))
+    assert throttle.delay == 0.5
+    assert throttle.limit == 4
+    throttle.record_failure(TimeoutError())
+    throttle.record_failure(RuntimeError("503"))
+    throttle.record_failure(RuntimeError("503"))
+    assert throttle.delay == 4
+    assert throttle.limit == 1
+    assert throttle.timeouts == 1
+    assert throttle.error_rate == 1.0
+    assert throttle.timeout_rate == 0.25
+
+    for _ in range(3):
+        throttle.record_success()
+    assert throttle.delay == 2.5
+    # One more concurrent request per round of `limit` successes
+    assert throttle.limit == 3
+
+
+def test_throttle_pacing_follows_recent_rates():
+    """Test that frequent timeouts back off harder and frequent errors hold the delay."""
+    throttle, _ = make_throttle(delay_step=0.5, max_delay=1000)
+    for _ in range(8):
+        throttle.record_success()
+    throttle.record_failure(TimeoutError())
+    assert throttle.delay == 0.5
+    throttle.record_failure(TimeoutError())
+    # 2 of the last 10 requests timed out
+    assert throttle.delay == 2.0
+
+    for _ in range(10):
+        throttle.record_failure(RuntimeError("503"))
+    delay = throttle.delay
+    throttle.record_success()
+    # 12 of the last 21 requests failed
+    assert throttle.delay == delay
+    assert "recent error rate 57% (timeouts 10%)" in throttle.summary()
+
+
+def test_throttle_paces_request_starts():
+    """Test that requests start at least the current delay apart."""
+    throttle, clock = make_throttle(min_delay=1.0)
+
+    throttle.wait()
+    throttle.wait()
+    throttle.wait()
+
+    assert clock.sleeps == [1.0, 1.0]
+
+
+def test_throttle_retries_with_backoff():
+    """Test that a failing call is retried with jittered exponential backoff."""
+    throttle, clock = make_throttle(retries=2, backoff_base=1.0, delay_step=0)
+    outcomes = iter([RuntimeError("reset"), RuntimeError("reset"), "ok"])
+
+    def flaky():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert throttle.call(flaky, "Mike Trout") == "ok"
+    assert throttle.retried == 2
+    assert len(clock.sleeps) == 2
+    assert 0 <= clock.sleeps[0] <= 1.0
+    assert 0 <= clock.sleeps[1] <= 2.0
+    assert throttle.failed == []
+
+
+def test_throttle_reports_permanent_failures():
+    """Test that a player failing every attempt is listed for re-queueing."""
+    throttle, _ = make_throttle(retries=1)
+
+    def broken():
+        raise RuntimeError("404")
+
+    with pytest.raises(RuntimeError):
+        throttle.call(broken, "Aaron Judge", "https://example.test/id/1", "batter")
+
+    assert len(throttle.failed) == 1
+    failure = throttle.failed[0]
+    assert (failure.name, failure.url, failure.category, failure.attempts) == (
+        "Aaron Judge", "https://example.test/id/1", "batter", 2,
+    )
+    summary = throttle.summary()
+    assert "2 requests, 2 errors" in summary
+    assert "1 players failed permanently" in summary
+    assert "Aaron Judge (https://example.test/id/1): 404" in summary
+
+
+def test_throttle_circuit_breaker():
+    """Test that sustained failures open the breaker until a probe succeeds."""
+    throttle, clock = make_throttle(breaker_threshold=3, breaker_cooldown=60, delay_step=0)
+
+    for _ in range(3):
+        throttle.record_failure(RuntimeError("429"))
+    assert throttle.state == OPEN
+    assert throttle.trips == 1
+
+    throttle.wait()
+    assert clock.now == 60
+    assert throttle.state == HALF_OPEN
+
+    # A failed probe reopens the breaker straight away
+    throttle.record_failure(RuntimeError("429"))
+    assert throttle.state == OPEN
+    throttle.wait()
+    assert clock.now == 120
+
+    throttle.record_success()
+    assert throttle.state == CLOSED
+    assert throttle.trips == 2
+
+
+def test_throttle_limits_async_concurrency():
+    """Test that async calls never exceed the current concurrency limit."""
+    throttle = Throttle(max_concurrency=4, delay_step=0)
+    throttle.limit = 2
+    active, peak = [0], [0]
+
+    async def request():
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.001)
+        active[0] -= 1
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(*(throttle.call_async(request, "p") for _ in range(8)))
+
+    assert asyncio.run(run()) == ["ok"] * 8
+    assert peak[0] <= 3
+    assert throttle.limit == 4
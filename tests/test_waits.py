@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from espn_player_getter.scraper.waits import (
+    PLAYER_HEADER_SELECTOR,
+    ROWS_CHANGED_SCRIPT,
+    ROWS_SELECTOR,
+    WaitPlan,
+    parse_wait_option,
+)
+
+
+def test_parse_wait_option():
+    """Test parsing STEP=STRATEGY values."""
+    assert parse_wait_option("pagination=rows") == ("pagination", "rows")
+    assert parse_wait_option(" player = networkidle ") == ("player", "networkidle")
+    with pytest.raises(ValueError):
+        parse_wait_option("player")
+    with pytest.raises(ValueError):
+        parse_wait_option("player=rows")
+    # The old rows stay visible until the new page replaces them
+    for strategy in ("selector", "domcontentloaded"):
+        with pytest.raises(ValueError):
+            parse_wait_option(f"pagination={strategy}")
+
+
+def test_default_strategies():
+    """Test that the defaults use targeted conditions instead of networkidle."""
+    page = MagicMock()
+    plan = WaitPlan()
+
+    plan.wait(page, "navigation")
+    page.wait_for_selector.assert_called_with(ROWS_SELECTOR, state="visible", timeout=10_000)
+
+    plan.wait(page, "player")
+    page.wait_for_selector.assert_called_with(
+        PLAYER_HEADER_SELECTOR, state="visible", timeout=10_000
+    )
+
+    page.evaluate.return_value = "50:Aaron Judge"
+    before = plan.snapshot(page, "pagination")
+    plan.wait(page, "pagination", before)
+    page.wait_for_function.assert_called_once_with(
+        ROWS_CHANGED_SCRIPT, arg="50:Aaron Judge", timeout=10_000
+    )
+    page.wait_for_load_state.assert_not_called()
+
+
+def test_overridden_strategies():
+    """Test picking a strategy per step."""
+    page = MagicMock()
+    plan = WaitPlan({"player": "domcontentloaded", "pagination": "networkidle"}, timeout_ms=500)
+
+    assert plan.snapshot(page, "pagination") is None
+    plan.wait(page, "pagination")
+    page.wait_for_load_state.assert_called_once_with("networkidle")
+
+    plan.wait(page, "player")
+    page.wait_for_load_state.assert_called_with("domcontentloaded", timeout=500)
+
+
+def test_timeout_falls_back_to_networkidle():
+    """Test that a targeted wait that times out falls back to networkidle."""
+    page = MagicMock()
+    page.wait_for_selector.side_effect = PlaywrightTimeoutError("timeout")
+    plan = WaitPlan()
+
+    plan.wait(page, "player")
+
+    page.wait_for_load_state.assert_called_once_with("networkidle")
+    assert plan.fallbacks == 1
+
+
+def test_wait_async():
+    """Test the async waits and their fallback."""
+    page = AsyncMock()
+    page.evaluate.return_value = "50:Aaron Judge"
+    page.wait_for_function.side_effect = PlaywrightTimeoutError("timeout")
+    plan = WaitPlan()
+
+    async def run():
+        before = await plan.snapshot_async(page, "pagination")
+        await plan.wait_async(page, "pagination", before)
+
+    asyncio.run(run())
+
+    page.wait_for_function.assert_awaited_once()
+    page.wait_for_load_state.assert_awaited_once_with("networkidle")
+    assert plan.fallbacks == 1